@@ -2,20 +2,18 @@
 import streamlit as st
 from ui.sidebar import show_sidebar
 from ui.home import show_home
-from features.vocab_upload import show_vocab_upload
-from features.vocab_quiz import show_quiz_page
-from features.word_order import show_word_order_page
-from features.writing import show_writing_page 
-from features.dictionary import show_dictionary_page
-from features.dashboard import show_dashboard_page
-# 임시호출 #
-from services.google_sheets import save_score, get_db_connection
+# [변경] 기능 페이지는 해당 메뉴를 처음 열 때 import (홈 화면 cold start에서 openai/gspread/plotly/pyarrow 제외)
+#        -> 아래 메뉴 분기 안의 import 참고 / 측정: python -m benchmarks.bench_import_time
+from services.score_queue import start_worker as start_score_worker
 import random 
 from datetime import datetime, timedelta
 
 # 페이지 설정
 st.set_page_config(page_title="voca海", page_icon="🐋", layout="wide")
 
+# 점수 전송 워커 시작 (지난 실행에서 전송 못 한 점수도 이어서 전송, 이미 돌고 있으면 무시)
+start_score_worker()
+
 # [수정] 글자 크기 최적화 (PC는 시원하게, 모바일은 안 잘리게)
 st.markdown("""
 <style>
@@ -48,6 +46,8 @@ if menu == "홈":
     show_home()              
 
 elif menu == "단어시험":
+    from features.vocab_upload import show_vocab_upload
+    from features.vocab_quiz import show_quiz_page
     st.header("단어시험")
     
     # 1. 퀴즈 상태 초기화
@@ -58,23 +58,27 @@ elif menu == "단어시험":
     if st.session_state['quiz_status'] == 'playing':
         show_quiz_page()
     else:
-        # [중요] show_vocab_upload 내부에서 이미 session_state['final_vocab_df']를 
+        # [중요] show_vocab_upload 내부에서 이미 단어장 저장소(session_state['vocab_store'])를 
         # 체크하고 있으므로, 홈에 갔다 와도 파일만 다시 안 올리면 목록유지
         show_vocab_upload()
 
 elif menu == "어순 연습":
+    from features.word_order import show_word_order_page
     st.header("어순 연습")
     # show_word_order_page() 함수 실행
     show_word_order_page()
 
 elif menu == "작문":
+    from features.writing import show_writing_page
     st.header("작문")
     show_writing_page()
 
 elif menu == "단어사전":
+    from features.dictionary import show_dictionary_page
     st.header("단어사전")
     show_dictionary_page()
 else:
+    from features.dashboard import show_dashboard_page
     st.header("대시보드")
     show_dashboard_page()
      
@@ -86,10 +90,10 @@ if st.sidebar.button("🧪 테스트 데이터 20개 생성 (개발용)"):
     if not nickname:
         st.error("별명을 먼저 입력하세요.")
     else:
+        from services.google_sheets import get_worksheet
         types = ["단어시험(주관식)", "작문-99번", "작문-100번", "어순배열"]
-        client = get_db_connection() # services.google_sheets에 있는 함수 필요
-        if client:
-            sheet = client.open("voca_db").sheet1
+        sheet = get_worksheet() # 공유 연결의 워크시트 핸들 재사용
+        if sheet:
             rows = []
             for _ in range(20):
                 # 랜덤 날짜 (최근 7일)
@@ -0,0 +1,4 @@
+# 경로: benchmarks/__init__.py
+# [설명] 핫패스(파싱/채점 등) 성능 측정 스크립트 모음
+# 실행 예: python -m benchmarks.bench_pdf_loader
+# 전체 회귀 검사: python -m benchmarks.run_suite (합성 데이터는 benchmarks/corpora.py)
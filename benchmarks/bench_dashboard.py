@@ -0,0 +1,73 @@
+# 경로: benchmarks/bench_dashboard.py
+# [설명] 대시보드 집계 벤치마크
+# - 예전 방식: 시트 전체(문자열) DataFrame -> 별명 필터 -> 날짜/점수 형변환 -> 정렬 -> groupby
+# - 새 방식  : 월별 파티션 Parquet 저장소에서 별명 조건 pushdown 조회 -> Arrow 벡터 집계
+# 실행 예: python -m benchmarks.bench_dashboard --rows 300000
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.corpora import make_score_rows
+
+
+def legacy_dashboard(all_rows, nickname):
+    df = pd.DataFrame(all_rows, columns=["날짜", "별명", "시험유형", "점수"])
+    df = df[df["별명"] == nickname].copy()
+    df["날짜"] = pd.to_datetime(df["날짜"])
+    df["점수"] = pd.to_numeric(df["점수"])
+    df = df.sort_values(by="날짜")
+    return len(df), df["점수"].mean(), df.iloc[-1]["시험유형"], df.groupby("시험유형")["점수"].mean().reset_index()
+
+
+def store_dashboard(nickname):
+    from services import score_store
+    table = score_store.load_history(nickname)
+    summary = score_store.summarize(table)
+    return summary["total"], summary["avg_score"], summary["last_exam"], summary["by_type"]
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 집계 벤치마크")
+    parser.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_score_rows(args.rows)
+    nickname = rows[-1][1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["VOCA_CACHE_DIR"] = tmp
+        from services import score_store
+
+        t0 = time.perf_counter()
+        score_store.rebuild_store(rows)
+        t_build = time.perf_counter() - t0
+
+        t_legacy, legacy = _time(lambda: legacy_dashboard(rows, nickname), args.repeat)
+        t_store, store = _time(lambda: store_dashboard(nickname), args.repeat)
+
+    assert legacy[0] == store[0] and abs(legacy[1] - store[1]) < 1e-9, "집계 결과가 다릅니다!"
+
+    print(f"기록 수           : {args.rows:,}행 (별명 '{nickname}' {store[0]:,}행)")
+    print(f"저장소 구축(1회)  : {t_build * 1000:8.1f} ms")
+    print(f"예전 방식(pandas) : {t_legacy * 1000:8.1f} ms / 렌더")
+    print(f"컬럼형 저장소     : {t_store * 1000:8.1f} ms / 렌더")
+    print(f"속도 향상         : x{t_legacy / t_store:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# 경로: benchmarks/bench_downsample.py
+# [설명] 점수 추이 그래프 다운샘플링 벤치마크
+# - 예전 방식: 모든 기록을 마커까지 그대로 px.line에 넣음
+# - 새 방식  : 시험유형별 LTTB(core/downsample.py) + 큰 시리즈는 WebGL
+# 그래프 JSON 크기(브라우저로 보내는 양)와 그래프 생성 시간을 비교합니다.
+# 실행 예: python -m benchmarks.bench_downsample --rows 20000
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from benchmarks.corpora import EXAM_TYPES
+from core.downsample import MAX_POINTS_PER_SERIES, downsample_by_group, lttb_indices
+
+
+def make_history_df(n_rows, seed=13):
+    """한 사용자의 시간순 기록(날짜/시험유형/점수) DataFrame을 만듭니다."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2022-01-01", periods=n_rows, freq="37min")
+    scores = np.clip(60 + np.cumsum(rng.normal(0, 1.5, n_rows)) * 0.1 + rng.normal(0, 8, n_rows), 0, 100)
+    return pd.DataFrame({
+        "날짜": dates,
+        "시험유형": rng.choice(EXAM_TYPES, n_rows),
+        "점수": scores.round(1),
+    })
+
+
+def _figure_bytes(fig):
+    return len(fig.to_json())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="점수 추이 그래프 다운샘플링 벤치마크")
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    df = make_history_df(args.rows)
+
+    t0 = time.perf_counter()
+    fig_raw = px.line(df, x="날짜", y="점수", color="시험유형", markers=True)
+    raw_bytes = _figure_bytes(fig_raw)
+    t_raw = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    chart_df, n_points = downsample_by_group(df, "날짜", "점수", "시험유형")
+    fig_ds = px.line(chart_df, x="날짜", y="점수", color="시험유형", render_mode="webgl")
+    ds_bytes = _figure_bytes(fig_ds)
+    t_ds = time.perf_counter() - t0
+
+    # 검증: 유형별 점 개수 상한, 첫/끝 점과 최고/최저점 일부 보존
+    for exam, part in chart_df.groupby("시험유형"):
+        full = df[df["시험유형"] == exam]
+        assert len(part) <= MAX_POINTS_PER_SERIES, "유형별 점 개수 상한을 넘었습니다!"
+        assert part["날짜"].iloc[0] == full["날짜"].iloc[0] and part["날짜"].iloc[-1] == full["날짜"].iloc[-1], "첫/끝 점이 빠졌습니다!"
+        assert part["날짜"].is_monotonic_increasing, "시간 순서가 깨졌습니다!"
+    assert len(lttb_indices(np.arange(10), np.arange(10), 400)) == 10
+
+    print(f"기록 수            : {n_points:,}행 -> 표시 {len(chart_df):,}개")
+    print(f"예전 그래프 JSON   : {raw_bytes / 1024:10.1f} KB ({t_raw * 1000:.1f} ms)")
+    print(f"다운샘플 그래프    : {ds_bytes / 1024:10.1f} KB ({t_ds * 1000:.1f} ms)")
+    print(f"전송량 감소        : x{raw_bytes / ds_bytes:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# 경로: benchmarks/bench_grading.py
+# [설명] 주관식 단어 시험 채점 벤치마크 (5,000문제 합성 시험)
+# - 예전 방식: 결과 화면이 그려질 때마다 문제마다 정답을 re.split으로 다시 쪼개서 비교
+# - 새 방식  : 시험을 만들 때 정답 후보를 한 번 정규화(prepare_question) -> grade_submission으로 한 번에 채점
+# 예전 방식이 정답으로 인정한 답은 새 방식도 모두 정답이어야 합니다. (확인 후 측정)
+# 조사 접기 회귀 사례(한 글자 정답 등)도 측정 전에 먼저 확인합니다.
+# 실행 예: python -m benchmarks.bench_grading --questions 5000 --reruns 5
+
+import argparse
+import random
+import re
+import time
+import unicodedata
+
+from core.dict_index import load_tsv
+from core.grading import QUIZ_KO_TO_ZH, QUIZ_ZH_TO_KO, build_answer_set, grade_submission, is_correct_answer, prepare_question, summarize_grades
+from services.offline_dict import seed_files
+
+_NOISE = ["!", ".", " ", "을", "를", "　"]
+
+# 조사 접기 회귀 사례: (정답, 답, 정답 여부)
+PARTICLE_CASES = [
+    # 한 글자 정답: 한 글자 조사를 붙인 형태는 다른 단어이거나 말이 안 됨
+    ("사", "사과", False),
+    ("가", "가을", False),
+    ("수", "수도", False),
+    ("눈", "눈이", False),
+    ("차", "차가", False),
+    ("눈", "눈", True),
+    ("눈", "눈으로", True),
+    ("집", "집에서", True),
+    # 받침과 맞지 않는 조사는 접지 않음
+    ("사과", "사과를", True),
+    ("사과", "사과을", False),
+    ("학교", "학교가", True),
+    ("학교", "학교이", False),
+    ("사람", "사람은", True),
+    ("사람", "사람는", False),
+    ("아이", "아이가", True),
+    ("친구", "친구와", True),
+    ("친구", "친구과", False),
+    ("넓다", "넓다!", True),
+]
+
+
+def check_particle_folding():
+    """조사 접기 회귀 사례 확인 (틀리면 AssertionError)"""
+    for correct, user_ans, expected in PARTICLE_CASES:
+        got = is_correct_answer(user_ans, build_answer_set(correct))
+        assert got == expected, f"정답 {correct!r}, 답 {user_ans!r}: {got} (기대 {expected})"
+
+
+def legacy_check_answer(user_input, correct_answer):
+    """예전 features/vocab_quiz.py check_answer (비교 기준)"""
+    user = str(user_input).strip()
+    if not user:
+        return False
+    candidates = re.split(r'[,/ ]+', str(correct_answer))
+    candidates = [c.strip() for c in candidates if c.strip()]
+    return user in candidates
+
+
+def make_quiz(n_questions, seed=21):
+    """기본 사전 단어로 만든 합성 시험 (답: 정답 그대로 / 잡음 섞인 정답 / 자모 하나 오타 / 오답 / 빈칸)"""
+    entries = load_tsv(seed_files())
+    rng = random.Random(seed)
+    quiz = []
+    for _ in range(n_questions):
+        zh, pinyin, pos, ko = rng.choice(entries)
+        item = {"zh": zh, "pinyin": pinyin, "pos": pos, "ko": ko}
+        quiz_type = rng.choice([QUIZ_ZH_TO_KO, QUIZ_KO_TO_ZH])
+        correct = ko if quiz_type == QUIZ_ZH_TO_KO else zh
+        word = rng.choice([w for w in re.split(r'[,/ ]+', correct) if w.strip()]).strip()
+
+        kind = rng.random()
+        if kind < 0.4:
+            user_ans = word
+        elif kind < 0.6:
+            user_ans = word + rng.choice(_NOISE)
+        elif kind < 0.75 and quiz_type == QUIZ_ZH_TO_KO and len(word) >= 2:
+            jamo = unicodedata.normalize("NFD", word) # 자모 하나 빠뜨린 오타 (예: 넓다 -> 널다)
+            i = rng.randrange(len(jamo))
+            user_ans = unicodedata.normalize("NFC", jamo[:i] + jamo[i + 1:])
+        elif kind < 0.95:
+            user_ans = rng.choice(entries)[3 if quiz_type == QUIZ_ZH_TO_KO else 0]
+        else:
+            user_ans = ""
+        quiz.append({"item": item, "type": quiz_type, "user_ans": user_ans, "exclude": rng.random() < 0.02})
+    return quiz
+
+
+def legacy_grade(quiz):
+    correct = 0
+    for q in quiz:
+        if q["exclude"]:
+            continue
+        target = str(q["item"]["ko"] if q["type"] == QUIZ_ZH_TO_KO else q["item"]["zh"])
+        if legacy_check_answer(q["user_ans"].strip(), target):
+            correct += 1
+    return correct
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주관식 시험 채점 벤치마크")
+    parser.add_argument("--questions", type=int, default=5000)
+    parser.add_argument("--reruns", type=int, default=5, help="결과 화면 리런 횟수 (예전 방식은 매번 다시 채점)")
+    args = parser.parse_args()
+
+    check_particle_folding()
+    quiz = make_quiz(args.questions)
+
+    # 결과 확인: 예전에 정답이면 새 방식도 정답
+    t0 = time.perf_counter()
+    for q in quiz:
+        q["answer"], q["answers"] = prepare_question(q["item"], q["type"])
+    prepare_ms = (time.perf_counter() - t0) * 1000
+
+    results = grade_submission(quiz)
+    for q, ok in zip(quiz, results["is_correct"]):
+        target = q["answer"]
+        if not q["exclude"] and legacy_check_answer(q["user_ans"].strip(), target):
+            assert ok, (q["user_ans"], target)
+
+    t0 = time.perf_counter()
+    for _ in range(args.reruns):
+        legacy_correct = legacy_grade(quiz)
+    legacy_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    results = grade_submission(quiz)
+    grade_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    typo_results = grade_submission(quiz, max_typos=1)
+    typo_ms = (time.perf_counter() - t0) * 1000
+
+    correct, total, excluded = summarize_grades(results)
+    typo_correct, _, _ = summarize_grades(typo_results)
+    print(f"문제 수                  : {len(quiz):,}개 (제외 {excluded}개, 채점 {total}개)")
+    print(f"정답 수                  : 예전 {legacy_correct} / 새 방식 {correct} / 오타 허용 {typo_correct}")
+    print(f"예전 방식 (리런 {args.reruns}번)    : {legacy_ms:10.1f} ms")
+    print(f"정답 후보 만들기 (1번)   : {prepare_ms:10.1f} ms (시험을 만들 때)")
+    print(f"한 번에 채점 (1번)       : {grade_ms:10.1f} ms (리런 때는 보관한 결과 표 사용)")
+    print(f"한 번에 채점 (오타 허용) : {typo_ms:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
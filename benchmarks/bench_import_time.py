@@ -0,0 +1,117 @@
+# 경로: benchmarks/bench_import_time.py
+# [설명] 앱 첫 실행(cold start) import 비용 벤치마크 (python -X importtime)
+# - 홈 화면: app.py를 bare 모드로 한 번 실행 (메뉴 = 홈) -> 홈에 필요 없는 무거운 모듈이 안 올라와야 함
+# - 비교용: 예전처럼 모든 기능 페이지를 한꺼번에 import 했을 때
+# 새 프로세스에서 측정하므로 이미 import된 모듈의 영향이 없습니다.
+# 실행 예: python -m benchmarks.bench_import_time --repeat 3
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 홈 화면에서는 불러오면 안 되는 무거운 의존성
+# (plotly 본체는 Streamlit이 스스로 import 하므로 앱이 미룰 수 있는 plotly.express만 확인)
+HEAVY_MODULES = ["openai", "httpx", "gspread", "oauth2client", "plotly.express", "fitz", "pymupdf", "pyarrow"]
+
+# 홈 화면 한 번 그리기 (Streamlit bare 모드, 세션 상태 기본값 -> 메뉴 '홈')
+HOME_SCRIPT = """
+import runpy, sys
+sys.path.insert(0, {root!r})
+runpy.run_path({app!r}, run_name="__main__")
+"""
+
+# 예전 app.py처럼 모든 기능 페이지를 미리 import
+EAGER_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+import streamlit
+import ui.sidebar, ui.home
+import features.vocab_upload, features.vocab_quiz, features.word_order
+import features.writing, features.dictionary, features.dashboard
+"""
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_importtime(script, cache_dir):
+    """
+    새 파이썬 프로세스에서 script를 -X importtime으로 실행합니다.
+    Returns: (벽시계 시간 초, {모듈: (self us, cumulative us, 깊이)})
+    """
+    env = dict(os.environ, VOCA_CACHE_DIR=cache_dir, VOCA_SHEETS_BACKEND="fake", PYTHONDONTWRITEBYTECODE="1")
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"측정 스크립트 실패:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            self_us, cum_us, indent, name = m.groups()
+            modules[name] = (int(self_us), int(cum_us), len(indent) // 2)
+    return wall, modules
+
+
+def summarize(modules):
+    """전체 import 시간(ms), 모듈 수, 최상위 패키지별 누적 시간(ms) 상위 목록"""
+    total_ms = sum(self_us for self_us, _, _ in modules.values()) / 1000
+    top = {}
+    for name, (_, cum_us, depth) in modules.items():
+        if depth == 0:
+            pkg = name.split(".")[0]
+            top[pkg] = top.get(pkg, 0) + cum_us / 1000
+    return total_ms, len(modules), sorted(top.items(), key=lambda kv: -kv[1])
+
+
+def _measure(script, repeat, cache_dir):
+    best = None
+    for _ in range(repeat):
+        wall, modules = run_importtime(script, cache_dir)
+        if best is None or wall < best[0]:
+            best = (wall, modules)
+    return best
+
+
+def _report(label, wall, modules, top_n):
+    total_ms, count, top = summarize(modules)
+    loaded_heavy = [m for m in HEAVY_MODULES if m in modules]
+    print(f"[{label}]")
+    print(f"  프로세스 전체     : {wall * 1000:8.1f} ms")
+    print(f"  import 합계       : {total_ms:8.1f} ms (모듈 {count}개)")
+    print(f"  무거운 의존성     : {', '.join(loaded_heavy) if loaded_heavy else '없음'}")
+    for pkg, ms in top[:top_n]:
+        print(f"    {pkg:<20} {ms:8.1f} ms")
+    return total_ms, loaded_heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 cold start import 비용 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = _measure(HOME_SCRIPT.format(root=str(ROOT), app=str(ROOT / "app.py")), args.repeat, tmp)
+        eager = _measure(EAGER_SCRIPT.format(root=str(ROOT)), args.repeat, tmp)
+
+    home_ms, home_heavy = _report("홈 화면 (app.py)", *home, args.top)
+    eager_ms, _ = _report("모든 페이지 미리 import (예전 방식)", *eager, args.top)
+    print(f"import 시간 감소    : x{eager_ms / home_ms:.1f}")
+
+    assert not home_heavy, f"홈 화면에서 무거운 의존성이 import 되었습니다: {home_heavy}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# 경로: benchmarks/bench_llm_standin.py
+# [설명] OpenAI 대역(services/llm_standin.py)으로 AI 호출 경로 부하 테스트 (API 키/네트워크 없이, 재현 가능)
+# - 단어 검수 루프: process_vocab_with_llm (배치 크기별 처리량, 429/깨진 JSON이 섞여도 끝까지 도는지)
+# - 어순 문제 출제: 동시에 여러 개 요청했을 때 호출별 지연 p50/p95/p99
+# - 작문 스트리밍 채점: 첫 필드가 보일 때까지 vs 전체 완료까지 걸린 시간
+# 지연/오류는 --latency/--rate-limit/--malformed로 주입 (같은 --seed면 같은 결과)
+# 실행 예: python -m benchmarks.bench_llm_standin --words 400 --latency lognormal:300:0.6 --rate-limit 0.05
+
+import argparse
+import os
+import statistics
+import time
+
+
+def _configure(args):
+    """services.llm이 클라이언트를 처음 만들기 전에 대역 설정을 환경변수로 넘김"""
+    os.environ.update({
+        "VOCA_LLM_BACKEND": "standin",
+        "VOCA_LLM_CACHE": "off", # 캐시가 켜져 있으면 두 번째 측정부터 대역까지 가지 않음
+        "VOCA_STANDIN_LATENCY": args.latency,
+        "VOCA_STANDIN_STREAM_MS": str(args.stream_ms),
+        "VOCA_STANDIN_429": str(args.rate_limit),
+        "VOCA_STANDIN_MALFORMED": str(args.malformed),
+        "VOCA_STANDIN_SEED": str(args.seed),
+    })
+
+
+def make_repair_input(n_words):
+    """병음이 빠진 단어장 -> 모든 행이 검수 대상"""
+    from benchmarks.corpora import STYLE_NO_PINYIN, make_txt
+    from core.vocab_parser import parse_text_by_chunks
+
+    data, _ = make_txt(n_words, style_weights={STYLE_NO_PINYIN: 1.0})
+    text = data.decode("utf-8")
+    return parse_text_by_chunks(text, "HSK", "bench"), text
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def bench_repair(n_words, batch_size):
+    from services.llm import process_vocab_with_llm
+
+    df, text = make_repair_input(n_words)
+    t0 = time.perf_counter()
+    result = process_vocab_with_llm(df.copy(), text, batch_size=batch_size)
+    elapsed = time.perf_counter() - t0
+    return elapsed, int((result['flags'] == 'OK').sum()), len(df)
+
+
+def bench_puzzles(n_requests):
+    from services.async_runtime import run_concurrently
+    from services.llm import agenerate_sentence_puzzle
+
+    async def timed():
+        t0 = time.perf_counter()
+        puzzle = await agenerate_sentence_puzzle(["爱惜", "安静", "把握"], strategy=None)
+        return time.perf_counter() - t0, puzzle
+
+    t0 = time.perf_counter()
+    results = run_concurrently(*(timed() for _ in range(n_requests)))
+    wall = time.perf_counter() - t0
+    latencies = [lat * 1000 for lat, _ in results]
+    ok = [p for _, p in results if p is not None]
+    for puzzle in ok:
+        assert set(puzzle) >= {"chinese", "pinyin", "korean", "pieces", "grammar_point"}, puzzle
+    return wall, latencies, len(ok)
+
+
+def bench_writing_stream(n_runs):
+    from services.llm import EVENT_DONE, EVENT_FIELD, iter_evaluate_writing_v2
+
+    first_field, total, done = [], [], 0
+    for i in range(n_runs):
+        t0 = time.perf_counter()
+        first = None
+        for event in iter_evaluate_writing_v2("99", f"我们应该爱惜时间。{i}", ["爱惜", "安静", "把握", "发票", "预算"]):
+            if event[0] == EVENT_FIELD and first is None:
+                first = time.perf_counter() - t0
+            if event[0] == EVENT_DONE:
+                done += 1
+        total.append((time.perf_counter() - t0) * 1000)
+        if first is not None:
+            first_field.append(first * 1000)
+    return first_field, total, done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 대역으로 AI 호출 경로 부하 테스트")
+    parser.add_argument("--words", type=int, default=400, help="검수할 단어 수")
+    parser.add_argument("--batch-sizes", default="5,20", help="비교할 검수 배치 크기 (쉼표로 구분)")
+    parser.add_argument("--puzzles", type=int, default=40, help="동시에 요청할 어순 문제 수")
+    parser.add_argument("--writings", type=int, default=5, help="스트리밍 채점 횟수")
+    parser.add_argument("--latency", default="lognormal:200:0.5", help="지연 분포 (ms, 예: fixed:100 / uniform:50:300)")
+    parser.add_argument("--stream-ms", type=float, default=10, help="스트리밍 조각 사이 지연 (ms)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--malformed", type=float, default=0.0, help="깨진 JSON 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    _configure(args)
+    from services import llm_standin
+
+    print(f"대역 설정: 지연 {args.latency} / 429 {args.rate_limit:.0%} / 깨진 JSON {args.malformed:.0%} / seed {args.seed}")
+
+    for batch_size in [int(b) for b in args.batch_sizes.split(",") if b.strip()]:
+        elapsed, n_ok, n_total = bench_repair(args.words, batch_size)
+        if args.rate_limit == 0 and args.malformed == 0:
+            assert n_ok == n_total, f"오류 주입 없이 보정되지 않은 행이 있습니다 ({n_ok}/{n_total})"
+        print(f"단어 검수 (배치 {batch_size:>3})   : {elapsed * 1000:8.0f} ms ({n_total / elapsed:7.1f} 단어/s, 보정 {n_ok}/{n_total})")
+
+    wall, latencies, n_ok = bench_puzzles(args.puzzles)
+    print(f"어순 문제 {args.puzzles}개 동시 요청 : {wall * 1000:8.0f} ms (성공 {n_ok}개)")
+    print(f"  호출별 지연 p50/p95/p99 : {_percentile(latencies, 0.5):.0f} / {_percentile(latencies, 0.95):.0f} / "
+          f"{_percentile(latencies, 0.99):.0f} ms")
+
+    first_field, total, done = bench_writing_stream(args.writings)
+    if first_field:
+        print(f"작문 스트리밍 채점 ({done}/{args.writings}) : 첫 필드 {statistics.median(first_field):.0f} ms / "
+              f"전체 {statistics.median(total):.0f} ms (중앙값)")
+
+    print(f"대역 요청 통계           : {llm_standin.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# 경로: benchmarks/bench_offline_dict.py
+# [설명] 오프라인 사전 인덱스(core/dict_index.py) 조회 벤치마크
+# - 기본 사전(data/dict/*.tsv) + 크기를 키운 합성 사전으로 인덱스 만들기/열기/조회 시간 측정
+# - 비교용: 항목 리스트를 매번 처음부터 훑는 단순 검색 (결과가 같은지도 확인)
+# 실행 예: python -m benchmarks.bench_offline_dict --synthetic 50000 --queries 20000
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from core.dict_index import DictIndex, build_index, gloss_terms, load_tsv
+from services.offline_dict import seed_files
+
+_SYLLABLES = ["가", "나", "다", "라", "마", "바", "사", "아", "자", "차", "카", "타", "파", "하"]
+
+
+def make_entries(n_synthetic, seed=18):
+    """기본 사전 + 합성 항목 n_synthetic개 (한자 2~4글자, 한국어 뜻 1~3개)"""
+    entries = load_tsv(seed_files())
+    rng = random.Random(seed)
+    seen = {zh for zh, _, _, _ in entries}
+    target = len(entries) + n_synthetic
+    while len(entries) < target:
+        zh = "".join(chr(rng.randint(0x4E00, 0x4E00 + 800)) for _ in range(rng.randint(2, 4)))
+        if zh in seen:
+            continue
+        seen.add(zh)
+        glosses = ["".join(rng.choices(_SYLLABLES, k=rng.randint(2, 3))) + "다" for _ in range(rng.randint(1, 3))]
+        entries.append((zh, "pinyin", "동사", ", ".join(glosses)))
+    return entries
+
+
+def brute_force_hanzi(entries, prefix, limit):
+    found = sorted((e for e in entries if e[0].startswith(prefix)), key=lambda e: len(e[0]))
+    return {e[0] for e in found[:limit]} if len(found) <= limit else None
+
+
+def brute_force_korean(entries, term):
+    return {e[0] for e in entries if term in gloss_terms(e[3])}
+
+
+def _per_query_us(fn, queries):
+    t0 = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - t0) / len(queries) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 사전 인덱스 조회 벤치마크")
+    parser.add_argument("--synthetic", type=int, default=50000, help="기본 사전에 더할 합성 항목 수")
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+
+    entries = make_entries(args.synthetic)
+    rng = random.Random(7)
+    hanzi_queries = [rng.choice(entries)[0] for _ in range(args.queries)]
+    korean_queries = [rng.choice(sorted(gloss_terms(rng.choice(entries)[3]))) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dict.bin"
+        t0 = time.perf_counter()
+        build_index(entries, path)
+        build_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        index = DictIndex(path)
+        open_us = (time.perf_counter() - t0) * 1e6
+
+        # 결과 확인 (단순 검색과 같은 결과인지)
+        for q in hanzi_queries[:200]:
+            assert index.lookup_hanzi(q)["zh"] == q
+            expected = brute_force_hanzi(entries, q[:1], limit=1000)
+            if expected is not None:
+                assert {e["zh"] for e in index.prefix_hanzi(q[:1], limit=1000)} == expected, q
+        for q in korean_queries[:50]:
+            got = {e["zh"] for e in index.lookup_korean(q, limit=100000) if q in gloss_terms(e["ko"])}
+            assert got == brute_force_korean(entries, q), q
+
+        hanzi_us = _per_query_us(index.lookup_hanzi, hanzi_queries)
+        prefix_us = _per_query_us(lambda q: index.prefix_hanzi(q[:1], limit=10), hanzi_queries)
+        korean_us = _per_query_us(lambda q: index.lookup_korean(q, limit=10), korean_queries)
+        scan_queries = korean_queries[:max(1, args.queries // 200)]
+        scan_us = _per_query_us(lambda q: brute_force_korean(entries, q), scan_queries)
+        size_kb = path.stat().st_size / 1024
+        index.close()
+
+    print(f"항목 수              : {len(entries):,}개 (파일 {size_kb:,.0f} KB)")
+    print(f"인덱스 만들기        : {build_s * 1000:10.1f} ms")
+    print(f"인덱스 열기 (mmap)   : {open_us:10.1f} us")
+    print(f"한자 정확히 일치     : {hanzi_us:10.2f} us/건")
+    print(f"한자 접두어 (10개)   : {prefix_us:10.2f} us/건")
+    print(f"한국어 뜻 (10개)     : {korean_us:10.2f} us/건")
+    print(f"비교: 전체 훑기      : {scan_us:10.1f} us/건 (x{scan_us / korean_us:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
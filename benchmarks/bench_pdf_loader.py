@@ -0,0 +1,79 @@
+# 경로: benchmarks/bench_pdf_loader.py
+# [설명] core/pdf_loader 단일 프로세스 추출 vs 페이지 샤딩(프로세스 풀) 추출 비교
+# 실행 예: python -m benchmarks.bench_pdf_loader --pages 400
+
+import argparse
+import random
+import time
+
+import fitz
+
+from core.pdf_loader import extract_text_from_pdf_bytes
+
+SAMPLE_WORDS = [
+    ("爱惜", "àixī", "동", "아끼다, 소중히 여기다"),
+    ("节约", "jiéyuē", "동", "절약하다"),
+    ("安慰", "ānwèi", "동", "위로하다"),
+    ("把握", "bǎwò", "명", "자신, 가능성"),
+    ("包含", "bāohán", "동", "포함하다"),
+    ("宝贵", "bǎoguì", "형", "귀중하다"),
+    ("报道", "bàodào", "명", "보도"),
+    ("悲观", "bēiguān", "형", "비관적이다"),
+]
+
+
+def make_synthetic_pdf(n_pages, words_per_page=30, seed=42):
+    """
+    단어장 형식(번호. 한자 병음 품사 뜻)의 가짜 PDF를 n_pages 쪽 만들어 바이트로 반환합니다.
+    """
+    rng = random.Random(seed)
+    doc = fitz.open()
+    no = 1
+    for _ in range(n_pages):
+        page = doc.new_page()
+        y = 40
+        for _ in range(words_per_page):
+            zh, py, pos, ko = rng.choice(SAMPLE_WORDS)
+            page.insert_text((40, y), f"{no}. {zh} {py} {pos} {ko}", fontname="korea", fontsize=10)
+            y += 24
+            no += 1
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출 벤치마크")
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pdf_bytes = make_synthetic_pdf(args.pages)
+    print(f"합성 PDF: {args.pages}쪽, {len(pdf_bytes) / 1024:.0f} KB")
+
+    t_single, text_single = _time(lambda: extract_text_from_pdf_bytes(pdf_bytes), args.repeat)
+    t_parallel, text_parallel = _time(
+        lambda: extract_text_from_pdf_bytes(pdf_bytes, parallel=True, max_workers=args.workers),
+        args.repeat,
+    )
+
+    assert text_single == text_parallel, "단일/병렬 추출 결과가 다릅니다!"
+
+    print(f"단일 프로세스 : {t_single * 1000:8.1f} ms ({args.pages / t_single:7.1f} pages/s)")
+    print(f"페이지 샤딩   : {t_parallel * 1000:8.1f} ms ({args.pages / t_parallel:7.1f} pages/s)")
+    print(f"속도 향상     : x{t_single / t_parallel:.2f}")
+
+
+if __name__ == "__main__":
+    main()
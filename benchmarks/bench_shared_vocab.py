@@ -0,0 +1,108 @@
+# 경로: benchmarks/bench_shared_vocab.py
+# [설명] 교실 시나리오: 학생 여러 명(세션)이 같은 학습지 몇 개를 올릴 때 파싱 시간/메모리 비교
+# - 예전 방식: 세션마다 파일을 파싱해서 자기 DataFrame을 따로 보관
+# - 새 방식  : services/shared_vocab.py 공유 캐시에서 한 번만 파싱, 세션은 VocabStore로 참조 + 자기 편집본만
+# 세션 몇 개는 표를 편집(선택 해제)해서, 편집이 다른 세션에 새지 않는지도 확인합니다.
+# 메모리는 tracemalloc으로 세션들이 들고 있는 객체를 모두 살려 둔 상태에서 측정합니다.
+# (Arrow 버퍼는 tracemalloc에 잡히지 않으므로 공유 캐시 크기는 get_stats()의 bytes로 따로 표시)
+# 실행 예: python -m benchmarks.bench_shared_vocab --students 40 --worksheets 3 --words 800
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from core.dict_index import load_tsv
+from core.vocab_parser import iter_vocab_batches, vocab_rows_to_df
+from core.vocab_store import VocabStore
+from services import shared_vocab
+from services.offline_dict import seed_files
+
+
+def make_worksheets(n_sheets, n_words, seed=23):
+    """기본 사전 단어로 만든 '한자 병음 품사 뜻' 형식의 학습지 텍스트 n_sheets개"""
+    entries = load_tsv(seed_files())
+    rng = random.Random(seed)
+    sheets = []
+    for s in range(n_sheets):
+        lines = []
+        for i in range(n_words):
+            zh, pinyin, pos, ko = rng.choice(entries)
+            lines.append(f"{i + 1}. {zh} {pinyin} [{pos}] {ko}")
+        sheets.append((f"sheet{s}", "\n".join(lines) + "\n"))
+    return sheets
+
+
+def parse_sheet(text, name):
+    rows = []
+    for batch in iter_vocab_batches([text], level="HSK", source=name):
+        rows.extend(batch)
+    df = vocab_rows_to_df(rows)
+    df.insert(0, '선택', True)
+    return df
+
+
+def edit_one(store):
+    """첫 단어 선택 해제 (표 편집기에서 체크박스 하나를 끈 것과 같음)"""
+    edited = store.base_df().copy()
+    edited.loc[0, '선택'] = False
+    store.apply_edits(edited, {"edited_rows": {0: {"선택": False}}, "added_rows": [], "deleted_rows": []})
+
+
+def run(students, sheets, shared):
+    """세션 students개를 만들고 (들고 있는 객체 리스트, 걸린 시간 ms, 최대 메모리 MB)를 돌려줌"""
+    rng = random.Random(1)
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    sessions = []
+    for i in range(students):
+        name, text = rng.choice(sheets)
+        if shared:
+            entry, _ = shared_vocab.get_or_load(name, lambda: parse_sheet(text, name))
+            store = VocabStore(base_table=entry.table, base_df=entry.df)
+        else:
+            store = VocabStore(parse_sheet(text, name))
+        store.base_df() # 업로드 화면의 표 편집기가 원본 DataFrame을 그림
+        if i % 4 == 0:
+            edit_one(store)
+        sessions.append(store)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sessions, elapsed_ms, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 간 공유 단어장 캐시 벤치마크")
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--worksheets", type=int, default=3)
+    parser.add_argument("--words", type=int, default=800)
+    args = parser.parse_args()
+
+    sheets = make_worksheets(args.worksheets, args.words)
+
+    legacy_sessions, legacy_ms, legacy_mb = run(args.students, sheets, shared=False)
+    legacy_selected = [s.selected_words() for s in legacy_sessions]
+    del legacy_sessions
+
+    shared_vocab.clear()
+    sessions, shared_ms, shared_mb = run(args.students, sheets, shared=True)
+
+    # 결과 확인: 세션마다 같은 단어 선택 결과 (편집은 자기 세션에만)
+    assert [s.selected_words() for s in sessions] == legacy_selected, "세션 결과가 다릅니다"
+    for s in sessions:
+        if not s.is_edited:
+            assert s.selected_words()[0] == s.base_df()['zh'].iloc[0], "다른 세션의 편집이 섞였습니다"
+
+    stats = shared_vocab.get_stats()
+    print(f"학생(세션) 수            : {args.students}명 (학습지 {args.worksheets}개 x {args.words}단어, 1/4은 편집)")
+    print(f"예전 방식 (세션마다 파싱): {legacy_ms:8.1f} ms / 최대 메모리 {legacy_mb:6.1f} MB")
+    print(f"공유 캐시                : {shared_ms:8.1f} ms / 최대 메모리 {shared_mb:6.1f} MB")
+    print(f"공유 캐시 적중률         : {stats['hit_rate'] * 100:8.1f} % (적중 {stats['hits']} / 실패 {stats['misses']}, "
+          f"캐시 {stats['bytes'] / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# 경로: benchmarks/bench_srs.py
+# [설명] 복습 대기열(core/srs.py SrsQueue) 벤치마크
+# - 예전 방식으로 복습을 하려면: 시험마다 모든 카드를 다음 복습 시각으로 정렬한 뒤 앞에서 k개
+# - 새 방식: 최소 힙에서 k개만 꺼냄 (O(k log n)), 채점 결과는 O(log n)으로 반영
+# 두 방식이 같은 카드를 고르는지도 확인합니다.
+# 실행 예: python -m benchmarks.bench_srs --cards 100000 --k 20
+
+import argparse
+import random
+import time
+
+from core.srs import DAY_SECONDS, GRADE_AGAIN, GRADE_GOOD, SrsQueue, review
+
+
+def make_deck(n_cards, reviewed_ratio=0.8, seed=20):
+    """카드 n_cards장 중 reviewed_ratio 만큼은 복습 기록이 있는 덱 (다음 복습 시각은 앞뒤 30일 안)"""
+    rng = random.Random(seed)
+    card_ids = [f"词{i}" for i in range(n_cards)]
+    now = 1_700_000_000.0
+    due_by_card = {
+        card_id: now + rng.uniform(-30, 30) * DAY_SECONDS
+        for card_id in card_ids if rng.random() < reviewed_ratio
+    }
+    return card_ids, due_by_card, now
+
+
+def sort_all(card_ids, due_by_card, k, now):
+    """비교용: 전체 정렬로 같은 순서(지난 카드 -> 새 카드 -> 곧 복습할 카드) 만들기"""
+    due = sorted((d, c) for c, d in due_by_card.items() if d <= now)
+    future = sorted((d, c) for c, d in due_by_card.items() if d > now)
+    new = [c for c in card_ids if c not in due_by_card]
+    return ([c for _, c in due] + new + [c for _, c in future])[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="복습 대기열 벤치마크")
+    parser.add_argument("--cards", type=int, default=100000)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    card_ids, due_by_card, now = make_deck(args.cards)
+
+    t0 = time.perf_counter()
+    queue = SrsQueue(card_ids, due_by_card)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    # 결과 확인 + 시험 한 번 = (k장 꺼내기 -> 채점 반영)을 rounds번 반복
+    rng = random.Random(1)
+    draw_s = update_s = 0.0
+    check_every = max(1, args.rounds // 5)
+    for r in range(args.rounds):
+        t0 = time.perf_counter()
+        cards, _, _ = queue.next_cards(args.k, now)
+        draw_s += time.perf_counter() - t0
+        if r % check_every == 0:
+            assert cards == sort_all(card_ids, due_by_card, args.k, now), f"{r}번째 결과가 다릅니다"
+
+        t0 = time.perf_counter()
+        for card_id in cards:
+            state = review(None, GRADE_GOOD if rng.random() < 0.7 else GRADE_AGAIN, now)
+            due_by_card[card_id] = state.due
+            queue.update(card_id, state.due)
+        update_s += time.perf_counter() - t0
+        now += 600 # 시험 사이 10분
+
+    t0 = time.perf_counter()
+    for _ in range(5):
+        sort_all(card_ids, due_by_card, args.k, now)
+    sort_ms = (time.perf_counter() - t0) / 5 * 1000
+
+    draw_us = draw_s / args.rounds * 1e6
+    print(f"카드 수                : {args.cards:,}장 (복습 기록 {len(due_by_card):,}장)")
+    print(f"대기열 만들기 (1회)    : {build_ms:10.1f} ms")
+    print(f"{args.k}장 꺼내기 (힙)      : {draw_us:10.1f} us/회")
+    print(f"{args.k}장 채점 반영       : {update_s / args.rounds * 1e6:10.1f} us/회")
+    print(f"비교: 전체 정렬        : {sort_ms:10.1f} ms/회 (x{sort_ms * 1000 / draw_us:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# 경로: benchmarks/bench_tokenizer.py
+# [설명] clean_chunk_content 토큰 분류기 벤치마크 (tokens/sec)
+# - 시작 전에 예전 정규식 구현(legacy)과 결과가 글자 하나까지 같은지 먼저 검사(골든 출력 비교)
+# 실행 예: python -m benchmarks.bench_tokenizer --chunks 50000
+
+import argparse
+import random
+import re
+import time
+import unicodedata
+
+from core.vocab_parser import (
+    HACKERS_NOISE_RE,
+    INSTRUCTION_KEYWORDS,
+    PINYIN_WHITELIST,
+    POS_SET,
+    TONE_CHARS_RE,
+    classify_token,
+    clean_chunk_content,
+    cut_tail_after_last_korean,
+)
+
+
+def legacy_clean_chunk_content(text):
+    """토큰마다 정규식을 여러 번 돌리던 예전 구현 (비교 기준)"""
+    if not text: return "", "", ""
+    text = unicodedata.normalize("NFC", text)
+    text = re.sub(r"[\[\]\(\)\<\>,\.\-\~]", " ", text) 
+    tokens = text.split()
+    
+    pinyin_list, pos_list, meaning_list = [], [], []
+    
+    for token in tokens:
+        token = token.strip()
+        if not token: continue
+        if HACKERS_NOISE_RE.match(token):
+            continue
+        if TONE_CHARS_RE.search(token):
+            pinyin_list.append(token)
+            continue
+        if re.match(r"^[a-zA-ZüÜ:]+$", token):
+            low_token = token.lower().replace(':', 'ü')
+            if low_token in PINYIN_WHITELIST:
+                pinyin_list.append(token)
+                continue
+            if token in POS_SET:
+                if token not in pos_list: pos_list.append(token)
+                continue
+            continue 
+        if token in POS_SET:
+            if token not in pos_list: pos_list.append(token)
+            continue
+        meaning_list.append(token)
+
+    final_ko = " ".join(meaning_list)
+    for kw in INSTRUCTION_KEYWORDS:
+        if kw in final_ko:
+            final_ko = ""
+            break
+
+    cleaned_ko = cut_tail_after_last_korean(final_ko)
+    return " ".join(pinyin_list), ", ".join(dict.fromkeys(pos_list)), cleaned_ko
+
+
+# 실제 단어장에서 자주 보이는 조각들 (병음/품사/뜻/노이즈/지시문/영문 잡음)
+GOLDEN_CHUNKS = [
+    " àixī 동 아끼다, 소중히 여기다\n",
+    " jiéyuē [동] 절약하다 ★★\n",
+    " an1wei4 (동) 위로하다 □\n",
+    " lü: lv nü 명 녹색 ※ 참고\n",
+    " bǎwò 명사 자신, 가능성 ~을 파악하다\n",
+    " Ni hao v adj 좋다\n",
+    " 다음 중 알맞은 것을 고르세요 ①\n",
+    " 5급 ※ 보도하다 ≠ 보고\n",
+    " ☆☆☆ ✓ ✔ 체크\n",
+    " NO PINYIN HERE abc 뜻없음...\n",
+    " ",
+    "",
+    " ü Ü : :: 명 명 동\n",
+    " ǖ ǘ ǚ ǜ 형용사 푸르다 ㅁ\n",
+]
+
+_FUZZ_ALPHABET = list("àáǎēéīíōóūúüÜaiouxyzADV:명동형부사아끼다절약★☆※□■✓[]()<>,.-~ \n12급≠")
+
+
+def make_chunks(n, seed=7):
+    rng = random.Random(seed)
+    chunks = []
+    for _ in range(n):
+        if rng.random() < 0.5:
+            chunks.append(rng.choice(GOLDEN_CHUNKS))
+        else:
+            chunks.append("".join(rng.choice(_FUZZ_ALPHABET) for _ in range(rng.randint(0, 60))))
+    return chunks
+
+
+def check_golden(chunks):
+    for chunk in GOLDEN_CHUNKS + chunks:
+        expected = legacy_clean_chunk_content(chunk)
+        actual = clean_chunk_content(chunk)
+        assert actual == expected, f"출력 불일치: {chunk!r}\n  legacy={expected!r}\n  new   ={actual!r}"
+
+
+def _bench(fn, chunks, n_tokens):
+    t0 = time.perf_counter()
+    for chunk in chunks:
+        fn(chunk)
+    elapsed = time.perf_counter() - t0
+    return elapsed, n_tokens / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="clean_chunk_content 처리량 벤치마크")
+    parser.add_argument("--chunks", type=int, default=50000)
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.chunks)
+    check_golden(chunks)
+    print(f"골든 출력 비교 통과 ({len(GOLDEN_CHUNKS) + len(chunks)}개 청크)")
+
+    n_tokens = sum(len(re.sub(r"[\[\]\(\)\<\>,\.\-\~]", " ", c).split()) for c in chunks)
+
+    t_legacy, tps_legacy = _bench(legacy_clean_chunk_content, chunks, n_tokens)
+    classify_token.cache_clear()
+    t_new, tps_new = _bench(clean_chunk_content, chunks, n_tokens)
+
+    print(f"토큰 수      : {n_tokens:,}")
+    print(f"legacy 정규식: {t_legacy * 1000:8.1f} ms ({tps_legacy:12,.0f} tokens/s)")
+    print(f"단일 패스    : {t_new * 1000:8.1f} ms ({tps_new:12,.0f} tokens/s)")
+    print(f"속도 향상    : x{t_legacy / t_new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# 경로: benchmarks/bench_vocab_search.py
+# [설명] 사전 페이지 내 단어장 검색 벤치마크
+# - 예전 방식: 리런마다 to_dict('records') 후 모든 단어에 대해 `검색어 in zh or 검색어 in ko`
+# - 새 방식  : n-gram 역색인(core/vocab_search.py), 단어장 내용이 같으면 캐시된 인덱스 재사용
+# 두 방식의 결과(한자/뜻 부분 일치)가 같은지도 확인합니다.
+# 실행 예: python -m benchmarks.bench_vocab_search --rows 20000 --queries 300
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from core.dict_index import gloss_terms, load_tsv
+from core.vocab_search import get_vocab_index, normalize_text
+from services.offline_dict import seed_files
+
+
+def make_vocab_df(n_rows, seed=19):
+    """기본 사전 단어를 섞어 이어 붙인 n_rows개짜리 단어장 (한자 뒤에 번호를 붙여 모두 다른 단어로)"""
+    entries = load_tsv(seed_files())
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_rows):
+        zh, pinyin, pos, ko = rng.choice(entries)
+        rows.append({"선택": True, "zh": f"{zh}{i}", "pinyin": pinyin, "ko": ko, "pos": pos, "flags": "OK"})
+    return pd.DataFrame(rows)
+
+
+def old_search(df, keyword):
+    """예전 features/dictionary.py 방식"""
+    return [
+        item for item in df.to_dict('records')
+        if keyword in item.get('zh', '') or keyword in str(item.get('ko', ''))
+    ]
+
+
+def make_queries(df, n, seed=7):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n):
+        row = df.iloc[rng.randrange(len(df))]
+        if rng.random() < 0.5:
+            queries.append(rng.choice(sorted(gloss_terms(row["ko"]))))
+        else:
+            queries.append(row["zh"].rstrip("0123456789")[:rng.randint(1, 2)])
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="내 단어장 검색 벤치마크")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=300)
+    args = parser.parse_args()
+
+    df = make_vocab_df(args.rows)
+    queries = make_queries(df, args.queries)
+
+    t0 = time.perf_counter()
+    index = get_vocab_index(df)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(10):
+        assert get_vocab_index(df) is index
+    cached_ms = (time.perf_counter() - t0) * 100
+
+    # 결과 확인 (정규화가 필요 없는 검색어이므로 두 방식 결과 집합이 같아야 함)
+    for q in queries[:50]:
+        assert normalize_text(q) == q
+        old = {(r["zh"], r["ko"]) for r in old_search(df, q)}
+        new = {(r["zh"], r["ko"]) for r in index.search(q, limit=len(df)) if q in r["zh"] or q in r["ko"]}
+        assert old == new, q
+
+    t0 = time.perf_counter()
+    for q in queries:
+        old_search(df, q)
+    old_ms = (time.perf_counter() - t0) / len(queries) * 1000
+
+    t0 = time.perf_counter()
+    for q in queries:
+        index.search(q, limit=30)
+    new_ms = (time.perf_counter() - t0) / len(queries) * 1000
+
+    t0 = time.perf_counter()
+    for q in queries:
+        index.suggest(q[:1], limit=6)
+    suggest_ms = (time.perf_counter() - t0) / len(queries) * 1000
+
+    print(f"단어 수                 : {len(df):,}개")
+    print(f"인덱스 만들기 (1회)     : {build_ms:10.1f} ms")
+    print(f"리런 시 캐시 확인       : {cached_ms:10.2f} ms")
+    print(f"예전 방식 검색          : {old_ms:10.2f} ms/건")
+    print(f"역색인 검색 (상위 30개) : {new_ms:10.2f} ms/건 (x{old_ms / new_ms:,.0f})")
+    print(f"추천 검색어 (6개)       : {suggest_ms:10.3f} ms/건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# 경로: benchmarks/bench_vocab_store.py
+# [설명] 세션 단어장 저장소(core/vocab_store.py VocabStore) 벤치마크
+# - 예전 방식: 페이지가 리런될 때마다 final_vocab_df를 다시 변환
+#   (작문: to_dict('records'), 어순: '선택' 필터 + 행마다 apply로 선택지 라벨, 사전: 검색용 DataFrame)
+# - 새 방식  : 단어장 버전이 같으면 view()에 보관한 파생 데이터를 그대로 사용 (편집할 때만 다시 계산)
+# 두 방식의 결과가 같은지 확인한 뒤 측정합니다.
+# 실행 예: python -m benchmarks.bench_vocab_store --words 20000 --reruns 50
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from core.dict_index import load_tsv
+from core.vocab_store import VocabStore
+from services.offline_dict import seed_files
+
+_LEVELS = ["HSK1", "HSK2", "HSK3", "HSK4", "HSK5", "HSK6"]
+_SOURCES = ["pdf", "image", "txt"]
+
+
+def make_vocab(n_words, seed=22):
+    """기본 사전 단어를 n_words개로 늘린 합성 단어장 (범주형 열 pos/flags/level/source 포함)"""
+    entries = load_tsv(seed_files())
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_words):
+        zh, pinyin, pos, ko = entries[i % len(entries)]
+        rows.append({
+            "선택": rng.random() < 0.8,
+            "zh": zh if i < len(entries) else f"{zh}{i}",
+            "pinyin": pinyin,
+            "ko": ko,
+            "pos": pos,
+            "flags": rng.choice(["", "", "★", "□"]),
+            "level": rng.choice(_LEVELS),
+            "source": rng.choice(_SOURCES),
+        })
+    return pd.DataFrame(rows)
+
+
+def legacy_rerun(df):
+    """예전 방식의 리런 한 번 (페이지마다 DataFrame 변환)"""
+    records = df.to_dict('records')
+    target_words = df[df['선택'] == True]
+    labels = target_words.apply(lambda x: f"{x['zh']} ({x['ko']})", axis=1).tolist()
+    words = target_words['zh'].tolist()
+    return records, labels, words
+
+
+def store_rerun(store):
+    return store.records(), store.option_labels(), store.selected_words()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 단어장 저장소 벤치마크")
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--reruns", type=int, default=50)
+    args = parser.parse_args()
+
+    df = make_vocab(args.words)
+
+    t0 = time.perf_counter()
+    store = VocabStore(df)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    # 결과 확인
+    legacy = legacy_rerun(df)
+    records, labels, words = store_rerun(store)
+    assert labels == legacy[1] and words == legacy[2], "선택지 라벨/단어 목록이 다릅니다"
+    assert [r["zh"] for r in records] == [r["zh"] for r in legacy[0]], "레코드가 다릅니다"
+
+    t0 = time.perf_counter()
+    for _ in range(args.reruns):
+        legacy_rerun(df)
+    legacy_ms = (time.perf_counter() - t0) / args.reruns * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(args.reruns):
+        store_rerun(store)
+    store_us = (time.perf_counter() - t0) / args.reruns * 1e6
+
+    # 편집 한 번 (선택 해제) -> 버전이 올라가고 파생 데이터를 한 번 다시 계산
+    edited = store.base_df().copy()
+    edited.loc[0, "선택"] = not edited.loc[0, "선택"]
+    t0 = time.perf_counter()
+    store.apply_edits(edited, {"edited_rows": {0: {"선택": bool(edited.loc[0, "선택"])}}, "added_rows": [], "deleted_rows": []})
+    store_rerun(store)
+    edit_ms = (time.perf_counter() - t0) * 1000
+
+    df_mb = df.memory_usage(deep=True).sum() / 1e6
+    print(f"단어 수                   : {args.words:,}개")
+    print(f"메모리 (DataFrame/Arrow)  : {df_mb:8.1f} MB / {store.base_table.nbytes / 1e6:.1f} MB")
+    print(f"저장소 만들기 (업로드 때) : {build_ms:8.1f} ms")
+    print(f"예전 방식 리런            : {legacy_ms:8.1f} ms/회")
+    print(f"저장소 리런 (버전 같음)   : {store_us:8.1f} us/회 (x{legacy_ms * 1000 / store_us:,.0f})")
+    print(f"편집 반영 + 다시 계산     : {edit_ms:8.1f} ms (버전 {store.version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# 경로: benchmarks/corpora.py
+# [설명] 벤치마크용 합성 데이터 생성기 (seed가 같으면 항상 같은 결과)
+# - 단어장 TXT / PDF (1단 또는 2단 구성)
+#   줄 형식: 번호 붙은 기본형 / 해커스식 ★·□ 잡음 / 병음 빠진 줄을 섞어서 만듦
+# - 점수 기록(시트 행) [날짜, 별명, 시험유형, 점수]
+# - FakeUpload: Streamlit UploadedFile 대신 파일 로더(load_text_from_pdf, change_text_from_upload)에 넘기는 객체
+# 생성기는 정답(줄마다 어떤 단어/형식인지)도 함께 돌려주므로 벤치마크가 파싱 결과를 확인할 수 있습니다.
+
+import io
+import random
+from datetime import datetime, timedelta
+
+from core.dict_index import load_tsv
+from services.offline_dict import seed_files
+
+STYLE_PLAIN = "plain"          # 12. 爱惜 àixī 동 아끼다
+STYLE_HACKERS = "hackers"      # ★★ 12 爱惜 àixī [동] 아끼다 □
+STYLE_NO_PINYIN = "no_pinyin"  # 12. 爱惜 동 아끼다
+
+DEFAULT_STYLE_WEIGHTS = {STYLE_PLAIN: 0.6, STYLE_HACKERS: 0.3, STYLE_NO_PINYIN: 0.1}
+
+EXAM_TYPES = ["단어시험(주관식)", "작문(99번)", "작문(100번)", "어순 연습"]
+
+
+def seed_words():
+    """기본 사전(data/dict)의 (한자, 병음, 품사, 뜻) 리스트"""
+    return load_tsv(seed_files())
+
+
+def format_line(no, word, style, rng):
+    """단어 하나를 단어장 한 줄로 만듭니다."""
+    zh, pinyin, pos, ko = word
+    if style == STYLE_HACKERS:
+        stars = "★" * rng.randint(1, 3)
+        return f"{stars} {no} {zh} {pinyin} [{pos}] {ko} □"
+    if style == STYLE_NO_PINYIN:
+        return f"{no}. {zh} {pos} {ko}"
+    return f"{no}. {zh} {pinyin} {pos} {ko}"
+
+
+def make_word_lines(n_words, style_weights=None, seed=24):
+    """
+    [기능] 단어장 줄 n_words개를 만듭니다.
+    Returns: (줄 리스트, 줄마다 (한자, 형식) 리스트)
+    """
+    weights = style_weights or DEFAULT_STYLE_WEIGHTS
+    styles, probs = list(weights), list(weights.values())
+    words = seed_words()
+    rng = random.Random(seed)
+    lines, truth = [], []
+    for no in range(1, n_words + 1):
+        word = rng.choice(words)
+        style = rng.choices(styles, probs)[0]
+        lines.append(format_line(no, word, style, rng))
+        truth.append((word[0], style))
+    return lines, truth
+
+
+def make_txt(n_words, style_weights=None, seed=24):
+    """[기능] TXT 단어장 (UTF-8 바이트, 정답)"""
+    lines, truth = make_word_lines(n_words, style_weights, seed)
+    return ("\n".join(lines) + "\n").encode("utf-8"), truth
+
+
+def _font_runs(line):
+    """PDF에 쓸 때 한글/기호는 korea, 한자/병음은 china-s 글꼴로 나눔 (korea 글꼴엔 성조 문자/일부 한자가 없음)"""
+    runs = []
+    for ch in line:
+        if "\uac00" <= ch <= "\ud7a3" or ch in "★□~":
+            font = "korea"
+        elif ch.isspace() or ch.isdigit() or ch in ".,[]":
+            font = runs[-1][1] if runs else "korea"
+        else:
+            font = "china-s"
+        if runs and runs[-1][1] == font:
+            runs[-1][0] += ch
+        else:
+            runs.append([ch, font])
+    return runs
+
+
+def make_pdf(n_pages, words_per_page=30, two_column=False, style_weights=None, seed=24):
+    """
+    [기능] PDF 단어장 (바이트, 정답)
+    - two_column=True면 한 쪽을 왼쪽/오른쪽 두 단으로 나눠 씀 (교재에 흔한 2단 구성)
+    """
+    import fitz
+
+    lines, truth = make_word_lines(n_pages * words_per_page, style_weights, seed)
+    doc = fitz.open()
+    per_column = words_per_page // 2 if two_column else words_per_page
+    for p in range(n_pages):
+        page = doc.new_page()
+        page_lines = lines[p * words_per_page:(p + 1) * words_per_page]
+        for i, line in enumerate(page_lines):
+            column, row = divmod(i, per_column) if two_column else (0, i)
+            x, y = 40 + column * 280, 40 + row * 24
+            fontsize = 8 if two_column else 10
+            for text, font in _font_runs(line):
+                page.insert_text((x, y), text, fontname=font, fontsize=fontsize)
+                x += fitz.get_text_length(text, fontname=font, fontsize=fontsize)
+    data = doc.tobytes()
+    doc.close()
+    return data, truth
+
+
+class FakeUpload(io.BytesIO):
+    """Streamlit UploadedFile처럼 name/type/getvalue/read를 가진 업로드 파일"""
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+        self.type = "application/pdf" if name.lower().endswith(".pdf") else "text/plain"
+        self.file_id = name
+
+
+def make_score_rows(n_rows, n_users=500, days=730, seed=11):
+    """[날짜, 별명, 시험유형, 점수] 문자열 행을 시간순으로 n_rows개 만듭니다."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    step = days * 86400 / n_rows
+    rows = []
+    for i in range(n_rows):
+        ts = start + timedelta(seconds=int(i * step))
+        rows.append([
+            ts.strftime("%Y-%m-%d %H:%M:%S"),
+            f"user{rng.randrange(n_users):04d}",
+            rng.choice(EXAM_TYPES),
+            str(rng.randint(30, 100)),
+        ])
+    return rows
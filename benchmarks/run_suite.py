@@ -0,0 +1,292 @@
+# 경로: benchmarks/run_suite.py
+# [설명] 핫패스 벤치마크 묶음 실행기 (회귀 감지용)
+# - 단계: PDF 추출(2단 구성) / TXT 업로드 텍스트 변환 / 청크 파싱 / 토큰 분류 / 주관식 채점 / 대시보드 집계
+# - 데이터는 benchmarks/corpora.py의 합성 데이터 (seed 고정 -> 매번 같은 입력)
+# - 단계마다 결과가 정답(생성기가 알려준 단어 수/병음 누락 수 등)과 맞는지 먼저 확인
+# - 처리량(단위/초)과 최대 메모리(tracemalloc, 별도 1회 실행)를 표로 출력
+#   (시간은 여러 번 잰 값의 중앙값 -> 한 번 튄 값에 흔들리지 않음)
+# - benchmarks/baseline.json의 기준값보다 허용 범위 이상 느려지거나 메모리를 더 쓰면 종료 코드 1
+#   시간은 ms 그대로가 아니라 "단계 실행 사이사이에 번갈아 잰 보정 작업(calibrate) 대비 배수"로 비교
+#   -> 컴퓨터/부하가 달라 전체가 같이 빨라지거나 느려지는 것은 상쇄되고, 특정 단계만 느려진 것을 잡음
+# 실행 예: python -m benchmarks.run_suite
+#          python -m benchmarks.run_suite --only parse_chunks,check_answer
+#          python -m benchmarks.run_suite --update-baseline
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import re
+import statistics
+from collections import Counter
+from pathlib import Path
+
+from benchmarks.corpora import STYLE_NO_PINYIN, FakeUpload, make_pdf, make_score_rows, make_txt
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+DEFAULT_REPEAT = 7
+
+# 허용 범위: 시간은 측정 잡음이 커서 넉넉하게, 메모리는 좁게 (시간은 보정 단계 대비 배수 기준)
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.2
+# 아주 짧은/작은 단계가 잡음만으로 실패하지 않도록, 이만큼은 넘어야 회귀로 봄
+MIN_TIME_DELTA_MS = 5.0
+MIN_MEMORY_DELTA_MB = 1.0
+
+
+# =============================================================================
+# [단계] 각 함수는 (측정할 함수, 처리 단위 수, 결과 확인 함수)를 돌려줌
+# =============================================================================
+
+def _check_words(truth, ordered=True):
+    """파싱 결과(DataFrame)의 단어/병음 누락 수가 생성기 정답과 같은지 확인"""
+    expected = [zh for zh, _ in truth]
+    n_no_pinyin = sum(1 for _, style in truth if style == STYLE_NO_PINYIN)
+
+    def check(df):
+        words = df['zh'].tolist()
+        assert (words if ordered else sorted(words)) == (expected if ordered else sorted(expected)), "단어 목록이 다릅니다"
+        assert int(df['flags'].str.contains("NO_PINYIN").sum()) == n_no_pinyin, "병음 누락 수가 다릅니다"
+    return check
+
+
+def stage_pdf_extract(scale):
+    """2단 구성 PDF -> load_text_from_pdf (쪽/초)"""
+    from core.pdf_loader import load_text_from_pdf
+    from core.vocab_parser import parse_text_by_chunks
+
+    n_pages = 40 * scale
+    data, truth = make_pdf(n_pages, two_column=True)
+    check_words = _check_words(truth, ordered=False) # 2단은 줄 단위로 좌/우가 번갈아 읽힘
+
+    def check(text):
+        assert not text.startswith("[CORRUPTED_FILE]"), "정상 PDF가 깨짐으로 판정되었습니다"
+        check_words(parse_text_by_chunks(text, "HSK", "bench"))
+    return lambda: load_text_from_pdf(FakeUpload(data, "bench.pdf")), n_pages, check
+
+
+def stage_upload_txt(scale):
+    """TXT 업로드 -> change_text_from_upload (단어/초)"""
+    from core.text_change import change_text_from_upload
+
+    n_words = 20000 * scale
+    data, _ = make_txt(n_words)
+
+    def check(text):
+        assert text == data.decode("utf-8"), "TXT 변환 결과가 원문과 다릅니다"
+    return lambda: change_text_from_upload(FakeUpload(data, "bench.txt")), n_words, check
+
+
+def stage_parse_chunks(scale):
+    """★/□ 잡음, 병음 누락이 섞인 단어장 텍스트 -> parse_text_by_chunks (단어/초)"""
+    from core.vocab_parser import parse_text_by_chunks
+
+    n_words = 20000 * scale
+    data, truth = make_txt(n_words)
+    text = data.decode("utf-8")
+    return lambda: parse_text_by_chunks(text, "HSK", "bench"), n_words, _check_words(truth)
+
+
+def stage_clean_chunk(scale):
+    """단어 뒤 청크(병음/품사/뜻) -> clean_chunk_content (청크/초, 토큰 분류 캐시를 비운 상태에서)"""
+    from core.vocab_parser import HANZI_ANCHOR_RE, classify_token, clean_chunk_content
+
+    data, truth = make_txt(20000 * scale)
+    text = data.decode("utf-8")
+    matches = list(HANZI_ANCHOR_RE.finditer(text))
+    ends = [m.start() for m in matches[1:]] + [len(text)]
+    chunks = [text[m.end():end] for m, end in zip(matches, ends)]
+
+    def run():
+        classify_token.cache_clear()
+        return [clean_chunk_content(chunk) for chunk in chunks]
+
+    def check(results):
+        n_no_pinyin = sum(1 for _, style in truth if style == STYLE_NO_PINYIN)
+        assert sum(1 for pinyin, _, _ in results if not pinyin) == n_no_pinyin, "병음 누락 수가 다릅니다"
+        assert all(ko for _, _, ko in results), "뜻이 빠진 청크가 있습니다"
+    return run, len(chunks), check
+
+
+def stage_check_answer(scale):
+    """주관식 답안 하나씩 채점 (features/vocab_quiz.check_answer와 같은 경로, 문제/초)"""
+    from benchmarks.bench_grading import check_particle_folding, legacy_check_answer, make_quiz
+    from core.grading import QUIZ_ZH_TO_KO, build_answer_set, is_correct_answer
+
+    check_particle_folding() # 조사 접기 회귀 사례 (한 글자 정답 등)
+    quiz = make_quiz(5000 * scale)
+    pairs = [
+        (q["user_ans"], str(q["item"]["ko"] if q["type"] == QUIZ_ZH_TO_KO else q["item"]["zh"]))
+        for q in quiz
+    ]
+
+    def check(results):
+        for (user_ans, correct), ok in zip(pairs, results):
+            if legacy_check_answer(user_ans.strip(), correct):
+                assert ok, (user_ans, correct)
+    return lambda: [is_correct_answer(u, build_answer_set(c)) for u, c in pairs], len(pairs), check
+
+
+def stage_dashboard(scale):
+    """점수 기록 -> 저장소 구축 + 별명 20명 대시보드 집계 (행/초)"""
+    from services import score_store
+
+    rows = make_score_rows(100000 * scale)
+    counts = Counter(row[1] for row in rows)
+    nicknames = sorted(counts)[:20]
+    expected = {n: counts[n] for n in nicknames}
+
+    def run():
+        score_store.rebuild_store(rows)
+        return {n: score_store.summarize(score_store.load_history(n))["total"] for n in nicknames}
+
+    def check(totals):
+        assert totals == expected, "대시보드 집계 결과가 다릅니다"
+    return run, len(rows), check
+
+
+STAGES = {
+    "pdf_extract": ("쪽", stage_pdf_extract),
+    "upload_txt": ("단어", stage_upload_txt),
+    "parse_chunks": ("단어", stage_parse_chunks),
+    "clean_chunk": ("청크", stage_clean_chunk),
+    "check_answer": ("문제", stage_check_answer),
+    "dashboard": ("행", stage_dashboard),
+}
+
+
+# =============================================================================
+# [측정 / 기준값 비교]
+# =============================================================================
+
+_CALIBRATE_RE = re.compile(r"(\d+)\.\s*(\S+)")
+
+
+def calibrate():
+    """
+    보정 단계: 저장소 코드와 상관없는 고정 작업(문자열 만들기/정규식/정렬/dict)
+    -> 이 컴퓨터, 지금 부하에서 파이썬이 얼마나 빠른지의 기준 (단계 시간을 이 값으로 나눠 비교)
+    """
+    lines = [f"{i}. 单词{i % 997} dānci 명 뜻{i}" for i in range(20000)]
+    counts = {}
+    for line in lines:
+        m = _CALIBRATE_RE.match(line)
+        counts[m.group(2)] = counts.get(m.group(2), 0) + int(m.group(1))
+    return sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+def measure(fn, repeat):
+    """
+    실행 시간 중앙값(ms), 보정 작업 대비 배수(중앙값), tracemalloc 최대 메모리(MB, 별도 1회), 결과를 돌려줌
+    (보정 작업을 매번 바로 앞에 실행해, 측정 중에 부하가 바뀌어도 배수는 덜 흔들림)
+    """
+    result = fn() # 준비 운동 (import, 파일 캐시 등)
+    calibrate()
+    times, ratios = [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        calibrate()
+        t1 = time.perf_counter()
+        result = fn()
+        t2 = time.perf_counter()
+        times.append(t2 - t1)
+        ratios.append((t2 - t1) / (t1 - t0))
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times) * 1000, statistics.median(ratios), peak / 1e6, result
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def find_regressions(results, baseline, time_tol, mem_tol):
+    """
+    기준값보다 허용 범위를 넘은 단계 목록 [(단계, 설명), ...]
+    시간: 보정 작업 대비 배수로 비교 (기준값에 배수가 없는 단계는 시간 비교 생략)
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            continue
+        if base.get("ratio"):
+            expected_ms = current["ms"] / current["ratio"] * base["ratio"] # 이번 보정 속도로 환산한 기준 시간
+            if current["ms"] > max(expected_ms * (1 + time_tol), expected_ms + MIN_TIME_DELTA_MS):
+                regressions.append((name, f"시간 보정 배수 {base['ratio']:.2f} -> {current['ratio']:.2f}"
+                                          f" ({expected_ms:.1f} ms 예상, {current['ms']:.1f} ms)"))
+        if current["peak_mb"] > max(base["peak_mb"] * (1 + mem_tol), base["peak_mb"] + MIN_MEMORY_DELTA_MB):
+            regressions.append((name, f"메모리 {base['peak_mb']:.1f} -> {current['peak_mb']:.1f} MB"))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫패스 벤치마크 묶음 (기준값 회귀 검사)")
+    parser.add_argument("--only", default="", help="실행할 단계 (쉼표로 구분, 기본: 전체)")
+    parser.add_argument("--scale", type=int, default=1, help="데이터 크기 배수 (기준값은 같은 배수끼리만 비교)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="시간 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.only.split(",") if n.strip()] or list(STAGES)
+    unknown = [n for n in names if n not in STAGES]
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(unknown)} (가능: {', '.join(STAGES)})")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["VOCA_CACHE_DIR"] = tmp # 대시보드 저장소 등은 임시 폴더에
+        print("단계                   처리량        시간  보정 배수   최대 메모리")
+        for name in names:
+            unit, stage = STAGES[name]
+            fn, n_units, check = stage(args.scale)
+            ms, ratio, peak_mb, result = measure(fn, args.repeat)
+            check(result)
+            results[name] = {"ms": round(ms, 2), "ratio": round(ratio, 3), "peak_mb": round(peak_mb, 2), "units": n_units}
+            rate = n_units / (ms / 1000)
+            print(f"{name:<14}{rate:>12,.0f} {unit}/s{ms:>9.1f} ms{ratio:>9.2f}배{peak_mb:>9.1f} MB")
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        stages = dict(baseline["stages"]) if baseline and baseline.get("scale") == args.scale else {}
+        stages.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"scale": args.scale, "stages": stages}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    if baseline is None:
+        print("기준값 파일이 없습니다. (--update-baseline으로 저장)")
+        return
+    if baseline.get("scale") != args.scale:
+        print(f"기준값의 데이터 배수({baseline.get('scale')})가 달라 비교하지 않습니다.")
+        return
+
+    if not all(baseline["stages"].get(name, {}).get("ratio") for name in results):
+        print("기준값에 보정 배수가 없는 단계는 시간을 비교하지 않습니다. (--update-baseline으로 다시 저장)")
+    regressions = find_regressions(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("❌ 기준값보다 느려지거나 메모리를 더 쓴 단계:")
+        for name, detail in regressions:
+            print(f"  - {name}: {detail}")
+        sys.exit(1)
+    print("✅ 모든 단계가 기준값 안에 있습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+# 경로: core/dict_index.py
+# [설명] 오프라인 중-한 사전 인덱스 (파일 하나짜리 압축 바이너리 + mmap 조회)
+# - 한자 트라이(trie): 정확히 일치하는 단어 + 그 한자로 시작하는 단어(접두어) 검색
+# - 한국어 뜻 역색인(inverted index): 뜻 단어(정렬됨) -> 항목 번호 목록, 이진 탐색 + 접두어 검색
+# - 파일을 통째로 읽지 않고 mmap으로 필요한 바이트만 읽으므로, 열기/조회 모두 수 마이크로초 단위
+#
+# 파일 구조 (모든 정수는 little-endian uint32, 노드의 entry_id만 int32)
+#   [헤더] MAGIC + 개수 5개 + 구역 시작 위치 6개
+#   [문자열] 모든 UTF-8 문자열을 이어 붙인 덩어리
+#   [항목]   (한자, 병음, 품사, 뜻) 각각의 (시작, 길이)
+#   [노드]   트라이 노드: (첫 간선 번호, 간선 수, 항목 번호 또는 -1)
+#   [간선]   (글자 코드포인트, 자식 노드) - 노드마다 코드포인트 순으로 정렬
+#   [용어]   한국어 뜻 단어: (문자열 시작, 길이, 목록 시작, 목록 길이) - UTF-8 바이트 순으로 정렬
+#   [목록]   항목 번호
+
+import bisect
+import mmap
+import re
+import struct
+
+MAGIC = b"VOCADIC1"
+
+_HEADER = struct.Struct("<8s11I")
+_ENTRY = struct.Struct("<8I")
+_NODE = struct.Struct("<IIi")
+_EDGE = struct.Struct("<II")
+_TERM = struct.Struct("<4I")
+_POSTING = struct.Struct("<I")
+
+_GLOSS_SPLIT_RE = re.compile(r"[,;/·、]")
+_PAREN_RE = re.compile(r"\([^)]*\)|（[^）]*）")
+_HANZI_RE = re.compile(r"[㐀-鿿]")
+
+
+def gloss_terms(ko):
+    """
+    [기능] 한국어 뜻 문자열을 검색용 단어로 나눕니다.
+    예: "아끼다, 소중히 여기다" -> {"아끼다", "소중히 여기다", "소중히", "여기다"}
+    """
+    terms = set()
+    for phrase in _GLOSS_SPLIT_RE.split(_PAREN_RE.sub("", ko)):
+        phrase = phrase.replace("~", "").strip()
+        if not phrase:
+            continue
+        terms.add(phrase)
+        words = phrase.split()
+        if len(words) > 1:
+            terms.update(w for w in words if len(w) >= 2)
+    return terms
+
+
+def load_tsv(paths):
+    """
+    [기능] 사전 TSV(한자, 병음, 품사, 뜻)를 읽어 항목 리스트로 돌려줍니다.
+    '#'으로 시작하는 줄과 빈 줄은 건너뛰고, 같은 한자가 여러 번 나오면 처음 것만 씁니다.
+    """
+    entries = []
+    seen = set()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                cols = line.split("\t")
+                if len(cols) != 4:
+                    raise ValueError(f"{path}: 열이 4개가 아닌 줄 -> {line!r}")
+                zh, pinyin, pos, ko = (c.strip() for c in cols)
+                if zh in seen:
+                    continue
+                seen.add(zh)
+                entries.append((zh, pinyin, pos, ko))
+    return entries
+
+
+# =============================================================================
+# [만들기] 항목 리스트 -> 바이너리 파일
+# =============================================================================
+
+def build_index(entries, out_path):
+    """
+    [기능] (한자, 병음, 품사, 뜻) 항목 리스트로 사전 인덱스 파일을 만듭니다.
+    """
+    strings = bytearray()
+
+    def add_string(text):
+        data = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    # 1. 항목 + 문자열
+    entry_rows = []
+    for entry in entries:
+        row = []
+        for text in entry:
+            row.extend(add_string(text))
+        entry_rows.append(row)
+
+    # 2. 한자 트라이 (노드 = {글자: 자식}, 항목 번호)
+    children = [{}]
+    node_entry = [-1]
+    for entry_id, (zh, _, _, _) in enumerate(entries):
+        node = 0
+        for ch in zh:
+            child = children[node].get(ch)
+            if child is None:
+                child = len(children)
+                children[node][ch] = child
+                children.append({})
+                node_entry.append(-1)
+            node = child
+        node_entry[node] = entry_id
+
+    node_rows = []
+    edge_rows = []
+    for node, edges in enumerate(children):
+        node_rows.append((len(edge_rows), len(edges), node_entry[node]))
+        edge_rows.extend(sorted((ord(ch), child) for ch, child in edges.items()))
+
+    # 3. 한국어 뜻 역색인 (UTF-8 바이트 순 정렬)
+    postings_by_term = {}
+    for entry_id, (_, _, _, ko) in enumerate(entries):
+        for term in gloss_terms(ko):
+            postings_by_term.setdefault(term, []).append(entry_id)
+
+    term_rows = []
+    posting_ids = []
+    for term in sorted(postings_by_term, key=lambda t: t.encode("utf-8")):
+        ids = postings_by_term[term]
+        term_rows.append((*add_string(term), len(posting_ids), len(ids)))
+        posting_ids.extend(ids)
+
+    # 4. 파일 쓰기
+    off_strings = _HEADER.size
+    off_entries = off_strings + len(strings)
+    off_nodes = off_entries + _ENTRY.size * len(entry_rows)
+    off_edges = off_nodes + _NODE.size * len(node_rows)
+    off_terms = off_edges + _EDGE.size * len(edge_rows)
+    off_postings = off_terms + _TERM.size * len(term_rows)
+
+    with open(out_path, "wb") as f:
+        f.write(_HEADER.pack(
+            MAGIC, len(entry_rows), len(node_rows), len(edge_rows), len(term_rows), len(posting_ids),
+            off_strings, off_entries, off_nodes, off_edges, off_terms, off_postings,
+        ))
+        f.write(strings)
+        for row in entry_rows:
+            f.write(_ENTRY.pack(*row))
+        for row in node_rows:
+            f.write(_NODE.pack(*row))
+        for row in edge_rows:
+            f.write(_EDGE.pack(*row))
+        for row in term_rows:
+            f.write(_TERM.pack(*row))
+        for entry_id in posting_ids:
+            f.write(_POSTING.pack(entry_id))
+
+
+# =============================================================================
+# [조회] mmap으로 연 사전 인덱스
+# =============================================================================
+
+class DictIndex:
+    """
+    [기능] build_index()로 만든 파일을 mmap으로 열어 조회합니다.
+    조회 결과 항목은 dict(zh, pinyin, pos, ko)
+    """
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(self._mm, 0)
+        if header[0] != MAGIC:
+            self.close()
+            raise ValueError(f"사전 인덱스 파일이 아닙니다: {path}")
+        (_, self.n_entries, self._n_nodes, self._n_edges, self._n_terms, self._n_postings,
+         self._off_strings, self._off_entries, self._off_nodes, self._off_edges,
+         self._off_terms, self._off_postings) = header
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self):
+        return self.n_entries
+
+    # -------------------------------------------------------------------------
+    def _string(self, offset, length):
+        start = self._off_strings + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def entry(self, entry_id):
+        zh_o, zh_l, py_o, py_l, pos_o, pos_l, ko_o, ko_l = _ENTRY.unpack_from(self._mm, self._off_entries + _ENTRY.size * entry_id)
+        return {
+            "zh": self._string(zh_o, zh_l),
+            "pinyin": self._string(py_o, py_l),
+            "pos": self._string(pos_o, pos_l),
+            "ko": self._string(ko_o, ko_l),
+        }
+
+    # -------------------------------------------------------------------------
+    # 한자 트라이
+    def _node(self, node):
+        return _NODE.unpack_from(self._mm, self._off_nodes + _NODE.size * node)
+
+    def _child(self, node, codepoint):
+        first, count, _ = self._node(node)
+        lo, hi = first, first + count
+        while lo < hi: # 간선은 코드포인트 순 -> 이진 탐색
+            mid = (lo + hi) // 2
+            cp, child = _EDGE.unpack_from(self._mm, self._off_edges + _EDGE.size * mid)
+            if cp == codepoint:
+                return child
+            if cp < codepoint:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _walk(self, word):
+        node = 0
+        for ch in word:
+            node = self._child(node, ord(ch))
+            if node is None:
+                return None
+        return node
+
+    def lookup_hanzi(self, word):
+        """[기능] 한자가 정확히 일치하는 항목 (없으면 None)"""
+        node = self._walk(word)
+        if node is None:
+            return None
+        entry_id = self._node(node)[2]
+        return self.entry(entry_id) if entry_id >= 0 else None
+
+    def prefix_hanzi(self, prefix, limit=10):
+        """[기능] prefix로 시작하는 한자 단어들 (짧은 단어 먼저, 최대 limit개)"""
+        node = self._walk(prefix)
+        if node is None:
+            return []
+        results = []
+        queue = [node]
+        while queue and len(results) < limit: # 너비 우선 -> 짧은 단어부터
+            next_queue = []
+            for current in queue:
+                first, count, entry_id = self._node(current)
+                if entry_id >= 0:
+                    results.append(self.entry(entry_id))
+                    if len(results) >= limit:
+                        break
+                for edge in range(first, first + count):
+                    next_queue.append(_EDGE.unpack_from(self._mm, self._off_edges + _EDGE.size * edge)[1])
+            queue = next_queue
+        return results
+
+    # -------------------------------------------------------------------------
+    # 한국어 뜻 역색인
+    def _term(self, index):
+        t_off, t_len, p_off, p_len = _TERM.unpack_from(self._mm, self._off_terms + _TERM.size * index)
+        start = self._off_strings + t_off
+        return self._mm[start:start + t_len], p_off, p_len
+
+    def _postings(self, p_off, p_len):
+        start = self._off_postings + _POSTING.size * p_off
+        return struct.unpack_from(f"<{p_len}I", self._mm, start)
+
+    def lookup_korean(self, query, limit=10):
+        """
+        [기능] 한국어 뜻으로 찾습니다. 뜻 단어가 정확히 같은 항목 먼저, 그다음 query로 시작하는 뜻 단어의 항목
+        예: "아끼다" -> 爱惜, 节约, 省, 珍惜 ... / "아끼" -> 위 항목 + "아끼고 보호하다"(爱护)
+        """
+        key = query.strip().replace("~", "").encode("utf-8")
+        if not key:
+            return []
+
+        terms = _TermView(self)
+        start = bisect.bisect_left(terms, key)
+        exact, prefixed = [], []
+        for index in range(start, self._n_terms):
+            term, p_off, p_len = self._term(index)
+            if not term.startswith(key):
+                break
+            (exact if term == key else prefixed).extend(self._postings(p_off, p_len))
+
+        results = []
+        seen = set()
+        for entry_id in exact + sorted(set(prefixed)):
+            if entry_id not in seen:
+                seen.add(entry_id)
+                results.append(self.entry(entry_id))
+                if len(results) >= limit:
+                    break
+        return results
+
+    # -------------------------------------------------------------------------
+    def search(self, query, limit=10):
+        """
+        [기능] 검색어가 한자면 한자 트라이(정확히 일치 -> 접두어), 아니면 한국어 뜻 역색인으로 찾습니다.
+        """
+        query = query.strip()
+        if not query:
+            return []
+        if _HANZI_RE.search(query):
+            return self.prefix_hanzi(query, limit=limit) # 정확히 일치하는 단어가 가장 먼저 나옴
+        return self.lookup_korean(query, limit=limit)
+
+
+class _TermView:
+    """bisect가 정렬된 용어 구역을 리스트처럼 볼 수 있게 해주는 얇은 래퍼"""
+    def __init__(self, index):
+        self._index = index
+
+    def __len__(self):
+        return self._index._n_terms
+
+    def __getitem__(self, i):
+        return self._index._term(i)[0]
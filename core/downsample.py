@@ -0,0 +1,74 @@
+# 경로: core/downsample.py
+# [설명] 긴 시계열(점수 추이)을 화면에 그릴 만큼만 줄이는 다운샘플링
+# - LTTB(Largest-Triangle-Three-Buckets): 모양(최고/최저점, 꺾이는 지점)을 최대한 살리면서 점 개수를 고정
+# - 시험유형별로 따로 줄여서 유형끼리 점 배분이 섞이지 않게 함
+# - 보이는 기간(start~end)만 잘라낸 뒤 줄이므로, 기간을 좁히면 자동으로 더 촘촘하게 보임
+
+import numpy as np
+import pandas as pd
+
+# 시험유형 하나당 화면에 보낼 최대 점 개수
+MAX_POINTS_PER_SERIES = 400
+
+
+def lttb_indices(x, y, threshold):
+    """
+    [기능] LTTB 알고리즘으로 남길 점의 인덱스(오름차순)를 돌려줍니다.
+    - x: 정렬된 숫자 배열(시간은 정수 변환), y: 값 배열
+    - 첫 점과 마지막 점은 항상 남깁니다.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # 첫/끝 점을 뺀 나머지를 (threshold - 2)개 구간으로 나눔
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0] = 0
+    picked[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # 다음 구간의 평균점 (마지막 구간이면 끝 점)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            avg_x = x[nlo:nhi].mean()
+            avg_y = y[nlo:nhi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # 직전에 고른 점 a, 다음 구간 평균점과 삼각형 넓이가 가장 큰 점 선택
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+
+    return picked
+
+
+def downsample_by_group(df, x_col, y_col, group_col, max_points=MAX_POINTS_PER_SERIES, start=None, end=None):
+    """
+    [기능] 그룹(시험유형)별로 보이는 기간만 잘라 LTTB로 줄인 DataFrame을 돌려줍니다.
+    - df는 x_col(datetime) 기준 시간순이어야 합니다.
+    Returns: (줄인 DataFrame, 줄이기 전 점 개수)
+    """
+    if start is not None:
+        df = df[df[x_col] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df[x_col] <= pd.Timestamp(end)]
+
+    parts = []
+    for _, part in df.groupby(group_col, sort=False):
+        if len(part) > max_points:
+            x = part[x_col].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+            idx = lttb_indices(x, part[y_col].to_numpy(), max_points)
+            part = part.iloc[idx]
+        parts.append(part)
+
+    if not parts:
+        return df, 0
+    return pd.concat(parts, ignore_index=True), len(df)
@@ -0,0 +1,225 @@
+# 경로: core/grading.py
+# [설명] 주관식 단어 시험 채점 엔진
+# - 시험을 만들 때 문제마다 정답 후보를 한 번만 정규화해 frozenset으로 고정 (build_answer_set)
+#   -> 결과 화면이 리런될 때마다 정답 문자열을 다시 쪼개지 않음
+# - 정규화: 전각->반각(NFKC), 소문자, 괄호 안 보충 설명/문장부호/공백 제거, 답 끝의 조사(을/를/이/가 ...) 접기
+#   -> 조사는 앞 글자 받침과 맞을 때만(사과를 O, 사과을 X), 한 글자 정답에는 두 글자 조사만 접음 (정답 "사"에 "사과" X)
+# - grade_submission(): 제출한 답안 전체를 한 번에 채점해 결과 표(DataFrame)로 돌려줌
+# - 오타 허용(선택): 한글/로마자 답은 자모 단위 편집 거리가 max_typos 이하이면 정답 처리 (한자 답은 제외)
+
+import re
+import unicodedata
+
+import pandas as pd
+
+QUIZ_ZH_TO_KO = "zh_to_ko"   # 한자 -> 뜻 쓰기
+QUIZ_KO_TO_ZH = "ko_to_zh"   # 뜻 -> 한자 쓰기
+
+# 정답 문자열을 후보로 나누는 구분자 (예전 check_answer와 같은 쉼표/슬래시/공백 + 세미콜론/가운뎃점)
+_SPLIT_RE = re.compile(r"[,/;·、，\s]+")
+_PAREN_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+
+# 끝에 붙은 조사 (긴 것부터 확인)
+TRAILING_PARTICLES = ("으로", "에서", "에게", "까지", "부터", "처럼", "을", "를", "이", "가", "은", "는", "의", "에", "도", "로", "와", "과")
+
+# 앞 글자 받침에 따라 모양이 바뀌는 조사 (True: 받침 있는 글자 뒤, False: 받침 없는 글자 뒤)
+_PARTICLE_AFTER_BATCHIM = {"을": True, "은": True, "이": True, "과": True, "를": False, "는": False, "가": False, "와": False}
+
+# 이보다 짧은(음절 기준) 정답에는 한 글자 조사를 접지 않음
+# (정답 "사"에 "사과", "가"에 "가을", "수"에 "수도", "눈"에 "눈이"처럼 다른 단어/말이 되어버림)
+MIN_STEM_FOR_SHORT_PARTICLE = 2
+
+# 오타 허용 시 이보다 짧은(자모 기준) 정답은 정확히 맞아야 함 (짧은 단어는 한 글자 차이로 다른 단어가 됨)
+MIN_TYPO_LENGTH = 4
+
+_HAN_RE = re.compile(r"[㐀-鿿]")
+
+RESULT_COLUMNS = ["type", "user_ans", "normalized", "is_correct", "typo_distance", "excluded"]
+
+
+def normalize_answer(text):
+    """
+    [기능] 답/정답 하나를 비교용으로 정규화합니다.
+    예: " 넓다! " -> "넓다", "ＡＢＣ" -> "abc", "爱 惜" -> "爱惜"
+    """
+    text = unicodedata.normalize("NFKC", str(text)).lower()
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+def _has_batchim(syllable):
+    """한글 음절의 받침 유무 (한글 음절이 아니면 None)"""
+    code = ord(syllable) - 0xAC00
+    if 0 <= code < 11172:
+        return code % 28 != 0
+    return None
+
+
+def _particle_fits(stem, particle):
+    """조사를 떼고 남은 말(stem) 뒤에 이 조사가 올 수 있는지"""
+    if len(stem) < MIN_STEM_FOR_SHORT_PARTICLE and len(particle) < 2:
+        return False
+    after_batchim = _PARTICLE_AFTER_BATCHIM.get(particle)
+    if after_batchim is None:
+        return True
+    batchim = _has_batchim(stem[-1])
+    return batchim is None or batchim == after_batchim
+
+
+def _folded_forms(text):
+    """끝의 조사를 뗀 형태들 (긴 조사부터, 앞 말과 맞는 조사만)"""
+    for particle in TRAILING_PARTICLES:
+        if text.endswith(particle) and len(text) > len(particle):
+            stem = text[:-len(particle)]
+            if _particle_fits(stem, particle):
+                yield stem
+
+
+def fold_particle(text):
+    """
+    [기능] 끝의 조사를 뗀 형태 (앞 글자 받침과 맞는 조사일 때만, 아니면 그대로)
+    예: "사과를" -> "사과", "사과을" -> "사과을", "사과" -> "사과" (한 글자 "사"에 조사 "과"는 접지 않음)
+    """
+    return next(_folded_forms(text), text)
+
+
+def build_answer_set(correct_answer):
+    """
+    [기능] 정답 문자열 하나를 정규화된 정답 후보 집합으로 만듭니다. (시험을 만들 때 한 번)
+    - 쉼표/슬래시/공백으로 나눈 각 단어 (예전 check_answer와 같음) + 구분자 없이 붙인 전체 구절
+    - 괄호 안 보충 설명을 뺀 형태와 넣은 형태 모두
+    (조사 접기는 답 쪽에만 적용: 정답 "아이"에서 "이"를 떼면 "아"도 정답이 되어버림)
+    예: "넓다 광대하다" -> {"넓다", "광대하다", "넓다광대하다"} / "넓다, 광대하다" -> {"넓다", "광대하다"}
+    """
+    text = str(correct_answer)
+    variants = {text, _PAREN_RE.sub(" ", text)}
+    candidates = set()
+    for variant in variants:
+        for phrase in re.split(r"[,/;·、，]+", variant):
+            candidates.add(normalize_answer(phrase))
+        candidates.update(normalize_answer(word) for word in _SPLIT_RE.split(variant))
+    candidates.discard("")
+    return frozenset(candidates)
+
+
+def prepare_question(item, quiz_type):
+    """
+    [기능] 단어 하나와 문제 유형으로 정답 후보 집합을 만듭니다.
+    Returns: (화면에 보여줄 정답, frozenset 정답 후보)
+    """
+    correct = str(item['ko'] if quiz_type == QUIZ_ZH_TO_KO else item['zh'])
+    return correct, build_answer_set(correct)
+
+
+# =============================================================================
+# [오타 허용] 편집 거리 (자모 단위, 상한 k를 넘으면 바로 중단)
+# =============================================================================
+
+def _jamo(text):
+    """한글 음절을 자모로 풀어 한 글자 오타가 글자 전체 차이가 되지 않게 함"""
+    return unicodedata.normalize("NFD", text)
+
+
+def bounded_edit_distance(a, b, k):
+    """
+    [기능] a, b의 레벤슈타인 거리를 돌려주되, k를 넘으면 k + 1을 돌려줍니다. (대각선 띠만 계산: O(k * 길이))
+    """
+    if abs(len(a) - len(b)) > k:
+        return k + 1
+    if len(a) > len(b):
+        a, b = b, a
+    big = k + 1
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        lo, hi = max(1, i - k), min(len(b), i + k)
+        cur = [big] * (len(b) + 1)
+        if lo == 1:
+            cur[0] = i
+        row_min = cur[0] if lo == 1 else big
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            cost = 0 if ca == b[j - 1] else 1
+            value = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            cur[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > k:
+            return big
+        prev = cur
+    return min(prev[len(b)], big)
+
+
+def typo_distance(answer, candidates, max_typos):
+    """[기능] 답과 가장 가까운 정답 후보까지의 자모 편집 거리 (max_typos 초과면 None, 한자 후보는 제외)"""
+    if max_typos <= 0 or not answer or _HAN_RE.search(answer):
+        return None
+    jamo_answer = _jamo(answer)
+    best = None
+    for candidate in candidates:
+        if _HAN_RE.search(candidate):
+            continue
+        jamo_candidate = _jamo(candidate)
+        if len(jamo_candidate) < MIN_TYPO_LENGTH:
+            continue
+        d = bounded_edit_distance(jamo_answer, jamo_candidate, max_typos)
+        if d <= max_typos and (best is None or d < best):
+            best = d
+            if d == 1:
+                break
+    return best
+
+
+# =============================================================================
+# [채점] 제출 답안 전체를 한 번에
+# =============================================================================
+
+def _matches(answer, answer_set):
+    if not answer:
+        return False
+    return answer in answer_set or any(stem in answer_set for stem in _folded_forms(answer))
+
+
+def is_correct_answer(user_input, answer_set):
+    """[기능] 답 하나가 정답 후보 집합에 있는지 (조사를 뗀 형태도 확인)"""
+    return _matches(normalize_answer(user_input), answer_set)
+
+
+def grade_submission(questions, max_typos=0):
+    """
+    [기능] 시험 문제 리스트(prepare_question으로 만든 'answers'와 'user_ans', 'exclude', 'type' 포함)를 한 번에 채점합니다.
+    Returns: DataFrame[type, user_ans, normalized, is_correct, typo_distance, excluded] (문제 순서 그대로)
+      - typo_distance: 오타 허용으로 정답 처리된 경우의 편집 거리 (그 외 0 또는 NaN)
+    """
+    types, user_answers, normalized, correct, distances, excluded = [], [], [], [], [], []
+    for q in questions:
+        answer_set = q['answers']
+        user = str(q.get('user_ans') or "").strip()
+        norm = normalize_answer(user)
+        is_excluded = bool(q.get('exclude'))
+
+        ok = _matches(norm, answer_set)
+        distance = 0 if ok else None
+        if not ok and norm and max_typos > 0:
+            distance = typo_distance(norm, answer_set, max_typos)
+            ok = distance is not None
+
+        types.append(q.get('type'))
+        user_answers.append(user)
+        normalized.append(norm)
+        correct.append(ok and not is_excluded)
+        distances.append(distance)
+        excluded.append(is_excluded)
+
+    return pd.DataFrame({
+        "type": types,
+        "user_ans": user_answers,
+        "normalized": normalized,
+        "is_correct": pd.array(correct, dtype="bool"),
+        "typo_distance": pd.array(distances, dtype="Int8"),
+        "excluded": pd.array(excluded, dtype="bool"),
+    }, columns=RESULT_COLUMNS)
+
+
+def summarize_grades(results):
+    """[기능] 채점 결과 표로 (맞힌 수, 채점한 문제 수, 제외한 문제 수)"""
+    n_excluded = int(results["excluded"].sum())
+    return int(results["is_correct"].sum()), len(results) - n_excluded, n_excluded
@@ -0,0 +1,184 @@
+# 경로: core/json_stream.py
+# [설명] 스트리밍으로 조금씩 도착하는 JSON 객체를 필드 단위로 바로바로 꺼내는 파서
+# - 최상위가 객체({...})인 응답만 대상 (AI 채점 결과 등)
+# - 문자열 값은 도착하는 대로 '부분 값'을 알려주고, 값이 닫히는 순간 '완성 값'을 알려줌
+# - 숫자/불리언/배열/중첩 객체는 값이 끝났을 때 json.loads로 한 번에 변환
+# - 여는 '{' 앞의 잡음(```json 등)은 건너뜀
+#
+# 사용 예:
+#   parser = JSONObjectStreamParser()
+#   for chunk in chunks:
+#       for event in parser.feed(chunk):
+#           ...  # ("partial", "correction", "我们...") / ("field", "score", 78)
+
+import json
+
+EVENT_PARTIAL = "partial"  # (EVENT_PARTIAL, 키, 지금까지 받은 문자열)
+EVENT_FIELD = "field"      # (EVENT_FIELD, 키, 완성된 값)
+
+# 파서 상태
+_BEFORE_OBJECT = 0
+_EXPECT_KEY = 1
+_IN_KEY = 2
+_EXPECT_COLON = 3
+_EXPECT_VALUE = 4
+_IN_STRING_VALUE = 5
+_IN_OTHER_VALUE = 6
+_AFTER_VALUE = 7
+_DONE = 8
+
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class JSONObjectStreamParser:
+    """
+    [기능] 최상위 JSON 객체를 조각(chunk)별로 받아 필드 이벤트를 돌려줍니다.
+    잘못된 JSON을 만나면 ValueError를 냅니다.
+    """
+    def __init__(self):
+        self._state = _BEFORE_OBJECT
+        self._key = None
+        self._buf = []          # 현재 키/문자열 값 (이스케이프 해제된 글자)
+        self._raw = []          # 문자열 외 값의 원문
+        self._escape = None     # 문자열 안 이스케이프 처리 중: None / "" / "u" + 16진수
+        self._depth = 0         # 문자열 외 값 안의 괄호 깊이
+        self._raw_in_str = False
+        self._raw_escape = False
+        self.result = {}        # 지금까지 완성된 필드
+
+    @property
+    def done(self):
+        return self._state == _DONE
+
+    def feed(self, chunk):
+        """[기능] 조각 하나를 처리하고 새로 생긴 이벤트 리스트를 돌려줍니다."""
+        events = []
+        string_changed = False
+
+        for ch in chunk:
+            state = self._state
+
+            if state == _BEFORE_OBJECT:
+                if ch == "{":
+                    self._state = _EXPECT_KEY
+            elif state == _DONE:
+                continue # 닫힌 뒤의 잡음(``` 등)은 무시
+
+            elif state in (_IN_KEY, _IN_STRING_VALUE):
+                closed = self._feed_string_char(ch)
+                if state == _IN_STRING_VALUE:
+                    string_changed = True
+                if closed:
+                    text = "".join(self._buf)
+                    self._buf = []
+                    if state == _IN_KEY:
+                        self._key = text
+                        self._state = _EXPECT_COLON
+                    else:
+                        string_changed = False
+                        self._finish_value(text, events)
+
+            elif state == _EXPECT_KEY:
+                if ch == '"':
+                    self._state = _IN_KEY
+                elif ch == "}" and not self.result:
+                    self._state = _DONE
+                elif not ch.isspace():
+                    raise ValueError(f"키 자리에 잘못된 문자: {ch!r}")
+
+            elif state == _EXPECT_COLON:
+                if ch == ":":
+                    self._state = _EXPECT_VALUE
+                elif not ch.isspace():
+                    raise ValueError(f"':' 자리에 잘못된 문자: {ch!r}")
+
+            elif state == _EXPECT_VALUE:
+                if ch == '"':
+                    self._state = _IN_STRING_VALUE
+                    string_changed = True
+                elif not ch.isspace():
+                    self._state = _IN_OTHER_VALUE
+                    self._raw = []
+                    self._depth = 0
+                    self._raw_in_str = False
+                    self._raw_escape = False
+                    self._feed_other_char(ch, events)
+
+            elif state == _IN_OTHER_VALUE:
+                self._feed_other_char(ch, events)
+
+            elif state == _AFTER_VALUE:
+                self._after_value_char(ch)
+
+        if string_changed and self._state == _IN_STRING_VALUE:
+            events.append((EVENT_PARTIAL, self._key, "".join(self._buf)))
+        return events
+
+    # -------------------------------------------------------------------------
+    def _feed_string_char(self, ch):
+        """문자열 안의 글자 하나 처리. 닫는 따옴표면 True"""
+        if self._escape is not None:
+            if self._escape == "":
+                if ch == "u":
+                    self._escape = "u"
+                    return False
+                self._buf.append(_ESCAPES.get(ch, ch))
+                self._escape = None
+                return False
+            self._escape += ch # \uXXXX
+            if len(self._escape) == 5:
+                code = int(self._escape[1:], 16)
+                prev = ord(self._buf[-1]) if self._buf else 0
+                if 0xDC00 <= code <= 0xDFFF and 0xD800 <= prev <= 0xDBFF:
+                    # 서로게이트 쌍(😀 등)은 한 글자로 합침
+                    self._buf[-1] = chr(0x10000 + ((prev - 0xD800) << 10) + (code - 0xDC00))
+                else:
+                    self._buf.append(chr(code))
+                self._escape = None
+            return False
+
+        if ch == "\\":
+            self._escape = ""
+            return False
+        if ch == '"':
+            return True
+        self._buf.append(ch)
+        return False
+
+    def _feed_other_char(self, ch, events):
+        """숫자/불리언/null/배열/객체 값의 글자 하나 처리 (값이 끝나면 이벤트 추가)"""
+        if self._raw_in_str:
+            self._raw.append(ch)
+            if self._raw_escape:
+                self._raw_escape = False
+            elif ch == "\\":
+                self._raw_escape = True
+            elif ch == '"':
+                self._raw_in_str = False
+            return
+
+        if self._depth == 0 and ch in ",}":
+            self._finish_value(json.loads("".join(self._raw).strip()), events)
+            self._after_value_char(ch)
+            return
+
+        self._raw.append(ch)
+        if ch == '"':
+            self._raw_in_str = True
+        elif ch in "[{":
+            self._depth += 1
+        elif ch in "]}":
+            self._depth -= 1
+
+    def _finish_value(self, value, events):
+        self.result[self._key] = value
+        events.append((EVENT_FIELD, self._key, value))
+        self._state = _AFTER_VALUE
+
+    def _after_value_char(self, ch):
+        if ch == ",":
+            self._state = _EXPECT_KEY
+        elif ch == "}":
+            self._state = _DONE
+        elif not ch.isspace():
+            raise ValueError(f"값 뒤에 잘못된 문자: {ch!r}")
@@ -0,0 +1,172 @@
+# 경로: core/srs.py
+# [설명] 간격 반복(spaced repetition) 복습 스케줄러 - SM-2 방식
+# - 카드(단어)마다 (반복 횟수, 간격(일), 쉬움 정도, 다음 복습 시각, 틀린 횟수)만 기억
+# - 맞히면 간격이 1일 -> 6일 -> 간격 × 쉬움 정도로 늘어나고, 틀리면 1일로 돌아감
+# - SrsQueue: 다음 복습 시각 기준 최소 힙(heap)
+#   -> "지금 복습할 카드 k개"를 카드 수 n과 상관없이 O(k log n)에 꺼냄 (전체 단어를 훑지 않음)
+#   -> 복습 결과가 바뀐 카드는 새 항목을 넣고, 예전 항목은 꺼낼 때 버림 (lazy deletion)
+#   -> "지금 복습할 카드 수"는 카운터로 관리: 시간이 지나 새로 복습 시각이 된 카드만 더함 (전체를 세지 않음)
+
+import heapq
+from collections import deque
+from typing import NamedTuple
+
+DAY_SECONDS = 24 * 60 * 60
+
+# 채점 결과 -> SM-2 품질 점수(0~5)
+GRADE_BLANK = 0   # 답을 안 씀
+GRADE_AGAIN = 1   # 틀림
+GRADE_GOOD = 4    # 맞힘
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+
+class CardState(NamedTuple):
+    reps: int = 0              # 연속으로 맞힌 횟수
+    interval: float = 0.0      # 복습 간격 (일)
+    ease: float = DEFAULT_EASE # 쉬움 정도 (간격 배율)
+    due: float = 0.0           # 다음 복습 시각 (epoch 초)
+    lapses: int = 0            # 틀린 횟수 (누적)
+
+
+def review(state, grade, now):
+    """
+    [기능] 카드 하나를 채점 결과(grade, 0~5)로 갱신한 새 상태를 돌려줍니다. (SM-2)
+    """
+    state = state or CardState()
+    if grade < 3:
+        reps, interval, lapses = 0, 1.0, state.lapses + 1
+    else:
+        reps, lapses = state.reps + 1, state.lapses
+        if reps == 1:
+            interval = 1.0
+        elif reps == 2:
+            interval = 6.0
+        else:
+            interval = round(state.interval * state.ease, 1)
+
+    miss = 5 - grade
+    ease = max(MIN_EASE, state.ease + 0.1 - miss * (0.08 + miss * 0.02))
+    return CardState(reps, interval, round(ease, 3), now + interval * DAY_SECONDS, lapses)
+
+
+class SrsQueue:
+    """
+    [기능] 카드 묶음(한 사용자의 한 단어장)의 복습 대기열
+    - 복습 기록이 있는 카드: 다음 복습 시각 기준 최소 힙
+    - 처음 보는 카드: 단어장 순서대로 대기
+    """
+    def __init__(self, card_ids, due_by_card):
+        """card_ids: 단어장의 카드 순서, due_by_card: {카드: 다음 복습 시각} (복습 기록이 있는 카드만)"""
+        self._cards = set(card_ids)
+        self._due = {}
+        self._heap = []
+        self._new = deque()
+        for card_id in dict.fromkeys(card_ids):
+            due = due_by_card.get(card_id)
+            if due is None:
+                self._new.append(card_id)
+            else:
+                self._due[card_id] = due
+                self._heap.append((due, card_id))
+        heapq.heapify(self._heap)
+
+        # 복습할 카드 수 카운터: _counted_until 시각까지 복습 시각이 된 카드(_counted)와
+        # 아직 안 된 카드의 (시각, 카드) 힙 (예전 항목은 꺼낼 때 버림)
+        self._counted_until = float("-inf")
+        self._counted = set()
+        self._upcoming = list(self._heap)
+
+    def __len__(self):
+        return len(self._cards)
+
+    def contains(self, card_id):
+        return card_id in self._cards
+
+    def _pop_valid(self):
+        """예전 항목(이미 다시 복습한 카드)을 버리고 가장 이른 (시각, 카드)를 꺼냄"""
+        while self._heap:
+            due, card_id = heapq.heappop(self._heap)
+            if self._due.get(card_id) == due:
+                return due, card_id
+        return None
+
+    def next_cards(self, k, now):
+        """
+        [기능] 다음에 풀 카드 k개를 고릅니다. (대기열에서 빼지는 않음)
+        순서: 복습 시각이 지난 카드(오래 밀린 것부터) -> 처음 보는 카드 -> 곧 복습할 카드
+        Returns: (카드 리스트, 복습할 카드 수, 처음 보는 카드 수)
+        """
+        picked, popped = [], []
+        n_due = n_new = 0
+        leftover = None
+
+        # 1. 복습 시각이 지난 카드
+        while len(picked) < k and self._heap and self._heap[0][0] <= now:
+            entry = self._pop_valid()
+            if entry is None:
+                break
+            popped.append(entry)
+            if entry[0] > now: # 버린 항목 뒤에 나온 카드가 아직 복습 시각 전이면 3단계에서 사용
+                leftover = entry
+                break
+            picked.append(entry[1])
+            n_due += 1
+
+        # 2. 처음 보는 카드 (그새 복습한 카드는 앞에서부터 정리)
+        while self._new and self._new[0] in self._due:
+            self._new.popleft()
+        for card_id in self._new:
+            if len(picked) >= k:
+                break
+            if card_id not in self._due:
+                picked.append(card_id)
+                n_new += 1
+
+        # 3. 그래도 모자라면 곧 복습할 카드
+        if leftover is not None and len(picked) < k:
+            picked.append(leftover[1])
+        while len(picked) < k:
+            entry = self._pop_valid()
+            if entry is None:
+                break
+            popped.append(entry)
+            picked.append(entry[1])
+
+        # 꺼낸 항목은 그대로 다시 넣음 (복습해야 갱신됨)
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return picked, n_due, n_new
+
+    def update(self, card_id, due):
+        """[기능] 복습한 카드의 다음 복습 시각을 반영합니다. (O(log n))"""
+        self._due[card_id] = due
+        heapq.heappush(self._heap, (due, card_id))
+        if len(self._heap) > 2 * len(self._due) + 64: # 버릴 항목이 너무 많이 쌓이면 한 번 정리
+            self._heap = [(d, c) for c, d in self._due.items()]
+            heapq.heapify(self._heap)
+
+        self._counted.discard(card_id)
+        if due <= self._counted_until:
+            self._counted.add(card_id)
+        else:
+            heapq.heappush(self._upcoming, (due, card_id))
+            if len(self._upcoming) > 2 * len(self._due) + 64:
+                self._upcoming = [(d, c) for c, d in self._due.items() if d > self._counted_until]
+                heapq.heapify(self._upcoming)
+
+    def count_due(self, now):
+        """
+        [기능] 지금 복습할 카드 수 (화면 안내용)
+        지난번 호출 이후 복습 시각이 된 카드만 더하므로 보통 O(1)~O(k log n)
+        (지난번보다 이른 시각을 물으면 전체를 셈)
+        """
+        if now < self._counted_until:
+            return sum(1 for due in self._due.values() if due <= now)
+        while self._upcoming and self._upcoming[0][0] <= now:
+            due, card_id = heapq.heappop(self._upcoming)
+            if self._due.get(card_id) == due:
+                self._counted.add(card_id)
+        self._counted_until = now
+        return len(self._counted)
@@ -1,14 +1,20 @@
 # 텍스트로 바꿔주는 함수 
-def change_text_from_upload(uploaded_file) -> str:
+def iter_pages_from_upload(uploaded_file, txt_lines_per_page=200):
     """
-    Streamlit UploadedFile(PDF/TXT)를 받아서 text(str)로 반환
+    Streamlit UploadedFile(PDF/TXT)를 받아서 페이지 단위 text(str)를 차례대로 내보냄
+    - PDF: 실제 페이지 단위 (페이지 사이에는 줄바꿈 하나)
+    - TXT: txt_lines_per_page 줄씩 묶어서 한 '페이지'로 취급
+    - "".join(...) 결과는 change_text_from_upload()와 같음
     """
     if uploaded_file is None:
-        return ""
+        return
 
     # TXT
     if uploaded_file.type == "text/plain" or uploaded_file.name.lower().endswith(".txt"):
-        return uploaded_file.getvalue().decode("utf-8", errors="ignore")
+        lines = uploaded_file.getvalue().decode("utf-8", errors="ignore").splitlines(keepends=True)
+        for i in range(0, len(lines), txt_lines_per_page):
+            yield "".join(lines[i:i + txt_lines_per_page])
+        return
 
     # PDF
     if uploaded_file.type == "application/pdf" or uploaded_file.name.lower().endswith(".pdf"):
@@ -21,11 +27,21 @@ def change_text_from_upload(uploaded_file) -> str:
         # UploadedFile은 bytes로 읽을 수 있음
         pdf_bytes = uploaded_file.getvalue()
         doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            last_page = doc.page_count - 1
+            for page_no, page in enumerate(doc):
+                yield page.get_text() + ("\n" if page_no < last_page else "")
+        finally:
+            doc.close()
+
+    # 그 외: 아무것도 내보내지 않음
+
 
-        full_text = []
-        for page in doc:
-            full_text.append(page.get_text())
-        return "\n".join(full_text)
+def change_text_from_upload(uploaded_file) -> str:
+    """
+    Streamlit UploadedFile(PDF/TXT)를 받아서 text(str)로 반환
+    """
+    if uploaded_file is None:
+        return ""
 
-    # 그 외
-    return ""
+    return "".join(iter_pages_from_upload(uploaded_file))
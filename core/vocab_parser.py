@@ -2,8 +2,13 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 import pandas as pd
 
+# 파서 버전: 파싱 규칙(정규식/토큰 분류 등)을 바꾸면 반드시 올려주세요.
+# (업로드 결과 캐시의 키에 포함되어, 버전이 바뀌면 예전 캐시는 자동으로 무시됩니다)
+PARSER_VERSION = "2"
+
 # ==========================================
 # 1. 기준 데이터
 # ==========================================
@@ -69,93 +74,193 @@ def cut_tail_after_last_korean(text):
     return text[:last_korean_idx+1].strip()
 
 
+# ------------------------------------------
+# 토큰 분류용 사전 컴파일 테이블
+# (토큰마다 정규식 3~4개를 돌리던 것을 '문자 집합' 비교 한 번으로 대체)
+# ------------------------------------------
+TOKEN_NOISE, TOKEN_PINYIN, TOKEN_POS, TOKEN_MEANING = "noise", "pinyin", "pos", "meaning"
+
+_PUNCT_RE = re.compile(r"[\[\]\(\)\<\>,\.\-\~]")
+_NOISE_CHARS = frozenset("★☆※□■") | frozenset(chr(c) for c in range(0x2600, 0x27C0))
+_TONE_CHARS = frozenset("āáǎàēéěèīíǐìōóǒòūúǔùüǖǘǚǜ")
+_ALPHA_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZüÜ:")
+_INSTRUCTION_RE = re.compile("|".join(map(re.escape, INSTRUCTION_KEYWORDS)))
+
+@lru_cache(maxsize=65536)
+def classify_token(token):
+    """
+    토큰 하나를 병음(pinyin) / 품사(pos) / 노이즈(noise) / 뜻(meaning) 중 하나로 분류합니다.
+    판단 순서는 예전 정규식 방식과 같습니다:
+    해커스 노이즈 -> 성조 문자 포함 -> 성조 없는 알파벳(병음 or 영어 품사, 나머지는 버림) -> 한글 품사 -> 뜻
+    (단어장에는 같은 토큰이 반복되므로 결과를 캐시)
+    """
+    chars = set(token)
+
+    # [업데이트] 해커스 노이즈 토큰(★, □ 등)
+    if chars <= _NOISE_CHARS:
+        return TOKEN_NOISE
+
+    # 1. 병음 판단
+    if not chars.isdisjoint(_TONE_CHARS):
+        return TOKEN_PINYIN
+
+    # 2. 성조 없는 알파벳
+    if chars <= _ALPHA_CHARS:
+        if token.lower().replace(':', 'ü') in PINYIN_WHITELIST:
+            return TOKEN_PINYIN
+        if token in POS_SET:
+            return TOKEN_POS
+        return TOKEN_NOISE
+
+    # 3. 한글 품사
+    if token in POS_SET:
+        return TOKEN_POS
+
+    return TOKEN_MEANING
+
+
 def clean_chunk_content(text):
     if not text: return "", "", ""
-    text = unicodedata.normalize("NFC", text)
-    text = re.sub(r"[\[\]\(\)\<\>,\.\-\~]", " ", text) 
-    tokens = text.split()
+    text = _PUNCT_RE.sub(" ", unicodedata.normalize("NFC", text))
     
     pinyin_list, pos_list, meaning_list = [], [], []
     
-    for token in tokens:
-        token = token.strip()
-        if not token: continue
-        
-        # [업데이트] 해커스 노이즈 토큰(★, □ 등) 발견 시 즉시 건너뜀
-        if HACKERS_NOISE_RE.match(token):
-            continue
-        
-        # 1. 병음 판단
-        if TONE_CHARS_RE.search(token):
+    # 토큰을 한 번만 훑으면서 분류 결과에 따라 바로 분배
+    for token in text.split():
+        label = classify_token(token)
+        if label is TOKEN_PINYIN:
             pinyin_list.append(token)
-            continue
-            
-        # 2. 성조 없는 알파벳
-        if re.match(r"^[a-zA-ZüÜ:]+$", token):
-            low_token = token.lower().replace(':', 'ü')
-            if low_token in PINYIN_WHITELIST:
-                pinyin_list.append(token)
-                continue
-            if token in POS_SET:
-                if token not in pos_list: pos_list.append(token)
-                continue
-            continue 
-            
-        # 3. 한글 품사
-        if token in POS_SET:
+        elif label is TOKEN_MEANING:
+            meaning_list.append(token)
+        elif label is TOKEN_POS:
             if token not in pos_list: pos_list.append(token)
-            continue
-
-        meaning_list.append(token)
 
     final_ko = " ".join(meaning_list)
     
-    for kw in INSTRUCTION_KEYWORDS:
-        if kw in final_ko:
-            final_ko = ""
-            break
+    if _INSTRUCTION_RE.search(final_ko):
+        final_ko = ""
 
     cleaned_ko = cut_tail_after_last_korean(final_ko)
 
-    return " ".join(pinyin_list), ", ".join(dict.fromkeys(pos_list)), cleaned_ko
+    return " ".join(pinyin_list), ", ".join(pos_list), cleaned_ko
 
 # ==========================================
 # 3. 메인 파서
 # ==========================================
 
+# 단어표 기본 컬럼 + 원문 좌표 컬럼
+# - anchor_start / anchor_end: 원문에서 한자(앵커)가 놓인 구간 (번호 "12." 등은 제외, 끝은 번호 포함 매치의 끝)
+# - chunk_end: 이 단어의 청크(병음/품사/뜻) 구간은 [anchor_end, chunk_end)
+VOCAB_COLUMNS = ["zh", "pinyin", "ko", "pos", "flags"]
+OFFSET_COLUMNS = ["anchor_start", "anchor_end", "chunk_end"]
+
+def _build_row(match, text, chunk_end, level, source, base=0):
+    """
+    앵커 매치 하나와 그 뒤 청크 구간으로 단어 행(dict)을 만듭니다.
+    base는 text가 원문 전체에서 시작하는 위치(스트리밍 버퍼용)입니다.
+    단어로 보기 어려운 경우(5글자 이상, 문제/해설 행 등)는 None을 돌려줍니다.
+    """
+    zh_word = match.group("zh")
+    if len(zh_word) >= 5: return None
+
+    pinyin, pos, ko = clean_chunk_content(text[match.end():chunk_end])
+
+    if GARBAGE_ROW_RE.search(ko): return None
+
+    flags = []
+    if not pinyin: flags.append("NO_PINYIN")
+    if not ko: flags.append("NO_MEANING")
+
+    return {
+        "zh": zh_word, 
+        "pinyin": pinyin, 
+        "ko": ko, 
+        "pos": pos, 
+        "flags": " | ".join(flags) if flags else "OK",
+        "level": level,
+        "source": source,
+        "anchor_start": base + match.start("zh"),
+        "anchor_end": base + match.end(),
+        "chunk_end": base + chunk_end
+    }
+
 def parse_text_by_chunks(full_text, level, source):
     rows = []
     matches = list(HANZI_ANCHOR_RE.finditer(full_text))
         
     for i, curr_match in enumerate(matches):
-        zh_word = curr_match.group("zh")
-        if len(zh_word) >= 5: continue
-        
-        start_idx = curr_match.end()
         end_idx = matches[i+1].start() if i < len(matches)-1 else len(full_text)
         
-        pinyin, pos, ko = clean_chunk_content(full_text[start_idx:end_idx])
-        
-        if GARBAGE_ROW_RE.search(ko): continue
-
-        flags = []
-        if not pinyin: flags.append("NO_PINYIN")
-        if not ko: flags.append("NO_MEANING")
-            
-        rows.append({
-            "zh": zh_word, 
-            "pinyin": pinyin, 
-            "ko": ko, 
-            "pos": pos, 
-            "flags": " | ".join(flags) if flags else "OK",
-            "level": level,
-            "source": source
-        })
+        row = _build_row(curr_match, full_text, end_idx, level, source)
+        if row is not None:
+            rows.append(row)
 
     return pd.DataFrame(rows)
 
+def iter_vocab_rows(pages, level, source):
+    """
+    [스트리밍 파서] 페이지 텍스트 이터레이터를 받아, 앵커가 '완성'되는 즉시 단어 행을 하나씩 내보냅니다.
+
+    * 앵커의 청크는 '다음 앵커'가 나타나야 끝이 확정되므로, 페이지 끝의 마지막 앵커는
+      다음 페이지와 이어 붙여서 처리합니다. (페이지 경계에 걸친 청크/한자도 그대로 이어짐)
+    * 버퍼에는 '아직 끝나지 않은 마지막 앵커 ~ 현재 페이지 끝'만 남기므로
+      메모리가 전체 텍스트 + 전체 매치 리스트만큼 커지지 않습니다.
+    * "".join(pages)를 parse_text_by_chunks에 넣은 결과와 같은 행(원문 좌표 포함)을 같은 순서로 만듭니다.
+    """
+    buffer = ""
+    base = 0 # buffer[0]의 원문 전체 기준 위치
+    for page_text in pages:
+        buffer += page_text
+        prev = None
+        for curr in HANZI_ANCHOR_RE.finditer(buffer):
+            if prev is not None:
+                row = _build_row(prev, buffer, curr.start(), level, source, base)
+                if row is not None:
+                    yield row
+            prev = curr
+
+        # 마지막 앵커는 아직 미완성 -> 그 앵커 시작점부터 다음 페이지로 넘김
+        # (앵커가 하나도 없으면 첫 앵커 이전 텍스트이므로 버림)
+        cut = prev.start() if prev is not None else len(buffer)
+        buffer = buffer[cut:]
+        base += cut
+
+    # 스트림 종료: 남은 버퍼의 앵커들을 끝까지 확정
+    matches = HANZI_ANCHOR_RE.finditer(buffer)
+    prev = next(matches, None)
+    while prev is not None:
+        curr = next(matches, None)
+        end_idx = curr.start() if curr is not None else len(buffer)
+        row = _build_row(prev, buffer, end_idx, level, source, base)
+        if row is not None:
+            yield row
+        prev = curr
+
+def iter_vocab_batches(pages, level, source, batch_size=50):
+    """
+    [스트리밍 파서 - 묶음 단위] iter_vocab_rows의 행을 batch_size개씩 리스트로 묶어 내보냅니다.
+    업로드 화면에서 '지금까지 찾은 단어'를 조금씩 갱신할 때 사용합니다.
+    """
+    batch = []
+    for row in iter_vocab_rows(pages, level, source):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def vocab_rows_to_df(rows):
+    """
+    파서가 만든 행(dict) 리스트를 화면/보정 단계에서 쓰는 단어표 형식으로 바꿉니다.
+    (원문 좌표 컬럼은 AI 보정 단계가 원문 조각을 바로 잘라 쓰도록 함께 유지)
+    """
+    if not rows:
+        return pd.DataFrame(columns=VOCAB_COLUMNS + OFFSET_COLUMNS)
+    return pd.DataFrame(rows)[VOCAB_COLUMNS + OFFSET_COLUMNS]
+
 def change_text_to_vocab_df(extracted_text, level="HSK", source="generic", use_llm=False):
     df = parse_text_by_chunks(extracted_text, level, source)
     if df.empty: 
-        return pd.DataFrame(columns=["zh", "pinyin", "ko", "pos", "flags"])
-    return df[["zh", "pinyin", "ko", "pos", "flags"]]
\ No newline at end of file
+        return pd.DataFrame(columns=VOCAB_COLUMNS + OFFSET_COLUMNS)
+    return df[VOCAB_COLUMNS + OFFSET_COLUMNS]
\ No newline at end of file
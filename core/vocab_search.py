@@ -0,0 +1,234 @@
+# 경로: core/vocab_search.py
+# [설명] 내 단어장 검색용 글자 n-gram 역색인
+# - 한자(zh), 한국어 뜻(ko), 성조를 뺀 병음(pinyin)을 1글자/2글자 조각(n-gram)으로 쪼개 "조각 -> 단어 번호" 목록을 만듦
+# - 검색: 검색어의 조각 목록들을 (가장 짧은 것부터) 교집합 -> 남은 후보만 실제 포함 여부 확인
+#   -> 매 검색마다 전체 단어를 훑지 않음 (단어장이 커져도 후보 수만큼만 일함)
+# - 순위: 정확히 일치 > 앞부분 일치 > 중간 포함, 같은 등급이면 한자 > 병음 > 뜻, 짧은 단어 먼저
+# - 자동완성: 정렬된 (검색 키, 단어 번호) 목록에서 이진 탐색으로 앞부분이 같은 단어를 찾음
+# - 단어장 내용이 같으면 인덱스를 다시 만들지 않도록 내용 지문(해시)별로 캐시
+
+import bisect
+import hashlib
+import heapq
+import threading
+import unicodedata
+
+import pandas as pd
+
+from core.dict_index import gloss_terms
+
+SEARCH_COLUMNS = ["zh", "pinyin", "ko", "pos"]
+
+# 프로세스 전체에서 보관할 인덱스 수 (세션마다 다른 단어장을 쓰는 경우 대비)
+MAX_CACHED_INDEXES = 8
+
+# 일치 등급 / 필드 순서 (작을수록 위)
+MATCH_EXACT, MATCH_PREFIX, MATCH_SUBSTRING = 0, 1, 2
+FIELD_ZH, FIELD_PINYIN, FIELD_KO = 0, 1, 2
+
+
+def _text(value):
+    if value is None or value != value: # None / NaN
+        return ""
+    return str(value)
+
+
+def normalize_text(text):
+    """[기능] 검색용 정규화 (전각->반각, 소문자, 앞뒤 공백 제거)"""
+    return unicodedata.normalize("NFKC", text).lower().strip()
+
+
+def strip_tones(pinyin):
+    """
+    [기능] 병음의 성조(부호/숫자)와 공백을 없앱니다.
+    예: "ài xī" -> "aixi", "lv4 se4" -> "lvse", "lǜ" -> "lu"
+    """
+    decomposed = unicodedata.normalize("NFD", normalize_text(pinyin))
+    return "".join(ch for ch in decomposed if ch.isalpha() and not unicodedata.combining(ch))
+
+
+def _pinyin_query(query):
+    """검색어가 로마자(성조 부호 포함)면 성조 없는 병음으로, 아니면 빈 문자열"""
+    base = "".join(ch for ch in unicodedata.normalize("NFD", query) if not unicodedata.combining(ch))
+    return strip_tones(query) if base.isascii() else ""
+
+
+def _grams(text):
+    """1글자 조각 + 2글자 조각 (공백 제외)"""
+    grams = set(ch for ch in text if not ch.isspace())
+    grams.update(text[i:i + 2] for i in range(len(text) - 1) if not text[i:i + 2].isspace())
+    return grams
+
+
+def _query_grams(text):
+    """검색어를 덮는 조각: 1글자면 그 글자, 아니면 2글자 조각들"""
+    if len(text) == 1:
+        return {text}
+    grams = {text[i:i + 2] for i in range(len(text) - 1)}
+    return {g for g in grams if not g.isspace()} or {ch for ch in text if not ch.isspace()}
+
+
+class VocabSearchIndex:
+    """
+    [기능] 단어 레코드 리스트(zh, pinyin, ko, pos)로 만든 검색 인덱스
+    search(): 순위가 매겨진 검색 결과 / suggest(): 입력 중 자동완성 후보
+    """
+    def __init__(self, records):
+        self.rows = []          # 화면 표시용 원본 (dict)
+        self._fields = []       # 단어별 (한자, 성조 없는 병음, 뜻) 정규화 문자열
+        self._glosses = []      # 단어별 뜻 조각 (쉼표 등으로 나눈 것)
+        postings = {}
+        keys = []
+
+        for row_id, record in enumerate(records):
+            row = {col: _text(record.get(col)) for col in SEARCH_COLUMNS}
+            zh = normalize_text(row["zh"])
+            py = strip_tones(row["pinyin"])
+            ko = normalize_text(row["ko"])
+            glosses = {normalize_text(t) for t in gloss_terms(row["ko"])}
+            self.rows.append(row)
+            self._fields.append((zh, py, ko))
+            self._glosses.append(glosses)
+
+            for gram in _grams(zh) | _grams(py) | _grams(ko):
+                postings.setdefault(gram, []).append(row_id)
+            for key in {zh, py} | glosses:
+                if key:
+                    keys.append((key, row_id))
+
+        # row_id 순으로 들어갔으므로 목록은 이미 정렬되어 있음
+        self._postings = postings
+        keys.sort()
+        self._keys = keys
+
+    def __len__(self):
+        return len(self.rows)
+
+    # -------------------------------------------------------------------------
+    def _candidates(self, query):
+        """검색어의 모든 조각을 가진 단어 번호 (포함 여부는 아직 확인 전)"""
+        lists = []
+        for gram in _query_grams(query):
+            ids = self._postings.get(gram)
+            if not ids:
+                return []
+            lists.append(ids)
+        lists.sort(key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            result.intersection_update(ids)
+            if not result:
+                break
+        return result
+
+    def _rank(self, row_id, query, query_py):
+        """(등급, 필드, 길이) - 검색어가 실제로 들어있지 않으면 None"""
+        zh, py, ko = self._fields[row_id]
+        best = None
+        for field, text in ((FIELD_ZH, zh), (FIELD_PINYIN, py)):
+            q = query_py if field == FIELD_PINYIN else query
+            if q and q in text:
+                grade = MATCH_EXACT if text == q else MATCH_PREFIX if text.startswith(q) else MATCH_SUBSTRING
+                best = min(best or (9,), (grade, field, len(text)))
+        if query in ko:
+            glosses = self._glosses[row_id]
+            if query in glosses:
+                grade = MATCH_EXACT
+            elif ko.startswith(query) or any(g.startswith(query) for g in glosses):
+                grade = MATCH_PREFIX
+            else:
+                grade = MATCH_SUBSTRING
+            best = min(best or (9,), (grade, FIELD_KO, len(ko)))
+        return best
+
+    def search(self, query, limit=20):
+        """
+        [기능] 한자/병음(성조 무시)/한국어 뜻의 부분 문자열로 찾고, 순위순으로 최대 limit개를 돌려줍니다.
+        Returns: [dict(zh, pinyin, ko, pos, match), ...]  (match: 0=정확히 일치, 1=앞부분, 2=중간 포함)
+        """
+        query = normalize_text(query)
+        if not query:
+            return []
+        query_py = _pinyin_query(query)
+
+        candidates = set(self._candidates(query))
+        if query_py and query_py != query:
+            candidates |= set(self._candidates(query_py))
+
+        ranked = []
+        for row_id in candidates:
+            rank = self._rank(row_id, query, query_py)
+            if rank is not None:
+                ranked.append((rank, row_id))
+
+        return [
+            dict(self.rows[row_id], match=rank[0])
+            for rank, row_id in heapq.nsmallest(limit, ranked)
+        ]
+
+    def suggest(self, prefix, limit=8):
+        """
+        [기능] 입력 중인 글자로 시작하는 단어(한자/병음/뜻 기준)를 최대 limit개 돌려줍니다. (자동완성)
+        같은 한자가 여러 행에 있으면(합친 단어장 등) 가장 짧은 키로 맞은 행 하나만 돌려줍니다.
+        Returns: [dict(zh, pinyin, ko, pos), ...]  (짧은 키 먼저, 한자 중복 없음)
+        """
+        prefix = normalize_text(prefix)
+        if not prefix:
+            return []
+        prefixes = {prefix, _pinyin_query(prefix)}
+
+        found = {} # 정규화한 한자 -> (가장 짧은 키 길이, 행 번호)
+        for p in prefixes:
+            if not p:
+                continue
+            start = bisect.bisect_left(self._keys, (p,))
+            for key, row_id in self._keys[start:]:
+                if not key.startswith(p):
+                    break
+                zh = normalize_text(self.rows[row_id]['zh'])
+                entry = (len(key), row_id)
+                if zh not in found or entry < found[zh]:
+                    found[zh] = entry
+
+        best = heapq.nsmallest(limit, found.values())
+        return [dict(self.rows[row_id]) for _, row_id in best]
+
+
+# =============================================================================
+# [캐시] 단어장 내용별로 한 번만 만들기
+# =============================================================================
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def vocab_fingerprint(df):
+    """
+    [기능] 검색에 쓰는 열(zh, pinyin, ko, pos) 내용으로 지문(16진수)을 만듭니다. (벡터 연산이라 리런마다 불러도 가벼움)
+    """
+    cols = [c for c in SEARCH_COLUMNS if c in df.columns]
+    h = hashlib.sha1(",".join(cols).encode("utf-8"))
+    if cols and len(df):
+        h.update(pd.util.hash_pandas_object(df[cols].astype(str), index=False).values.tobytes())
+    return h.hexdigest()
+
+
+def get_vocab_index(df):
+    """
+    [기능] 단어장 DataFrame의 검색 인덱스를 돌려줍니다. (내용이 같으면 캐시된 인덱스를 그대로 사용)
+    """
+    key = vocab_fingerprint(df)
+    with _lock:
+        index = _indexes.pop(key, None)
+        if index is not None:
+            _indexes[key] = index # 최근에 쓴 것으로 순서 갱신
+            return index
+
+    cols = [c for c in SEARCH_COLUMNS if c in df.columns]
+    index = VocabSearchIndex(df[cols].to_dict("records"))
+
+    with _lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.pop(next(iter(_indexes)))
+    return index
@@ -0,0 +1,168 @@
+# 경로: core/vocab_store.py
+# [설명] 세션 하나의 단어장 저장소 (Arrow 테이블 + 버전 번호 + 버전별 파생 데이터 캐시)
+# - 업로드한 원본(base)은 바꾸지 않고 그대로 두고, 표 편집 결과가 있으면 따로(edited) 보관
+# - pos/flags/level/source 처럼 값 종류가 적은 열은 dictionary(범주형)로 저장해 메모리 절약
+# - 내용이 바뀔 때만 version이 올라가고, 레코드 리스트/선택지 라벨/검색 인덱스 같은 파생 데이터는
+#   view()로 버전마다 한 번만 계산 -> 단어장이 그대로면 리런해도 O(n) 변환이 없음
+# - 표 편집(st.data_editor) 변경 여부는 위젯의 편집 내역(수정/추가/삭제 행)만 비교해서 판단
+# - 원본(base_table/base_df)은 여러 세션이 같이 참조할 수 있으므로(services/shared_vocab.py) 절대 고치지 않음
+
+import copy
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+CATEGORY_COLUMNS = ["pos", "flags", "level", "source"]
+SELECT_COLUMN = "선택"
+
+
+def to_arrow_table(df):
+    """
+    [기능] 단어장 DataFrame을 Arrow 테이블로 바꿉니다. (범주형 열은 dictionary 인코딩)
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name in CATEGORY_COLUMNS:
+        i = table.schema.get_field_index(name)
+        if i < 0:
+            continue
+        column = table.column(i)
+        if pa.types.is_dictionary(column.type):
+            continue
+        if not pa.types.is_string(column.type) and not pa.types.is_large_string(column.type):
+            column = column.cast(pa.string())
+        table = table.set_column(i, name, column.dictionary_encode())
+    return table
+
+
+def _to_pandas(table):
+    """범주형 열을 일반 문자열로 되돌린 DataFrame (표 편집기에서 자유롭게 고칠 수 있도록)"""
+    for name in CATEGORY_COLUMNS:
+        i = table.schema.get_field_index(name)
+        if i >= 0 and pa.types.is_dictionary(table.column(i).type):
+            table = table.set_column(i, name, table.column(i).cast(pa.string()))
+    return table.to_pandas()
+
+
+def _has_edits(edit_state):
+    return bool(edit_state) and any(edit_state.get(k) for k in ("edited_rows", "added_rows", "deleted_rows"))
+
+
+class VocabStore:
+    """
+    [기능] 단어장 하나 (원본 + 편집본)를 Arrow로 보관하고, 버전별 파생 데이터를 캐시합니다.
+    """
+    def __init__(self, df=None, base_table=None, base_df=None):
+        self._base = base_table if base_table is not None else to_arrow_table(df)
+        self._edited = None         # 편집본 (없으면 원본 그대로)
+        self._edit_state = None     # 마지막으로 반영한 표 편집 내역
+        self.version = 1
+        self._views = {}            # 이름 -> (버전, 값)
+        self._base_df = base_df     # 공유 캐시에서 받은 원본 DataFrame (없으면 처음 필요할 때 변환)
+
+    # -------------------------------------------------------------------------
+    @property
+    def table(self):
+        """현재 단어장 (편집본이 있으면 편집본)"""
+        return self._edited if self._edited is not None else self._base
+
+    @property
+    def base_table(self):
+        return self._base
+
+    @property
+    def nbytes(self):
+        return self._base.nbytes + (self._edited.nbytes if self._edited is not None else 0)
+
+    @property
+    def is_edited(self):
+        return self._edited is not None
+
+    def __len__(self):
+        return self.table.num_rows
+
+    def base_df(self):
+        """표 편집기에 넣을 원본 DataFrame (처음 한 번만 변환, 매번 같은 내용이라 편집 내역이 유지됨)"""
+        if self._base_df is None:
+            self._base_df = _to_pandas(self._base)
+        return self._base_df
+
+    # -------------------------------------------------------------------------
+    def apply_edits(self, edited_df, edit_state):
+        """
+        [기능] 표 편집기 결과를 반영합니다. 편집 내역이 지난번과 같으면 아무것도 하지 않습니다.
+        - edited_df: st.data_editor가 돌려준 DataFrame (원본 + 편집)
+        - edit_state: st.session_state[편집기 key] (edited_rows / added_rows / deleted_rows)
+        Returns: 단어장이 바뀌었으면 True
+        """
+        if not _has_edits(edit_state):
+            if self._edited is None:
+                return False
+            self._edited, self._edit_state = None, None # 편집을 모두 되돌림 -> 원본
+        else:
+            if edit_state == self._edit_state:
+                return False
+            self._edited = to_arrow_table(edited_df)
+            self._edit_state = copy.deepcopy(edit_state)
+        self._bump()
+        return True
+
+    def replace(self, df):
+        """[기능] 단어장 내용을 통째로 바꿉니다. (새 원본)"""
+        self._base = to_arrow_table(df)
+        self._edited, self._edit_state, self._base_df = None, None, None
+        self._bump()
+
+    def _bump(self):
+        self.version += 1
+        self._views.clear()
+
+    # -------------------------------------------------------------------------
+    def view(self, name, builder):
+        """
+        [기능] 파생 데이터를 버전마다 한 번만 계산합니다.
+        예: store.view("search_index", lambda s: get_vocab_index(s.df()))
+        """
+        cached = self._views.get(name)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        value = builder(self)
+        self._views[name] = (self.version, value)
+        return value
+
+    def df(self):
+        """현재 단어장 DataFrame (편집하지 않았으면 원본을 그대로 돌려주므로 고치지 말 것)"""
+        if self._edited is None:
+            return self.base_df()
+        return self.view("df", lambda s: _to_pandas(s.table))
+
+    def records(self):
+        """현재 단어장 레코드 리스트 [{'zh': ..., 'ko': ...}, ...]"""
+        # (Arrow to_pylist는 dictionary 열에서 느려서 pandas를 거침)
+        return self.view("records", lambda s: s.df().to_dict('records'))
+
+    def selected_table(self):
+        """'선택'에 체크된 단어만 (선택 열이 없으면 전체)"""
+        def build(s):
+            table = s.table
+            if SELECT_COLUMN not in table.column_names:
+                return table
+            return table.filter(pc.fill_null(table.column(SELECT_COLUMN), False))
+        return self.view("selected_table", build)
+
+    def selected_df(self):
+        return self.view("selected_df", lambda s: _to_pandas(s.selected_table()))
+
+    def selected_words(self):
+        """선택된 단어의 한자 리스트"""
+        return self.view("selected_words", lambda s: s.selected_table().column("zh").to_pylist())
+
+    def option_labels(self):
+        """선택된 단어의 선택지 라벨 ["爱惜 (아끼다)", ...]"""
+        def build(s):
+            table = s.selected_table()
+            labels = pc.binary_join_element_wise(
+                table.column("zh"), " (", table.column("ko"), ")", "",
+                null_handling="replace", null_replacement="",
+            )
+            return labels.to_pylist()
+        return self.view("option_labels", build)
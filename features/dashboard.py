@@ -1,10 +1,17 @@
 # 경로: features/dashboard.py
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from services.google_sheets import load_data_by_nickname
+from services.google_sheets import load_score_history
+from services.score_store import summarize, to_display_df
+from services.score_rollups import load_rollups, summarize_rollups
+from core.downsample import downsample_by_group
+
+# 줄이기 전 점이 이보다 많으면 WebGL(scattergl)로 그림
+WEBGL_MIN_POINTS = 1000
 
 def show_dashboard_page():
+    import plotly.express as px # 대시보드를 열 때만 불러옴 (import 비용이 큼)
+
     st.subheader("📊 학습 대시보드")
     st.caption("나의 학습 기록과 성장 추이를 한눈에 확인하세요.")
 
@@ -15,25 +22,25 @@ def show_dashboard_page():
         return
 
     # 2. 데이터 불러오기
+    # [변경] 로컬 컬럼형 저장소에서 타입이 정해진(날짜=timestamp, 점수=float) 시간순 기록을 바로 받음
+    #        -> 매번 문자열 변환/정렬을 다시 할 필요가 없음
     with st.spinner(f"cloud: {nickname}님의 기록을 가져오는 중..."):
-        df = load_data_by_nickname(nickname)
+        history = load_score_history(nickname)
 
     # 3. 데이터가 없을 때 처리
-    if df.empty:
+    if history.num_rows == 0:
         st.info(f"👋 **{nickname}**님, 아직 학습 기록이 없습니다. 단어시험이나 작문을 시작해보세요!")
         return
 
-    # 4. 데이터 전처리 (날짜 변환 등)
-    try:
-        # 구글 시트에서 가져온 데이터는 다 문자열일 수 있으므로 형변환
-        df['날짜'] = pd.to_datetime(df['날짜'])
-        df['점수'] = pd.to_numeric(df['점수'])
-        # 날짜순 정렬
-        df = df.sort_values(by='날짜')
-    except Exception as e:
-        st.error(f"데이터 처리 중 오류가 발생했습니다: {e}")
-        st.write(df) # 디버깅용 원본 출력
-        return
+    # 4. 요약 지표 + 그래프용 표
+    # [변경] 총 횟수/평균/유형별 평균은 미리 집계된 롤업(별명 × 일 × 유형) 몇 행에서 계산
+    #        롤업 횟수가 기록 수와 다르면(재계산 전, 날짜/점수를 읽을 수 없는 행 등) 기록 전체로 직접 계산
+    summary = summarize_rollups(load_rollups(nickname))
+    if summary['total'] != history.num_rows:
+        summary = summarize(history)
+    else:
+        summary['last_exam'] = history.column("exam_type")[-1].as_py()
+    df = to_display_df(history)
 
     # =========================================================
     # [섹션 1] 핵심 요약 (Metric)
@@ -41,13 +48,9 @@ def show_dashboard_page():
     st.divider()
     col1, col2, col3 = st.columns(3)
     
-    total_tests = len(df)
-    avg_score = df['점수'].mean()
-    last_exam = df.iloc[-1]['시험유형']
-    
-    col1.metric("총 학습 횟수", f"{total_tests}회")
-    col2.metric("전체 평균 점수", f"{avg_score:.1f}점")
-    col3.metric("최근 응시 과목", last_exam)
+    col1.metric("총 학습 횟수", f"{summary['total']}회")
+    col2.metric("전체 평균 점수", f"{summary['avg_score']:.1f}점")
+    col3.metric("최근 응시 과목", summary['last_exam'])
 
     # =========================================================
     # [섹션 2] 그래프 시각화 (Plotly)
@@ -60,20 +63,40 @@ def show_dashboard_page():
     tab1, tab2 = st.tabs(["시간별 추세", "유형별 분석"])
     
     with tab1:
+        # [변경] 보이는 기간만 잘라 시험유형별로 LTTB 다운샘플링 -> 기록이 아무리 많아도 그래프 크기/렌더 시간 일정
+        first_day, last_day = df['날짜'].iloc[0].date(), df['날짜'].iloc[-1].date()
+        date_range = st.date_input(
+            "📅 조회 기간",
+            value=(first_day, last_day),
+            min_value=first_day,
+            max_value=last_day,
+            key=f"dashboard_date_range_{nickname}"
+        )
+        # 날짜를 하나만 고른 중간 상태면 그날 하루만 표시
+        start_day, end_day = (date_range if len(date_range) == 2 else (date_range[0], date_range[0]))
+        chart_df, n_points = downsample_by_group(
+            df, '날짜', '점수', '시험유형',
+            start=start_day, end=pd.Timestamp(end_day) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        )
+        downsampled = len(chart_df) < n_points
+
         # 꺾은선 그래프: 날짜별 점수 변화 (유형별 색상 구분)
         fig_line = px.line(
-            df, 
+            chart_df, 
             x='날짜', 
             y='점수', 
             color='시험유형', 
-            markers=True,
+            markers=not downsampled,
+            render_mode='webgl' if n_points >= WEBGL_MIN_POINTS else 'svg',
             title=f"{nickname}님의 점수 성장 그래프"
         )
         st.plotly_chart(fig_line, use_container_width=True)
+        if downsampled:
+            st.caption(f"기록 {n_points:,}건 중 추세를 대표하는 {len(chart_df):,}개 지점만 표시합니다. 기간을 좁히면 더 자세히 보입니다.")
 
     with tab2:
         # 막대 그래프: 시험 유형별 평균 점수
-        avg_by_type = df.groupby('시험유형')['점수'].mean().reset_index()
+        avg_by_type = summary['by_type']
         fig_bar = px.bar(
             avg_by_type, 
             x='시험유형', 
@@ -88,8 +111,8 @@ def show_dashboard_page():
     # [섹션 3] 최근 상세 기록 (Table)
     # =========================================================
     with st.expander("📋 최근 학습 기록 자세히 보기", expanded=True):
-        # 최신순으로 정렬해서 보여주기
-        display_df = df.sort_values(by='날짜', ascending=False)
+        # 최신순으로 보여주기 (이미 시간순이므로 뒤집기만)
+        display_df = df.iloc[::-1].copy()
         
         # 날짜 포맷 깔끔하게 정리 (문자열 변환)
         display_df['날짜'] = display_df['날짜'].dt.strftime('%Y-%m-%d %H:%M')
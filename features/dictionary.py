@@ -2,40 +2,99 @@
 # [업그레이드] 
 # 1. 한국어 뜻(ko) 부분 일치 검색 지원 (예: '아끼다' -> '爱惜', '爱护' 모두 검색)
 # 2. 내 단어장 결과가 있어도, 추가로 AI에게 물어볼 수 있는 버튼 배치
+# 3. 쉼표로 여러 단어를 한 번에 검색 (예: '爱惜, 节约') -> AI 조회는 동시에 요청
+# 4. 앱에 포함된 오프라인 사전(services/offline_dict.py)을 먼저 조회 -> AI는 사전에 없거나 예문을 원할 때만
+# 5. 내 단어장 검색은 n-gram 역색인(core/vocab_search.py) 사용 -> 병음(성조 무시) 검색, 순위, 추천 검색어
 
 import streamlit as st
 import pandas as pd
-from services.llm import search_word_info
+from core.vocab_search import get_vocab_index
+from services import offline_dict
+from services.vocab_session import get_vocab_store
+from services.llm import search_word_info, search_words_info
+
+# 한 번에 AI에게 동시에 물어볼 수 있는 최대 검색어 수
+MAX_AI_TERMS = 5
+# 검색어 하나당 오프라인 사전 결과 최대 개수
+MAX_OFFLINE_RESULTS = 8
+# 검색어 하나당 내 단어장 결과 최대 개수 / 추천 검색어 수
+MAX_LOCAL_RESULTS = 30
+MAX_SUGGESTIONS = 6
+
+
+def _split_terms(keyword):
+    """쉼표로 구분된 여러 검색어 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(t.strip() for t in keyword.replace("，", ",").split(",") if t.strip()))
+
+
+def _use_suggestion(zh):
+    """추천 검색어 클릭 -> 입력 중이던 마지막 검색어를 추천 단어로 바꿈"""
+    terms = _split_terms(st.session_state.get('dict_keyword', ''))
+    st.session_state['dict_keyword'] = ", ".join(terms[:-1] + [zh])
+
+
+def _render_ai_result(ai_result):
+    """AI 사전 결과 카드 하나를 그립니다."""
+    st.divider()
+    st.markdown(f"## {ai_result['word']}")
+    
+    # 병음과 품사 표시
+    c1, c2 = st.columns([1, 4])
+    with c1:
+         st.markdown(f"**[{ai_result['pinyin']}]**")
+    with c2:
+         st.caption(f"🏷️ 품사: **{ai_result.get('pos', '미상')}**")
+    
+    st.markdown(f"### 💡 뜻: {ai_result['meaning']}")
+    
+    st.info("📝 **AI 추천 예문**")
+    st.write(ai_result['example_cn'])
+    st.caption(ai_result['example_kr'])
 
 def show_dictionary_page():
     st.subheader("📚 AI 단어사전")
     st.caption("내 단어장과 AI 지식을 동시에 활용하세요.")
 
-    # 1. 내 단어장 데이터 준비
-    my_vocab = []
-    if 'final_vocab_df' in st.session_state and st.session_state['final_vocab_df'] is not None:
-        my_vocab = st.session_state['final_vocab_df'].to_dict('records')
+    # 1. 내 단어장 검색 인덱스 준비 (단어장 버전이 같으면 리런해도 다시 만들지 않음)
+    vocab_index = None
+    store = get_vocab_store()
+    if store is not None:
+        vocab_index = store.view("search_index", lambda s: get_vocab_index(s.df()))
 
     # 2. 검색 인터페이스
     col1, col2 = st.columns([4, 1])
     with col1:
-        keyword = st.text_input("검색할 단어 (한자 or 한국어 뜻)", placeholder="예: 아끼다 / 节约", label_visibility="collapsed").strip()
+        keyword = st.text_input("검색할 단어 (한자 or 한국어 뜻)", placeholder="예: 아끼다 / 节约 / jieyue / 爱惜, 节约", label_visibility="collapsed", key="dict_keyword").strip()
     with col2:
         search_btn = st.button("검색", use_container_width=True)
 
     # 엔터를 치거나 검색 버튼을 눌렀을 때 실행
     if keyword:
+        terms = _split_terms(keyword)
+
+        # 추천 검색어: 마지막 검색어로 시작하는 내 단어장 단어 (한자/병음/뜻 기준)
+        if vocab_index is not None and terms:
+            suggestions = [item for item in vocab_index.suggest(terms[-1], limit=MAX_SUGGESTIONS) if item['zh'] != terms[-1]]
+            if suggestions:
+                st.caption("🔎 추천 검색어")
+                cols = st.columns(len(suggestions))
+                for i, (col, item) in enumerate(zip(cols, suggestions)):
+                    col.button(item['zh'], key=f"dict_suggest_{i}_{item['zh']}", on_click=_use_suggestion, args=(item['zh'],), use_container_width=True)
+
         st.divider()
-        
+
         # ---------------------------------------------------------
-        # [Step 1] 내 단어장에서 찾기 (부분 일치 검색)
+        # [Step 1] 내 단어장에서 찾기 (한자/병음/뜻 부분 일치, 정확히 일치하는 단어 먼저)
         # ---------------------------------------------------------
-        # 한자(zh)에 포함되거나 OR 한국어 뜻(ko)에 포함되면 다 가져옴
-        local_matches = [
-            item for item in my_vocab 
-            if keyword in item.get('zh', '') or keyword in str(item.get('ko', ''))
-        ]
-        
+        local_matches = []
+        if vocab_index is not None:
+            seen = set()
+            for term in terms:
+                for item in vocab_index.search(term, limit=MAX_LOCAL_RESULTS):
+                    if (item['zh'], item['ko']) not in seen:
+                        seen.add((item['zh'], item['ko']))
+                        local_matches.append(item)
+
         if local_matches:
             st.success(f"✅ **내 단어장**에서 {len(local_matches)}개를 찾았습니다!")
             
@@ -55,31 +114,52 @@ def show_dictionary_page():
             st.info("내 단어장에는 일치하는 단어가 없습니다.")
 
         # ---------------------------------------------------------
-        # [Step 2] AI 검색 (결과 유무와 상관없이 항상 표시)
+        # [Step 2] 오프라인 사전에서 찾기 (API 호출 없음)
+        # ---------------------------------------------------------
+        shown = {item.get('zh') for item in local_matches}
+        dict_matches = []
+        for term in terms:
+            for entry in offline_dict.lookup(term, limit=MAX_OFFLINE_RESULTS):
+                if entry['zh'] not in shown:
+                    shown.add(entry['zh'])
+                    dict_matches.append(entry)
+
+        if dict_matches:
+            st.success(f"📖 **기본 사전**에서 {len(dict_matches)}개를 찾았습니다!")
+            for entry in dict_matches:
+                with st.container(border=True):
+                    c1, c2 = st.columns([3, 1])
+                    with c1:
+                        st.markdown(f"### {entry['zh']}  **[{entry['pinyin']}]**")
+                    with c2:
+                        st.caption(f"🏷️ {entry['pos']}")
+                    st.markdown(f"💡 **뜻:** {entry['ko']}")
+
+        # ---------------------------------------------------------
+        # [Step 3] AI 검색 (사전에 없거나, 예문/상세 설명이 필요할 때만 요청)
         # ---------------------------------------------------------
         st.markdown("---")
-        st.caption("찾으시는 단어가 아니거나 더 자세한 정보가 필요하신가요?")
-        
+        if local_matches or dict_matches:
+            st.caption("예문이나 더 자세한 설명이 필요하신가요?")
+            ai_label = f"🤖 AI에게 '{keyword}' 예문/상세 설명 요청"
+        else:
+            st.caption("기본 사전에 없는 단어입니다. AI에게 물어보세요.")
+            ai_label = f"🤖 AI에게 '{keyword}' 검색 요청"
+
         # 버튼을 누르면 AI 검색 시작
-        if st.button(f"🤖 AI에게 '{keyword}' 상세 검색 요청", type="primary", use_container_width=True):
-            with st.spinner(f"AI가 '{keyword}'의 최신 용례와 뜻을 분석 중입니다..."):
-                ai_result = search_word_info(keyword)
-                
+        if st.button(ai_label, type="primary", use_container_width=True):
+            if len(terms) == 1:
+                with st.spinner(f"AI가 '{keyword}'의 최신 용례와 뜻을 분석 중입니다..."):
+                    ai_results = [search_word_info(terms[0])]
+            else:
+                ai_terms = terms[:MAX_AI_TERMS]
+                if len(terms) > MAX_AI_TERMS:
+                    st.caption(f"AI 검색은 한 번에 {MAX_AI_TERMS}개까지만 요청합니다.")
+                with st.spinner(f"AI가 {len(ai_terms)}개 단어를 동시에 분석 중입니다..."):
+                    ai_results = search_words_info(ai_terms)
+
+            for ai_result in ai_results:
                 if ai_result:
-                    st.divider()
-                    st.markdown(f"## {ai_result['word']}")
-                    
-                    # 병음과 품사 표시
-                    c1, c2 = st.columns([1, 4])
-                    with c1:
-                         st.markdown(f"**[{ai_result['pinyin']}]**")
-                    with c2:
-                         st.caption(f"🏷️ 품사: **{ai_result.get('pos', '미상')}**")
-                    
-                    st.markdown(f"### 💡 뜻: {ai_result['meaning']}")
-                    
-                    st.info("📝 **AI 추천 예문**")
-                    st.write(ai_result['example_cn'])
-                    st.caption(ai_result['example_kr'])
-                else:
-                    st.error("AI 검색 결과를 가져오지 못했습니다. 다시 시도해주세요.")
\ No newline at end of file
+                    _render_ai_result(ai_result)
+            if not any(ai_results):
+                st.error("AI 검색 결과를 가져오지 못했습니다. 다시 시도해주세요.")
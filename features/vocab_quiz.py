@@ -1,39 +1,54 @@
 # 경로: features/vocab_quiz.py
 # 상세 내용: 주관식 믹스 퀴즈 + [유연한 정답 채점] + 문제 제외/모수 조정
+# + [복습 스케줄] 별명이 있으면 간격 반복(SM-2) 대기열에서 출제 (복습할 단어 -> 새 단어 순), 채점 결과로 다음 복습일 갱신
+# + [채점 엔진] 정답 후보는 시험을 만들 때 한 번만 정규화(core/grading.py), 제출 답안은 한 번에 채점해 결과 표로 보관
 
 import streamlit as st
 import random
-import re   
-from services.google_sheets import save_score
+from core.grading import QUIZ_KO_TO_ZH, QUIZ_ZH_TO_KO, build_answer_set, grade_submission, is_correct_answer, prepare_question, summarize_grades
+from core.srs import GRADE_AGAIN, GRADE_BLANK, GRADE_GOOD
+from services import srs_store
+from services.google_sheets import get_save_notice, save_score
+from services.vocab_session import get_vocab_store
 
 def check_answer(user_input, correct_answer):
     """
     [유연한 채점 로직]
     정답 데이터가 "넓다 광대하다" 또는 "넓다, 광대하다" 처럼 되어 있을 때,
     사용자가 쉼표나 공백으로 구분된 단어 중 하나만 입력해도 정답으로 인정합니다.
+    (문장부호/공백/전각 문자/끝의 조사 차이는 무시 - core/grading.py)
     """
-    # 1. 입력값 정제
-    user = str(user_input).strip()
-    if not user: 
-        return False # 입력 없으면 오답
-    
-    # 2. 정답 데이터 정제 (쉼표, 슬래시, 공백을 모두 구분자로 처리)
-    # 예: "넓다 광대하다" -> ['넓다', '광대하다']
-    # 예: "넓다, 광대하다" -> ['넓다', '광대하다']
-    candidates = re.split(r'[,/ ]+', str(correct_answer))
-    
-    # 리스트 정제 (빈 문자열 제거 및 공백 제거)
-    candidates = [c.strip() for c in candidates if c.strip()]
+    return is_correct_answer(user_input, build_answer_set(correct_answer))
 
-    # 3. 비교 (하나라도 일치하면 정답)
-    return user in candidates
+def _pick_records(vocab_df, card_ids, cards):
+    """고른 카드 순서대로 단어 레코드를 꺼냄 (같은 한자가 여러 번이면 첫 행)"""
+    picked = vocab_df.assign(_card=card_ids).drop_duplicates('_card').set_index('_card').loc[cards]
+    return picked.reset_index(drop=True).to_dict('records')
+
+def _record_reviews(nickname, quiz_data, results):
+    """제외하지 않은 문제의 채점 결과를 복습 스케줄에 반영"""
+    grades = {}
+    for q, row in zip(quiz_data, results.itertuples(index=False)):
+        if row.excluded or not q.get('card_id'):
+            continue
+        if row.is_correct:
+            grades[q['card_id']] = GRADE_GOOD
+        else:
+            grades[q['card_id']] = GRADE_AGAIN if row.user_ans else GRADE_BLANK
+    srs_store.record_reviews(nickname, grades)
+
+def _reset_quiz_state():
+    """재시험/단어 다시 선택 시 저장·채점 기록 초기화"""
+    for key in ('saved_to_sheets', 'srs_recorded', 'quiz_results'):
+        st.session_state.pop(key, None)
 
 def show_quiz_page():
     # 1. 기초 데이터 유효성 검사
     if 'quiz_vocab' not in st.session_state or st.session_state['quiz_vocab'].empty:
         # (혹시 quiz_vocab이 없으면 전체 단어장에서 가져오도록 호환성 처리)
-        if 'final_vocab_df' in st.session_state:
-            st.session_state['quiz_vocab'] = st.session_state['final_vocab_df']
+        if get_vocab_store() is not None:
+            st.session_state['quiz_vocab'] = get_vocab_store().df()
+            st.session_state['quiz_deck'] = get_vocab_store().view("srs_deck_all", lambda s: srs_store.make_deck(s.df()))
         else:
             st.warning("⚠️ 시험을 볼 단어가 없습니다. 업로드 화면에서 단어를 선택해 주세요.")
             if st.button("⬅️ 단어 선택하러 가기"):
@@ -51,7 +66,17 @@ def show_quiz_page():
     # ---------------------------------------------------------
     if 'current_quiz' not in st.session_state:
         max_limit = len(vocab_df)
+        nickname = st.session_state.get("nickname", "")
+        # 복습 카드 목록/키는 단어장 버전마다 한 번만 만든 것을 씀 (업로드 화면에서 시험 시작 때 보관)
+        deck = st.session_state.get('quiz_deck')
+        if deck is None:
+            deck = st.session_state['quiz_deck'] = srs_store.make_deck(vocab_df)
         st.info(f"💡 현재 선택된 단어는 총 {max_limit}개입니다.")
+        if nickname:
+            n_due = srs_store.count_due(nickname, deck)
+            st.caption(f"🔁 오늘 복습할 단어 {n_due}개를 먼저 내고, 남는 자리는 새 단어로 채웁니다.")
+        else:
+            st.caption("별명으로 로그인하면 틀린 단어를 기억해 두었다가 복습 시기에 맞춰 다시 냅니다.")
         
         q_count = st.number_input(
             "몇 문제를 풀까요?", 
@@ -60,25 +85,37 @@ def show_quiz_page():
             value=min(10, max_limit),
             step=1
         )
+        max_typos = 1 if st.checkbox("✏️ 한글/영문 답의 오타 1개까지 정답으로 인정", value=False) else 0
         
         if st.button("🚀 시험 시작하기", use_container_width=True, type="primary"):
-            samples = vocab_df.sample(n=int(q_count)).to_dict('records')
+            if nickname:
+                # 복습 대기열에서 출제 (복습 시각이 지난 단어 -> 처음 보는 단어 -> 곧 복습할 단어)
+                cards, _, _ = srs_store.draw_cards(nickname, deck, int(q_count))
+                samples = _pick_records(vocab_df, deck.card_ids, cards)
+                random.shuffle(samples)
+            else:
+                samples = vocab_df.sample(n=int(q_count)).to_dict('records')
             quiz_list = []
             for item in samples:
-                quiz_type = random.choice(['zh_to_ko', 'ko_to_zh'])
+                quiz_type = random.choice([QUIZ_ZH_TO_KO, QUIZ_KO_TO_ZH])
+                # 정답 후보는 여기서 한 번만 정규화해 고정 (결과 화면 리런 때 다시 쪼개지 않음)
+                answer, answers = prepare_question(item, quiz_type)
                 quiz_list.append({
                     'item': item,
+                    'card_id': str(item['zh']).strip(),
                     'type': quiz_type,
+                    'answer': answer,
+                    'answers': answers,
                     'user_ans': "",
                     'exclude': False 
                 })
             
             st.session_state['current_quiz'] = quiz_list
             st.session_state['quiz_finished'] = False
+            st.session_state['quiz_max_typos'] = max_typos
             
             # [재시험 시 저장 플래그 초기화]
-            if 'saved_to_sheets' in st.session_state:
-                del st.session_state['saved_to_sheets']
+            _reset_quiz_state()
             
             st.rerun()
         return
@@ -122,47 +159,50 @@ def show_quiz_page():
     # ---------------------------------------------------------
     else:
         st.subheader("📊 채점 결과")
-        correct_count = 0
-        excluded_count = 0 
-        
-        for i, q in enumerate(quiz_data):
+
+        # 제출 답안 전체를 한 번에 채점 (리런 때는 보관해 둔 결과 표를 그대로 사용)
+        results = st.session_state.get('quiz_results')
+        if results is None:
+            for q in quiz_data:
+                if 'answers' not in q: # 예전 버전에서 만든 시험
+                    q['answer'], q['answers'] = prepare_question(q['item'], q['type'])
+            results = grade_submission(quiz_data, max_typos=st.session_state.get('quiz_max_typos', 0))
+            st.session_state['quiz_results'] = results
+        correct_count, final_total, excluded_count = summarize_grades(results)
+
+        for i, (q, row) in enumerate(zip(quiz_data, results.itertuples(index=False))):
             # 제외된 문제는 채점하지 않고 건너뜀
-            if q.get('exclude'):
-                excluded_count += 1
+            if row.excluded:
                 with st.expander(f"문제 {i+1}: ⏭️ 제외됨", expanded=False):
                     st.write("사용자가 '문제 제외'를 선택한 항목입니다.")
                 continue
 
             item = q['item']
-            user_ans = q['user_ans'].strip()
-            
-            # [수정] 정답 여부 판단 로직 개선 (check_answer 함수 사용)
-            if q['type'] == 'zh_to_ko':
-                target_correct = str(item['ko'])
-                is_correct = check_answer(user_ans, target_correct)
-                display_correct = target_correct
+            if not row.is_correct:
+                label = '❌ 오답'
+            elif row.typo_distance:
+                label = '✅ 정답 (오타 허용)'
             else:
-                target_correct = str(item['zh'])
-                # 한자 문제도 혹시 동의어가 있을 수 있으니 check_answer 사용 (보통은 1개지만 유연하게)
-                is_correct = check_answer(user_ans, target_correct)
-                display_correct = target_correct
+                label = '✅ 정답'
 
             # 결과 표시
-            with st.expander(f"문제 {i+1}: {'✅ 정답' if is_correct else '❌ 오답'}", expanded=True):
+            with st.expander(f"문제 {i+1}: {label}", expanded=True):
                 col_q, col_a = st.columns(2)
                 with col_q:
-                    st.write(f"**문제:** {item['zh'] if q['type']=='zh_to_ko' else item['ko']}")
-                    st.write(f"**내 답:** {user_ans if user_ans else '(미입력)'}")
+                    st.write(f"**문제:** {item['zh'] if q['type'] == QUIZ_ZH_TO_KO else item['ko']}")
+                    st.write(f"**내 답:** {row.user_ans if row.user_ans else '(미입력)'}")
                 with col_a:
-                    st.write(f"**정답:** {display_correct}")
+                    st.write(f"**정답:** {q['answer']}")
                     st.write(f"**병음:** [{item.get('pinyin', '-')}]")
-                
-                if is_correct:
-                    correct_count += 1
+
+        # 복습 스케줄 갱신 (한 번만)
+        nickname = st.session_state.get("nickname", "")
+        if nickname and 'srs_recorded' not in st.session_state:
+            _record_reviews(nickname, quiz_data, results)
+            st.session_state['srs_recorded'] = True
 
         # 최종 스코어 계산 (모수 = 전체 문제 - 제외된 문제)
         st.divider()
-        final_total = len(quiz_data) - excluded_count
         
         if final_total > 0:
             score_percent = int(correct_count / final_total * 100)
@@ -176,10 +216,15 @@ def show_quiz_page():
                 if 'saved_to_sheets' not in st.session_state:
                     with st.spinner(f"☁️ {nickname}님의 점수 저장 중..."):
                         # save_score(별명, 시험유형, 점수)
-                        success = save_score(nickname, "단어시험(주관식)", score_percent)
+                        ticket = save_score(nickname, "단어시험(주관식)", score_percent)
                         
-                        if success:
-                            st.toast("✅ 구글 시트 저장 완료!", icon="🎉")
+                        if ticket:
+                            # 시트에 실제로 올라갔을 때만 '저장 완료', 아니면 '전송 대기'/'기기에 보관 중'으로 알림
+                            sent, notice = get_save_notice(ticket)
+                            if sent:
+                                st.toast(notice, icon="🎉")
+                            else:
+                                st.warning(notice)
                             st.session_state['saved_to_sheets'] = True
                         else:
                             st.error("❌ 저장 실패")
@@ -196,13 +241,11 @@ def show_quiz_page():
             del st.session_state['current_quiz']
             st.session_state['quiz_finished'] = False
             # 재시험을 위해 저장 기록 삭제
-            if 'saved_to_sheets' in st.session_state:
-                del st.session_state['saved_to_sheets']
+            _reset_quiz_state()
             st.rerun()
             
         if st.button("📁 단어 다시 선택하기", use_container_width=True):
             del st.session_state['current_quiz']
             st.session_state['quiz_status'] = 'ready'
-            if 'saved_to_sheets' in st.session_state:
-                del st.session_state['saved_to_sheets']
+            _reset_quiz_state()
             st.rerun()
\ No newline at end of file
@@ -2,9 +2,67 @@
 
 import streamlit as st
 import pandas as pd
-from core.text_change import change_text_from_upload
-from core.vocab_parser import change_text_to_vocab_df
-from services.llm import process_vocab_with_llm
+from core.text_change import iter_pages_from_upload
+from core.vocab_parser import iter_vocab_batches, vocab_rows_to_df, VOCAB_COLUMNS, OFFSET_COLUMNS
+from services.llm import get_async_client, process_vocab_with_llm
+from services.vocab_cache import make_cache_key, load_cached, save_to_cache
+from services import shared_vocab, srs_store
+from services.vocab_session import clear_vocab, get_vocab_store, use_shared_vocab
+
+# 분석 중 미리보기로 보여줄 단어 수
+PREVIEW_ROWS = 20
+
+def _load_vocab(uploaded_file, file_key):
+    """
+    [기능] 업로드 파일로 단어장 DataFrame을 만듭니다. (디스크 캐시 -> 없으면 추출/파싱, 빈칸이 남았으면 AI 보정)
+    - 공유 캐시(services/shared_vocab.py)에 없을 때만 불리고, 결과는 여러 세션이 같이 쓰므로 이후 고치지 않음
+    """
+    # [캐시] 예전에 분석했던 교재라면 추출/파싱을 건너뛰고 바로 불러옴
+    cached = load_cached(file_key)
+    if cached is not None:
+        text, final_df = cached
+        st.toast("⚡ 예전에 분석한 단어장을 바로 불러왔습니다!")
+    else:
+        with st.spinner(f"'{uploaded_file.name}' 파일을 분석 중입니다..."):
+            # core/text_change.py가 확장자에 따라 페이지 단위로 텍스트를 추출하고,
+            # 파서는 페이지가 들어오는 대로 단어를 찾아 바로 미리보기에 보여줍니다.
+            page_texts = []
+            def _pages():
+                for page_text in iter_pages_from_upload(uploaded_file):
+                    page_texts.append(page_text) # AI 보정용 원문 보관
+                    yield page_text
+
+            preview = st.empty()
+            rows = []
+            for batch in iter_vocab_batches(_pages(), level="HSK", source=uploaded_file.name):
+                rows.extend(batch)
+                with preview.container():
+                    st.caption(f"🔎 지금까지 `{len(rows)}`개 단어를 찾았습니다...")
+                    st.dataframe(vocab_rows_to_df(rows[:PREVIEW_ROWS])[VOCAB_COLUMNS], hide_index=True)
+            preview.empty()
+
+            text = "".join(page_texts)
+            final_df = vocab_rows_to_df(rows)
+
+    # [AI 보정] 빈칸 행이 남아 있으면 보정 (캐시에서 불러온 단어표도 포함)
+    # -> 지난번에 API 키가 없었거나 일부 검수가 실패해 빈칸으로 저장된 행은 다음에 불러올 때 다시 보정
+    n_missing = int((final_df['flags'] != 'OK').sum())
+    changed = cached is None
+    if n_missing > 0 and get_async_client() is not None:
+        st.info(f"📊 `{len(final_df)}`개 항목 중 빈칸 `{n_missing}`개를 발견하여 AI가 보정을 시작합니다.")
+        n_before = len(final_df)
+        final_df = process_vocab_with_llm(final_df, text)
+        n_left = int((final_df['flags'] != 'OK').sum())
+        changed = changed or n_left < n_missing or len(final_df) != n_before
+
+    if changed:
+        save_to_cache(file_key, text, final_df)
+    if cached is None:
+        st.toast("✨ 분석 완료!")
+
+    if '선택' not in final_df.columns:
+        final_df.insert(0, '선택', True)
+    return final_df
 
 def show_vocab_upload():
     if st.session_state.get('quiz_status') == 'playing':
@@ -26,37 +84,32 @@ def show_vocab_upload():
     )
 
     # 1. 파일을 새로 올렸을 때만 분석 로직 실행
+    # [수정] 파일명이 아니라 '파일 내용(해시)'으로 새 파일 여부를 판단 (이름만 바꾼 같은 교재는 그대로 사용)
     if uploaded_file:
-        if st.session_state.get('uploaded_filename') != uploaded_file.name:
-            if 'final_vocab_df' in st.session_state:
-                del st.session_state['final_vocab_df']
-
-        if 'final_vocab_df' not in st.session_state:
-            with st.spinner(f"'{uploaded_file.name}' 파일을 분석 중입니다..."):
-                # core/text_change.py가 확장자에 따라 자동으로 텍스트를 추출합니다.
-                text = change_text_from_upload(uploaded_file)
-                parsed_df = change_text_to_vocab_df(text, level="HSK", source=uploaded_file.name)
-            
-            n_parsed = len(parsed_df)
-            n_missing = len(parsed_df[parsed_df['flags'] != 'OK'])
-            
-            if n_missing > 0:
-                st.info(f"📊 `{n_parsed}`개 항목 중 빈칸 `{n_missing}`개를 발견하여 AI가 보정을 시작합니다.")
-                final_df = process_vocab_with_llm(parsed_df, text)
-            else:
-                final_df = parsed_df
+        # (같은 업로드에 대해 리런마다 해시를 다시 계산하지 않도록 file_id 기준으로 재사용)
+        if st.session_state.get('uploaded_file_id') == uploaded_file.file_id:
+            file_key = st.session_state['uploaded_file_key']
+        else:
+            file_key = make_cache_key(uploaded_file.getvalue())
+        if st.session_state.get('uploaded_file_key') != file_key:
+            clear_vocab()
 
-            if '선택' not in final_df.columns:
-                final_df.insert(0, '선택', True)
+        if get_vocab_store() is None:
+            # [공유 캐시] 같은 교재를 이미 다른 학생(세션)이 올렸다면 분석 없이 그 단어장을 참조만 함
+            shared, source = shared_vocab.get_or_load(file_key, lambda: _load_vocab(uploaded_file, file_key))
+            if source == shared_vocab.SOURCE_MEMORY:
+                st.toast("⚡ 같은 단어장을 바로 불러왔습니다!")
 
-            st.session_state['final_vocab_df'] = final_df
+            use_shared_vocab(shared)
             st.session_state['uploaded_filename'] = uploaded_file.name
-            st.toast("✨ 분석 완료!")
+            st.session_state['uploaded_file_key'] = file_key
+            st.session_state['uploaded_file_id'] = uploaded_file.file_id
 
     # ---------------------------------------------------------
     # 데이터가 있을 때 파일명과 목록 노출
     # ---------------------------------------------------------
-    if st.session_state.get('final_vocab_df') is not None:
+    store = get_vocab_store()
+    if store is not None:
         current_fname = st.session_state.get('uploaded_filename', '알 수 없는 파일')
         st.success(f"📂 **현재 불러온 파일:** `{current_fname}`")
 
@@ -68,17 +121,19 @@ def show_vocab_upload():
         """)
 
         with st.expander(f"👁️ [{current_fname}] 단어 목록 보기 및 수정 (클릭)", expanded=False):
-            df_to_show = st.session_state['final_vocab_df']
-            st.markdown(f"👇 **총 {len(df_to_show)}개의 항목이 검색되었습니다. 오타를 직접 클릭해서 고쳐보세요.**")
+            st.markdown(f"👇 **총 {len(store)}개의 항목이 검색되었습니다. 오타를 직접 클릭해서 고쳐보세요.**")
             
+            # 편집기에는 항상 같은 원본을 넣고(편집 내역 유지), 바뀐 내용은 저장소가 편집 내역으로 판단
             edited_df = st.data_editor(
-                df_to_show, 
+                store.base_df(), 
                 column_config={
                     "선택": st.column_config.CheckboxColumn(
                         "시험 포함",
                         help="시험에 포함할 단어만 체크하세요.",
                         default=True,
-                    )
+                    ),
+                    # 원문 좌표(AI 보정용 내부 데이터)는 숨김
+                    **{col: None for col in OFFSET_COLUMNS}
                 },
                 use_container_width=True, 
                 key="vocab_editor_final", 
@@ -86,15 +141,17 @@ def show_vocab_upload():
                 num_rows="dynamic" 
             )
             
-            st.session_state['final_vocab_df'] = edited_df
+            store.apply_edits(edited_df, st.session_state.get("vocab_editor_final"))
 
         if st.button("🚀 선택한 단어로 시험 시작하기", type="primary", use_container_width=True):
-            selected_vocab = st.session_state['final_vocab_df'][st.session_state['final_vocab_df']['선택'] == True].copy()
+            selected_vocab = store.selected_df().copy()
             
             if selected_vocab.empty:
                 st.error("시험을 볼 단어를 하나 이상 선택해 주세요!")
             else:
                 st.session_state['quiz_vocab'] = selected_vocab
+                # 복습 카드 목록/키도 단어장 버전마다 한 번만 만들어 함께 넘김
+                st.session_state['quiz_deck'] = store.view("srs_deck_selected", lambda s: srs_store.make_deck(s.selected_df()))
                 st.session_state['quiz_status'] = 'playing' 
                 st.balloons() 
                 st.rerun()
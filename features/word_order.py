@@ -4,8 +4,20 @@
 import streamlit as st
 import random
 from services.llm import generate_sentence_puzzle
+from services import question_pool
 # [중요] 점수 저장을 위한 함수 불러오기
-from services.google_sheets import save_score
+from services.google_sheets import get_save_notice, save_score
+from services.vocab_session import get_session_token, get_vocab_store
+
+def _start_puzzle(puzzle_data):
+    """새 문제를 화면 상태에 올립니다. (조각 섞기 + 조립 중인 답 초기화)"""
+    st.session_state['wo_current_puzzle'] = puzzle_data
+    st.session_state['wo_user_order'] = []
+    
+    pieces = puzzle_data['pieces'][:]
+    random.shuffle(pieces)
+    st.session_state['wo_shuffled_pieces'] = pieces
+
 
 def show_word_order_page():
     # ---------------------------------------------------------
@@ -33,11 +45,10 @@ def show_word_order_page():
     # ---------------------------------------------------------
     # 2. 데이터 유효성 검사 (단어장이 업로드되었는지 확인)
     # ---------------------------------------------------------
-    if 'final_vocab_df' not in st.session_state or st.session_state['final_vocab_df'] is None:
+    store = get_vocab_store()
+    if store is None:
         st.warning("⚠️ 먼저 [단어시험] 메뉴에서 단어장을 업로드해주세요.")
         return
-
-    df = st.session_state['final_vocab_df']
     
     # ---------------------------------------------------------
     # 3. 세션 상태 초기화
@@ -52,13 +63,19 @@ def show_word_order_page():
     # ---------------------------------------------------------
     # 4. 연습할 단어 선택 (Multi-Select)
     # ---------------------------------------------------------
-    target_words = df[df['선택'] == True]
+    # 선택지 라벨/단어 목록은 단어장 버전마다 한 번만 만듦 (클릭할 때마다 행 단위 변환 없음)
+    pool_words = store.selected_words()
     
-    if target_words.empty:
+    if not pool_words:
         st.error("업로드된 단어장에서 '선택'된 단어가 없습니다.")
         return
 
-    word_options = target_words.apply(lambda x: f"{x['zh']} ({x['ko']})", axis=1).tolist()
+    word_options = store.option_labels()
+
+    # [추가] 미리 만들어 둔 문제 풀은 '바로 출제' 버튼을 누를 때 만들고 채움 (화면을 보기만 해서는 생성 안 함)
+    #        풀은 세션끼리 공유하므로, 이 화면이 쓰는 단어장 키만 알려 둠 (아무도 안 쓰는 단어장의 풀은 버려짐)
+    pool_vocab_key = store.view("pool_key_selected", lambda s: question_pool.make_vocab_key(s.selected_words()))
+    question_pool.use_vocab((get_session_token(), "word_order"), pool_vocab_key)
     
     selected_options = st.multiselect(
         "연습할 단어를 선택하세요 (최대 3개):", 
@@ -77,6 +94,23 @@ def show_word_order_page():
     
     elif len(selected_words_zh) == 0:
         st.info("👆 위 박스에서 단어를 선택하면 문장 생성 버튼이 나타납니다.")
+
+        # [추가] 단어를 고르지 않아도, 미리 만들어 둔 문제(내 단어장 무작위 단어)를 바로 풀 수 있음
+        if st.button("⚡ 내 단어장에서 바로 출제 (무작위 단어)"):
+            puzzle_data = question_pool.take_puzzle(pool_words, pool_vocab_key)
+            if puzzle_data is None:
+                # 아직 준비된 문제가 없으면 지금 바로 생성
+                picked = random.sample(pool_words, min(len(pool_words), 3))
+                with st.spinner(f"'{', '.join(picked)}'를 넣은 문장을 짓는 중..."):
+                    puzzle_data = generate_sentence_puzzle(picked)
+                    if puzzle_data:
+                        puzzle_data['words'] = picked
+
+            if puzzle_data:
+                _start_puzzle(puzzle_data)
+                st.toast(f"출제 단어: {', '.join(puzzle_data['words'])}")
+            else:
+                st.error("AI가 문장을 생성하지 못했습니다. 다시 시도해주세요.")
         
     else:
         if st.button("✨ 선택한 단어들로 문장 만들기 (AI)", type="primary"):
@@ -86,12 +120,7 @@ def show_word_order_page():
                 puzzle_data = generate_sentence_puzzle(selected_words_zh)
                 
                 if puzzle_data:
-                    st.session_state['wo_current_puzzle'] = puzzle_data
-                    st.session_state['wo_user_order'] = []
-                    
-                    pieces = puzzle_data['pieces'][:]
-                    random.shuffle(pieces)
-                    st.session_state['wo_shuffled_pieces'] = pieces
+                    _start_puzzle(puzzle_data)
                 else:
                     st.error("AI가 문장을 생성하지 못했습니다. 다시 시도해주세요.")
 
@@ -184,8 +213,9 @@ def show_word_order_page():
                 # [점수 저장]
                 nickname = st.session_state.get("nickname", "")
                 if nickname:
-                    save_score(nickname, "어순 연습", 100)
-                    st.toast(f"💾 {nickname}님의 점수(100점)가 저장되었습니다!", icon="✅")
+                    ticket = save_score(nickname, "어순 연습", 100)
+                    sent, notice = get_save_notice(ticket)
+                    st.toast(f"💾 {nickname}님의 점수(100점)가 저장되었습니다!" if sent else notice, icon="✅" if sent else "💾")
                 else:
                     st.warning("⚠️ 별명이 입력되지 않아 점수가 저장되지 않았습니다. (사이드바에서 별명을 설정하세요)")
                 
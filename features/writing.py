@@ -9,13 +9,56 @@ import streamlit as st
 import random
 # [중요] services.llm에서 필요한 출제/채점 함수들을 모두 가져옴
 from services.llm import (
-    generate_scene_description,   # 100번 문제 출제 (4대 테마)
-    generate_image_from_text,     # 100번 이미지 생성
-    evaluate_writing_v2,          # 통합 채점 (가점제 로직)
+    start_scene_with_image,       # 100번 문제 출제 (4대 테마) + 이미지 생성 연쇄 실행
+    iter_evaluate_writing_v2,     # 통합 채점 (가점제 로직, 스트리밍)
+    EVENT_FIELD, EVENT_DONE, EVENT_ERROR,
     generate_hybrid_question_99   # [NEW] 99번 하이브리드 출제
 )
+from services import question_pool
 # [추가] 점수 저장을 위한 함수 불러오기
-from services.google_sheets import save_score
+from services.google_sheets import get_save_notice, save_score
+from services.vocab_session import get_session_token, get_vocab_store
+
+def _stream_feedback(mode, user_input, ref_data):
+    """
+    [스트리밍 채점] 채점 결과를 받는 대로 점수 -> 모범 답안 -> 해설 순으로 바로 보여줍니다.
+    끝나면 임시 화면을 지우고 전체 결과(dict)를 돌려줍니다. (실패 시 None)
+    """
+    live = st.empty()
+    with live.container():
+        score_ph = st.empty()
+        correction_ph = st.empty()
+        translation_ph = st.empty()
+        explanation_ph = st.empty()
+        better_ph = st.empty()
+    score_ph.caption("⏳ AI 감독관이 꼼꼼하게 평가 중입니다...")
+
+    result = None
+    for event in iter_evaluate_writing_v2(mode, user_input, ref_data):
+        kind = event[0]
+        if kind == EVENT_DONE:
+            result = event[1]
+            break
+        if kind == EVENT_ERROR:
+            break
+
+        _, field, value = event
+        if field == 'score' and kind == EVENT_FIELD:
+            score_ph.markdown(f"### 📊 점수: {value}점")
+        elif field == 'correction':
+            correction_ph.success(f"**모범 답안 (교정)**\n\n{value}")
+        elif field == 'translation':
+            translation_ph.caption(f"📝 해석: {value}")
+        elif field == 'explanation':
+            explanation_ph.info(f"👩‍🏫 {value}")
+        elif field == 'better_expression':
+            better_ph.markdown(f"✨ **추천 표현:** {value}")
+
+    live.empty() # 아래 '피드백 표시' 영역이 전체 결과를 다시 그림
+    if result is None:
+        st.error("채점에 실패했습니다. 잠시 후 다시 시도해주세요.")
+    return result
+
 
 def show_writing_page():
     st.subheader("✍️ HSK 5급 실전 작문")
@@ -23,10 +66,8 @@ def show_writing_page():
     # ---------------------------------------------------------
     # 1. 데이터 유효성 체크
     # ---------------------------------------------------------
-    vocab_ready = False
-    if 'final_vocab_df' in st.session_state and st.session_state['final_vocab_df'] is not None:
-        vocab_ready = True
-        df = st.session_state['final_vocab_df']
+    store = get_vocab_store()
+    vocab_ready = store is not None
 
     # ---------------------------------------------------------
     # 2. 세션 상태(Session State) 초기화
@@ -56,8 +97,13 @@ def show_writing_page():
         
         # 1. 문제 출제 버튼
         if vocab_ready:
-            # 내 단어장을 딕셔너리 리스트로 변환
-            all_words = df.to_dict('records')
+            # 내 단어장 레코드 리스트 (단어장 버전이 같으면 리런해도 다시 변환하지 않음)
+            all_words = store.records()
+
+            # [추가] 99번 제시어 세트 풀은 출제 버튼을 누를 때 만들고 채움 (화면을 보기만 해서는 생성 안 함)
+            #        풀은 세션끼리 공유하므로, 이 화면이 쓰는 단어장 키만 알려 둠 (아무도 안 쓰는 단어장의 풀은 버려짐)
+            pool_vocab_key = store.view("pool_key_all", lambda s: question_pool.make_vocab_key([w['zh'] for w in s.records()]))
+            question_pool.use_vocab((get_session_token(), "writing_99"), pool_vocab_key)
             
             # [버튼] 하이브리드 문제 생성
             if st.button("🔀 실전 문제 생성 (내 단어 + 트렌드 믹스)", type="primary", use_container_width=True):
@@ -65,18 +111,20 @@ def show_writing_page():
                 if len(all_words) < 3:
                       st.error(f"⚠️ 단어장에 최소 3개 이상의 단어가 있어야 믹스 출제가 가능합니다. (현재 {len(all_words)}개)")
                 else:
-                    with st.spinner("AI 출제위원이 회원님 단어와 2025 트렌드를 조합 중입니다..."):
-                        # [핵심] services/llm.py의 하이브리드 함수 호출
-                        hybrid_data = generate_hybrid_question_99(all_words)
-                        
-                        if hybrid_data:
-                            # 결과 세션에 저장
-                            st.session_state['wr_99_words'] = hybrid_data['words']
-                            st.session_state['wr_99_theme'] = hybrid_data.get('theme', '알 수 없음')
-                            st.session_state['wr_99_feedback'] = None # 새 문제이므로 피드백 리셋
-                            st.rerun()
-                        else:
-                            st.error("문제 생성에 실패했습니다. 잠시 후 다시 시도해주세요.")
+                    # [변경] 미리 만들어 둔 세트가 있으면 바로 꺼내 씀 (없으면 지금 생성)
+                    hybrid_data = question_pool.take_hybrid_99(all_words, pool_vocab_key)
+                    if hybrid_data is None:
+                        with st.spinner("AI 출제위원이 회원님 단어와 2025 트렌드를 조합 중입니다..."):
+                            # [핵심] services/llm.py의 하이브리드 함수 호출
+                            hybrid_data = generate_hybrid_question_99(all_words)
+                    if hybrid_data:
+                        # 결과 세션에 저장
+                        st.session_state['wr_99_words'] = hybrid_data['words']
+                        st.session_state['wr_99_theme'] = hybrid_data.get('theme', '알 수 없음')
+                        st.session_state['wr_99_feedback'] = None # 새 문제이므로 피드백 리셋
+                        st.rerun()
+                    else:
+                        st.error("문제 생성에 실패했습니다. 잠시 후 다시 시도해주세요.")
         else:
             st.warning("⚠️ 단어장이 없습니다. [단어시험] 메뉴에서 파일을 먼저 업로드해주세요.")
 
@@ -121,16 +169,16 @@ def show_writing_page():
                     if not user_input.strip():
                         st.warning("내용을 입력하세요.")
                     else:
-                        with st.spinner("AI 감독관이 꼼꼼하게 평가 중입니다..."):
-                            # 통합 채점 함수 호출
-                            feedback = evaluate_writing_v2('99', user_input, target_zh_list)
-                            st.session_state['wr_99_feedback'] = feedback
-                            
-                            # [수정] 제출 시점에 닉네임이 있으면 바로 저장
-                            nickname = st.session_state.get("nickname", "")
-                            if nickname:
-                                save_score(nickname, "작문(99번)", feedback['score'])
-                                st.toast("💯 점수가 저장되었습니다!")
+                        # [변경] 통합 채점 결과를 스트리밍으로 받아 점수부터 바로 표시
+                        feedback = _stream_feedback('99', user_input, target_zh_list)
+                        st.session_state['wr_99_feedback'] = feedback
+                        
+                        # [수정] 제출 시점에 닉네임이 있으면 바로 저장
+                        nickname = st.session_state.get("nickname", "")
+                        if nickname and feedback:
+                            ticket = save_score(nickname, "작문(99번)", feedback['score'])
+                            sent, notice = get_save_notice(ticket)
+                            st.toast("💯 점수가 저장되었습니다!" if sent else notice)
             
             # 4. 피드백 표시
             fb = st.session_state['wr_99_feedback']
@@ -144,8 +192,9 @@ def show_writing_page():
                     if c_btn.button("저장하기", key="btn_save_nick_99"):
                         if new_nick:
                             st.session_state["nickname"] = new_nick
-                            save_score(new_nick, "작문(99번)", fb['score'])
-                            st.success(f"✅ {new_nick}님, 점수가 안전하게 저장되었습니다!")
+                            ticket = save_score(new_nick, "작문(99번)", fb['score'])
+                            sent, notice = get_save_notice(ticket)
+                            st.toast(f"✅ {new_nick}님, 점수가 저장되었습니다!" if sent else notice) # 리런 뒤에도 보이도록 toast
                             st.rerun() # 사이드바 갱신을 위해 리런
                         else:
                             st.error("별명을 입력해주세요.")
@@ -187,17 +236,21 @@ def show_writing_page():
         
         # 1. 문제 생성 버튼
         if st.button("🎲 100번 실전 문제 받기 (4대 빈출 테마)", type="primary"):
-            # 1) 텍스트 상황 생성 (기존 generate_scene_description 사용)
+            # [변경] 상황 묘사 -> 이미지 생성을 백그라운드에서 한 번에 연결해서 요청
+            #        (묘사가 도착하는 순간 이미지 요청이 바로 나가므로 스크립트 스레드를 거치지 않음)
+            scene_future, image_future = start_scene_with_image()
+
+            # 1) 텍스트 상황 생성
             with st.spinner("1. 출제위원이 최근 기출 경향을 분석 중..."):
-                scene_data = generate_scene_description() 
+                scene_data = scene_future.result()
                 st.session_state['wr_100_scene'] = scene_data
                 st.session_state['wr_100_feedback'] = None
                 st.session_state['wr_100_image_url'] = None 
             
-            # 2) 이미지 생성 (DALL-E)
+            # 2) 이미지 생성 (DALL-E) - 이미 진행 중인 요청의 결과만 기다림
             if scene_data:
                 with st.spinner("2. AI 화가가 그림을 그리는 중... (약 10초)"):
-                    img_url = generate_image_from_text(scene_data['scene_desc'])
+                    img_url = image_future.result()
                     st.session_state['wr_100_image_url'] = img_url
 
         # 2. 문제 표시
@@ -226,15 +279,16 @@ def show_writing_page():
                     if not user_input.strip():
                         st.warning("내용을 입력하세요.")
                     else:
-                        with st.spinner("AI 채점관이 '서사'와 '테마 적합성'을 평가 중..."):
-                            feedback = evaluate_writing_v2('100', user_input, scene['scene_desc'])
-                            st.session_state['wr_100_feedback'] = feedback
+                        # [변경] '서사'와 '테마 적합성' 채점 결과를 스트리밍으로 받아 점수부터 바로 표시
+                        feedback = _stream_feedback('100', user_input, scene['scene_desc'])
+                        st.session_state['wr_100_feedback'] = feedback
 
-                            # [수정] 제출 시점에 닉네임이 있으면 바로 저장
-                            nickname = st.session_state.get("nickname", "")
-                            if nickname:
-                                save_score(nickname, "작문(100번)", feedback['score'])
-                                st.toast("💯 점수가 저장되었습니다!")
+                        # [수정] 제출 시점에 닉네임이 있으면 바로 저장
+                        nickname = st.session_state.get("nickname", "")
+                        if nickname and feedback:
+                            ticket = save_score(nickname, "작문(100번)", feedback['score'])
+                            sent, notice = get_save_notice(ticket)
+                            st.toast("💯 점수가 저장되었습니다!" if sent else notice)
 
             # 4. 피드백 표시
             fb = st.session_state['wr_100_feedback']
@@ -248,8 +302,9 @@ def show_writing_page():
                     if c_btn.button("저장하기", key="btn_save_nick_100"):
                         if new_nick:
                             st.session_state["nickname"] = new_nick
-                            save_score(new_nick, "작문(100번)", fb['score'])
-                            st.success(f"✅ {new_nick}님, 점수가 안전하게 저장되었습니다!")
+                            ticket = save_score(new_nick, "작문(100번)", fb['score'])
+                            sent, notice = get_save_notice(ticket)
+                            st.toast(f"✅ {new_nick}님, 점수가 저장되었습니다!" if sent else notice) # 리런 뒤에도 보이도록 toast
                             st.rerun()
                         else:
                             st.error("별명을 입력해주세요.")
@@ -0,0 +1,95 @@
+# 경로: services/async_runtime.py
+# [설명] 비동기(async) 호출을 Streamlit 스크립트 스레드에서 쓰기 위한 전용 이벤트 루프
+# - 프로세스당 이벤트 루프 1개를 백그라운드 스레드에서 계속 돌림
+#   -> AsyncOpenAI/httpx 연결 풀이 항상 같은 루프에 묶여 재사용됨 (매번 asyncio.run으로 새 루프를 만들면 풀을 못 씀)
+# - submit(): 코루틴을 루프에 올리고 concurrent.futures.Future를 돌려줌 (결과를 나중에 기다릴 수 있음)
+# - run_sync(): 코루틴 하나를 실행하고 결과를 기다림 (동기 함수 래퍼용)
+# - run_concurrently(): 서로 독립적인 코루틴 여러 개를 동시에 실행하고 한꺼번에 결과를 받음
+# - iter_async(): 비동기 제너레이터(스트리밍 응답)를 동기 for 문으로 받음 (중간에 그만 받으면 루프 쪽 작업도 취소)
+
+import asyncio
+import queue
+import threading
+
+_loop = None
+_lock = threading.Lock()
+
+
+def get_loop():
+    """[기능] 공유 이벤트 루프를 (처음 한 번만) 띄우고 돌려줍니다."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="voca-async-loop", daemon=True)
+            thread.start()
+            _loop = loop
+    return _loop
+
+
+def submit(coro):
+    """
+    [기능] 코루틴을 공유 루프에서 실행하도록 넘기고 바로 돌아옵니다.
+    Returns: concurrent.futures.Future (.result()로 결과 대기)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run_sync(coro):
+    """
+    [기능] 코루틴 하나를 공유 루프에서 실행하고 결과를 돌려줍니다.
+    (공유 루프 스레드 안에서 부르면 교착되므로 금지 -> 그 안에서는 await를 쓰세요)
+    """
+    loop = get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("run_sync()는 공유 이벤트 루프 안에서 부를 수 없습니다. await를 사용하세요.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def run_concurrently(*coros, return_exceptions=False):
+    """
+    [기능] 독립적인 코루틴들을 동시에 실행하고, 넘긴 순서대로 결과 리스트를 돌려줍니다.
+    예: scene, words = run_concurrently(agenerate_scene_description(), asearch_word_info("爱惜"))
+    """
+    async def _gather():
+        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+    return run_sync(_gather())
+
+
+_END = object()
+
+
+def iter_async(agen):
+    """
+    [기능] 비동기 제너레이터(async generator)를 공유 루프에서 돌리고, 나오는 값을 동기 for 문으로 받게 해줍니다.
+    (스트리밍 응답을 받는 대로 Streamlit 화면에 그릴 때 사용)
+    받는 쪽이 중간에 멈추면(break, Streamlit 리런 등) 공유 루프의 작업도 취소 -> 버려진 스트림을 끝까지 받지 않음
+    """
+    items = queue.Queue()
+
+    async def _pump():
+        try:
+            async for item in agen:
+                items.put((True, item))
+        except Exception as e:
+            items.put((False, e))
+        finally:
+            items.put(_END)
+            await agen.aclose()
+
+    future = submit(_pump())
+    try:
+        while True:
+            entry = items.get()
+            if entry is _END:
+                return
+            ok, value = entry
+            if not ok:
+                raise value
+            yield value
+    finally:
+        future.cancel() # 이미 끝났으면 아무 일도 없음
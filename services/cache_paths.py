@@ -0,0 +1,19 @@
+# 경로: services/cache_paths.py
+# [설명] 로컬 캐시/저장소 파일들이 놓일 폴더 위치를 한 곳에서 관리
+
+import os
+from pathlib import Path
+
+# 기본 위치: 프로젝트 루트의 .cache/ (환경변수 VOCA_CACHE_DIR로 변경 가능)
+DEFAULT_CACHE_ROOT = Path(__file__).resolve().parent.parent / ".cache"
+
+
+def get_cache_dir(*parts):
+    """
+    [기능] 캐시 루트 아래의 하위 폴더 경로를 돌려줍니다. (없으면 생성)
+    예: get_cache_dir("vocab") -> <프로젝트>/.cache/vocab
+    """
+    root = Path(os.getenv("VOCA_CACHE_DIR", DEFAULT_CACHE_ROOT))
+    path = root.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,88 @@
+# 경로: services/fake_sheets.py
+# [설명] 구글 시트 없이 로컬에서 돌려볼 수 있는 메모리 기반 가짜 백엔드
+# - VOCA_SHEETS_BACKEND=fake 로 실행하면 services/google_sheets.py가 이 백엔드를 사용
+# - gspread에서 이 앱이 쓰는 메서드만 흉내내고, API 호출 횟수를 세어 연결 재사용 여부를 확인할 수 있음
+
+import threading
+from collections import Counter
+
+SCORE_HEADER = ["날짜", "별명", "시험유형", "점수", "전송ID"]
+
+
+class FakeWorksheet:
+    def __init__(self, header=None, calls=None):
+        self._lock = threading.Lock()
+        self._rows = [list(header or SCORE_HEADER)]
+        self.calls = calls if calls is not None else Counter()
+
+    def append_row(self, values, **kwargs):
+        with self._lock:
+            self.calls["append_row"] += 1
+            self._rows.append(list(values))
+
+    def append_rows(self, values, **kwargs):
+        with self._lock:
+            self.calls["append_rows"] += 1
+            self._rows.extend(list(v) for v in values)
+
+    def get_all_values(self, **kwargs):
+        with self._lock:
+            self.calls["get_all_values"] += 1
+            return [list(r) for r in self._rows]
+
+    def get_values(self, range_name=None, **kwargs):
+        """'A5:E' 처럼 시작 행부터 끝까지의 범위만 지원 (열은 전부 반환)"""
+        with self._lock:
+            self.calls["get_values"] += 1
+            start = 1
+            if range_name:
+                first_cell = range_name.split(":")[0]
+                digits = "".join(ch for ch in first_cell if ch.isdigit())
+                start = int(digits) if digits else 1
+            # 실제 시트처럼 값은 표시 문자열로 돌려줌
+            return [[str(v) for v in r] for r in self._rows[start - 1:]]
+
+    def get_all_records(self, **kwargs):
+        with self._lock:
+            self.calls["get_all_records"] += 1
+            header = self._rows[0]
+            return [dict(zip(header, r)) for r in self._rows[1:]]
+
+
+class FakeSpreadsheet:
+    def __init__(self, calls):
+        self.sheet1 = FakeWorksheet(calls=calls)
+
+
+class FakeSheetsClient:
+    """
+    gspread.Client 대용. open(이름)은 같은 이름이면 같은 스프레드시트를 돌려줍니다.
+    calls: 메서드별 호출 횟수 (예: calls["open"], calls["append_row"])
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spreadsheets = {}
+        self.calls = Counter()
+
+    def open(self, title):
+        with self._lock:
+            self.calls["open"] += 1
+            if title not in self._spreadsheets:
+                self._spreadsheets[title] = FakeSpreadsheet(self.calls)
+            return self._spreadsheets[title]
+
+
+# 프로세스 하나에 가짜 '구글 드라이브' 하나 (재인증해도 데이터는 유지)
+_fake_client = FakeSheetsClient()
+_authorize_count = 0
+
+
+def authorize():
+    """gspread.authorize 대용: 호출 횟수만 세고 같은 클라이언트를 돌려줍니다."""
+    global _authorize_count
+    _authorize_count += 1
+    return _fake_client
+
+
+def get_authorize_count():
+    return _authorize_count
@@ -1,15 +1,48 @@
 # 경로: services/google_sheets.py
 # [설명] 구글 시트 인증 및 데이터 저장 함수
 
-import streamlit as st
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+import os
+import threading
+import time
 from datetime import datetime
+
+import streamlit as st
 import pandas as pd
 
-# 1. 구글 시트 인증 및 연결
-def get_db_connection():
-    try:
+from services import fake_sheets, score_mirror, score_queue, score_rollups
+# [참고] gspread/oauth2client(인증), pyarrow(score_store, 대시보드)는 실제로 쓸 때 import
+#        -> 점수 저장만 하는 페이지에서는 무거운 의존성을 불러오지 않음
+
+SHEET_NAME = "voca_db"
+
+# 인증 토큰은 보통 1시간 유효 -> 만료 전에 미리 다시 인증
+TOKEN_MAX_AGE = 45 * 60
+
+# 점수 저장 직후 시트 전송을 기다리는 최대 시간(초) - 넘으면 '전송 대기 중'으로 알림
+SAVE_NOTICE_WAIT = 3.0
+
+# 0. 연결 관리자 (프로세스 전체에서 공유)
+class SheetsConnectionManager:
+    """
+    [기능] 인증된 gspread 클라이언트와 워크시트(sheet1) 핸들을 한 번만 만들어 재사용합니다.
+    - 예전에는 저장/조회 때마다 인증 + open()까지 API를 3번 호출했지만, 이제는 실제 작업 1번만 호출
+    - TOKEN_MAX_AGE가 지나거나 인증 오류(401)가 나면 자동으로 다시 인증
+    - Streamlit 세션(스레드)끼리 동시에 불러도 안전하도록 잠금 사용
+    - 환경변수 VOCA_SHEETS_BACKEND=fake 이면 로컬 가짜 백엔드(services/fake_sheets.py) 사용
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._worksheet = None
+        self._authorized_at = 0.0
+
+    def _authorize(self):
+        if os.getenv("VOCA_SHEETS_BACKEND", "google") == "fake":
+            return fake_sheets.authorize()
+
+        import gspread
+        from oauth2client.service_account import ServiceAccountCredentials
+
         # 인증 범위 설정
         scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
         
@@ -18,8 +51,86 @@ def get_db_connection():
         creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
         
         # gspread 연결
-        client = gspread.authorize(creds)
-        return client
+        return gspread.authorize(creds)
+
+    def _is_expired(self):
+        return time.time() - self._authorized_at > TOKEN_MAX_AGE
+
+    def get_client(self):
+        with self._lock:
+            if self._client is None or self._is_expired():
+                self._client = self._authorize()
+                self._worksheet = None
+                self._authorized_at = time.time()
+            return self._client
+
+    def get_worksheet(self):
+        client = self.get_client()
+        with self._lock:
+            if self._worksheet is None:
+                self._worksheet = client.open(SHEET_NAME).sheet1
+            return self._worksheet
+
+    def invalidate(self):
+        """다음 요청 때 처음부터 다시 인증하도록 캐시를 비웁니다."""
+        with self._lock:
+            self._client = None
+            self._worksheet = None
+
+    def run(self, fn):
+        """
+        워크시트를 받아 fn(sheet)을 실행합니다.
+        인증 만료(401)로 실패하면 한 번만 재인증 후 다시 시도합니다.
+        """
+        try:
+            return fn(self.get_worksheet())
+        except Exception as e:
+            if not _is_auth_error(e):
+                raise
+            self.invalidate()
+            return fn(self.get_worksheet())
+
+
+def _is_auth_error(e):
+    """gspread 인증 만료 오류(401)인지 확인합니다. (gspread는 이미 인증 때 import 되어 있음)"""
+    from gspread.exceptions import APIError
+    return isinstance(e, APIError) and getattr(e, "code", None) == 401
+
+
+# 행 내용과 상관없이 시트 쪽 사정으로 나는 오류 코드 (인증/권한/시간 초과/요청 한도/서버 오류)
+TRANSIENT_API_CODES = {401, 403, 408, 429, 500, 502, 503, 504}
+
+
+def is_transient_error(e):
+    """
+    [기능] 점수 전송 오류가 '다시 보내면 될 수 있는' 일시적 오류인지 판단합니다.
+    연결 끊김/시간 초과와 TRANSIENT_API_CODES 응답은 True, 그 밖(잘못된 값 등 행 자체의 문제)은 False
+    """
+    if isinstance(e, (ConnectionError, TimeoutError, OSError)):
+        return True
+    try:
+        from gspread.exceptions import APIError
+    except ImportError:
+        return False
+    return isinstance(e, APIError) and getattr(e, "code", None) in TRANSIENT_API_CODES
+
+
+_connection = SheetsConnectionManager()
+
+# 1. 구글 시트 인증 및 연결
+def get_db_connection():
+    try:
+        return _connection.get_client()
+    except Exception as e:
+        st.error(f"구글 시트 연결 실패: {e}")
+        return None
+
+def get_worksheet():
+    """
+    [기능] 점수 기록용 워크시트(voca_db의 sheet1)를 돌려줍니다. (연결 실패 시 None)
+    """
+    try:
+        return _connection.get_worksheet()
     except Exception as e:
         st.error(f"구글 시트 연결 실패: {e}")
         return None
@@ -31,56 +142,124 @@ def save_score(nickname, exam_type, score):
     - nickname: 학습자 별명
     - exam_type: 시험 종류 (예: 단어시험, 작문)
     - score: 점수
+    [변경] 시트에 바로 쓰지 않고 로컬 스풀에 접수한 뒤 즉시 돌아옵니다. (write-behind)
+           실제 전송은 services/score_queue.py의 백그라운드 워커가 묶어서 처리합니다.
+           성공하면 접수 번호(0보다 큰 정수, '접수됨'이라는 뜻)를, 실패하면 False를 돌려줍니다.
+           화면에 알릴 문구는 이 접수 번호로 get_save_notice(ticket)에서 정합니다.
     """
-    client = get_db_connection()
-    if not client:
-        return False
-
     try:
-        sheet = client.open("voca_db").sheet1
-        
-        # 현재 시간 (한국 포맷)
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # 저장할 데이터 리스트
-        row_data = [current_time, nickname, exam_type, score]
-        
-        # 시트에 한 줄 추가 (append_row)
-        sheet.append_row(row_data)
-        return True
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return score_queue.enqueue_score(nickname, exam_type, score, created_at=created_at)
         
     except Exception as e:
         print(f"데이터 저장 중 오류 발생: {e}")
         return False
 
+def get_save_notice(ticket, timeout=SAVE_NOTICE_WAIT):
+    """
+    [기능] save_score() 직후 화면에 보여줄 (시트 저장 여부, 문구)
+    - ticket: save_score()가 돌려준 접수 번호
+    - 그 행이 실제로 시트에 전송되었을 때만 '저장 완료' (최대 timeout초 기다림)
+    - 시트에 닿지 못하고 있으면 '기기에 보관 중', 아직 전송 전이면 '접수됨/전송 대기'로 알림
+    """
+    if ticket and score_queue.get_status()["last_error"] is None:
+        # 최근 전송이 성공하고 있을 때만 잠깐 기다림 (연결이 끊긴 동안은 워커가 재시도 대기 중)
+        if score_queue.wait_until_sent(ticket, timeout):
+            return True, "✅ 구글 시트 저장 완료!"
+    elif ticket and score_queue.is_sent(ticket):
+        return True, "✅ 구글 시트 저장 완료!"
+
+    status = score_queue.get_status()
+    if status["last_error"] is not None:
+        return False, f"💾 구글 시트에 연결하지 못해 점수를 기기에 보관했습니다. 연결되면 자동으로 전송됩니다. (대기 {status['pending']}건)"
+    return False, f"📨 점수를 접수했습니다. 구글 시트로 전송 대기 중입니다. (대기 {status['pending']}건)"
+
+def append_score_rows(rows):
+    """
+    [기능] 여러 점수 행([날짜, 별명, 시험유형, 점수, 전송ID], ...)을 한 번의 API 호출로 시트에 추가합니다.
+    (점수 큐 워커 전용, 실패하면 예외를 그대로 올려 재시도하게 함)
+    전송ID는 숨김 열(E열)에 들어가며, 같은 행이 두 번 전송돼도 로컬 사본이 하나만 반영합니다.
+    """
+    _connection.run(lambda sheet: sheet.append_rows(rows))
+
 # 3. 데이터 불러오기 함수 (대시보드용)
+
+# 사본 동기화 -> 반영 행 수 확인 -> 추가/재구축을 한 번에 한 세션만 하도록 잠금
+# (나눠서 하면 다른 세션의 재구축이 이미 넣은 행을 이쪽이 한 번 더 추가해 영구히 두 번 세게 됨)
+_sync_lock = threading.Lock()
+
+def _sync_local_copies():
+    """
+    시트에 새로 추가된 행만 받아 로컬 사본(score_mirror)에 붙이고,
+    같은 행을 대시보드용 컬럼형 저장소(score_store)와 요약 롤업(score_rollups)에도 반영합니다.
+    """
+    with _sync_lock:
+        _sync_local_copies_locked()
+
+def _sync_local_copies_locked():
+    from services import score_store
+
+    try:
+        # 지난번 이후 새로 추가된 행만 가져옴 (API 1회, 작은 범위)
+        new_rows = _connection.run(score_mirror.sync_mirror)
+    except Exception as e:
+        # 동기화에 실패해도 로컬 사본에 있는 기록은 보여줌
+        print(f"데이터 동기화 오류: {e}")
+        new_rows = []
+
+    mirror_rows = score_mirror.count_rows()
+    # 저장소/롤업이 사본과 어긋나면(처음 실행, 사본 재구축, 로컬 캐시 삭제 등) 사본 전체로 다시 만듦
+    store_synced = score_store.get_applied_mirror_rows() + len(new_rows) == mirror_rows
+    rollups_synced = score_rollups.get_applied_mirror_rows() + len(new_rows) == mirror_rows
+    all_rows = None if store_synced and rollups_synced else score_mirror.all_rows()
+
+    if not store_synced:
+        score_store.rebuild_store(all_rows)
+    elif new_rows:
+        score_store.append_rows(new_rows, mirror_rows)
+
+    if not rollups_synced:
+        score_rollups.rebuild_rollups(all_rows)
+    elif new_rows:
+        score_rollups.append_rows(new_rows, mirror_rows)
+
 def load_data_by_nickname(nickname):
     """
     [기능] 구글 시트에서 특정 별명(nickname)을 가진 사람의 기록만 싹 긁어옵니다.
+    [변경] 시트 전체를 내려받지 않고, 로컬 사본(services/score_mirror.py)에
+           새로 추가된 행만 받아 붙인 뒤 별명 인덱스로 조회합니다.
     """
-    client = get_db_connection()
-    if not client:
+    if get_worksheet() is None:
         return pd.DataFrame() # 연결 실패 시 빈 표 반환
 
+    _sync_local_copies()
+
     try:
-        sheet = client.open("voca_db").sheet1
-        
-        # 시트의 모든 데이터를 가져옴 (리스트 형태)
-        all_records = sheet.get_all_records()
-        
-        # Pandas DataFrame(표)으로 변환
-        df = pd.DataFrame(all_records)
+        # [핵심 로직] 내 별명과 똑같은 행만 로컬에서 조회
+        my_data = score_mirror.query_by_nickname(nickname)
         
         # 데이터가 비어있으면 빈 표 반환
-        if df.empty:
+        if my_data.empty:
             return pd.DataFrame()
 
-        # [핵심 로직] 내 별명과 똑같은 행만 필터링!
-        # (구글 시트 헤더가 '별명'이어야 함)
-        my_data = df[df['별명'] == nickname]
-        
         return my_data
         
     except Exception as e:
         print(f"데이터 불러오기 오류: {e}")
-        return pd.DataFrame()    
\ No newline at end of file
+        return pd.DataFrame()
+
+def load_score_history(nickname, start=None, end=None):
+    """
+    [기능] 대시보드용: 특정 별명의 기록을 타입이 정해진 Arrow 테이블(시간순)로 돌려줍니다.
+    (컬럼: created_at, nickname, exam_type, score / 집계는 services/score_store.summarize 사용)
+    """
+    from services import score_store
+
+    if get_worksheet() is not None:
+        _sync_local_copies()
+
+    try:
+        return score_store.load_history(nickname, start=start, end=end)
+    except Exception as e:
+        print(f"데이터 불러오기 오류: {e}")
+        return score_store.empty_history()
@@ -1,14 +1,128 @@
 # 경로: services/llm.py
 
 import os, json
+import asyncio
+import threading
 import pandas as pd
-from openai import OpenAI
 import streamlit as st
 from dotenv import load_dotenv
 import random 
+from concurrent.futures import as_completed
+from services import llm_cache
+from services.async_runtime import iter_async, run_concurrently, run_sync, submit
+from core.json_stream import EVENT_FIELD, EVENT_PARTIAL, JSONObjectStreamParser
 
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# =============================================================================
+# [공통] 공유 AsyncOpenAI 클라이언트 (연결 풀 1개를 프로세스 전체에서 재사용)
+# =============================================================================
+# - 예전에는 import 시점에 동기 OpenAI 클라이언트를 만들었음 (키가 없으면 import부터 실패)
+# - 이제는 처음 호출할 때 한 번만 만들고(openai/httpx import도 이때), services/async_runtime.py의 전용 이벤트 루프에서만 사용
+# - 모든 a* 함수는 이 루프 위에서 동시에 실행될 수 있고, 동기 함수들은 run_sync()로 감싼 얇은 래퍼
+
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+REQUEST_TIMEOUT = 120
+
+_async_client = None
+_client_lock = threading.Lock()
+
+
+def get_async_client():
+    """
+    [기능] 공유 AsyncOpenAI 클라이언트를 돌려줍니다. (API 키가 없으면 None)
+    - 환경변수 VOCA_LLM_BACKEND=standin 이면 API 키 없이 로컬 대역(services/llm_standin.py)에 연결
+    """
+    global _async_client
+    with _client_lock:
+        if _async_client is None:
+            standin = os.getenv("VOCA_LLM_BACKEND", "openai") == "standin"
+            api_key = os.getenv("OPENAI_API_KEY") or ("standin" if standin else None)
+            if not api_key:
+                return None
+            import httpx
+            from openai import AsyncOpenAI
+
+            transport, base_url = None, None
+            if standin:
+                from services.llm_standin import BASE_URL, StandInTransport
+                transport, base_url = StandInTransport(), BASE_URL
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+                timeout=REQUEST_TIMEOUT,
+                transport=transport,
+            )
+            _async_client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+    return _async_client
+
+# =============================================================================
+# [공통] 응답 캐시를 거치는 Chat Completions 호출
+# =============================================================================
+
+# 캐시 이름(함수)별 유효기간(초)
+CACHE_TTLS = {
+    "vocab_repair": 30 * 24 * 3600,      # 단어 검수 (temperature 0, 원문 조각이 같으면 결과도 같음)
+    "search_word_info": 7 * 24 * 3600,   # 단어사전
+    "evaluate_writing": 24 * 3600,       # 작문 채점 (같은 답안 재제출)
+    "sentence_puzzle": 3600,             # 아래 창작형 함수들은 기본적으로 캐시를 건너뜀
+    "hybrid_question_99": 3600,
+    "scene_description": 3600,
+}
+
+# 이 온도 이상인 호출은 '매번 새로운 결과'가 목적이므로 기본적으로 캐시를 건너뜀
+CREATIVE_TEMPERATURE = 0.5
+
+
+async def _alookup_cache(cache_name, model, messages, temperature, response_format=None, use_cache=None):
+    """
+    캐시 사용 여부를 정하고 캐시를 조회합니다.
+    - use_cache=None이면 temperature < CREATIVE_TEMPERATURE 일 때만 캐시 사용
+    - SQLite 조회는 작업 스레드에서 (공유 이벤트 루프가 디스크 I/O를 기다리며 멈추지 않도록)
+    Returns: (캐시 키 또는 None(캐시 안 씀), 캐시된 응답 문자열 또는 None)
+    """
+    if use_cache is None:
+        use_cache = temperature < CREATIVE_TEMPERATURE
+    if not (use_cache and llm_cache.is_enabled()):
+        llm_cache.record_bypass(cache_name)
+        return None, None
+
+    key = llm_cache.make_key(model, messages, temperature, response_format)
+    return key, await asyncio.to_thread(llm_cache.get, cache_name, key)
+
+
+async def _astore_cache(cache_name, key, content):
+    """JSON으로 확인된 응답을 작업 스레드에서 캐시에 저장합니다."""
+    await asyncio.to_thread(llm_cache.put, cache_name, key, content, CACHE_TTLS.get(cache_name, 3600))
+
+
+def _strip_fences(content):
+    """응답 앞뒤의 ```json 코드 블록 표시를 걷어냅니다."""
+    return content.strip().replace("```json", "").replace("```", "")
+
+
+async def _achat_json(cache_name, model, messages, temperature, response_format=None, use_cache=None):
+    """
+    Chat Completions를 (비동기로) 호출해 JSON(dict)으로 돌려줍니다.
+    - 같은 (model, messages, temperature, response_format) 요청은 디스크 캐시에서 바로 꺼냄
+    - use_cache=None이면 temperature < CREATIVE_TEMPERATURE 일 때만 캐시 사용
+    - JSON 파싱에 성공한 응답만 캐시에 저장
+    """
+    key, cached = await _alookup_cache(cache_name, model, messages, temperature, response_format, use_cache)
+    if cached is not None:
+        return json.loads(cached)
+
+    request = {"model": model, "messages": messages, "temperature": temperature}
+    if response_format is not None:
+        request["response_format"] = response_format
+    response = await get_async_client().chat.completions.create(**request)
+
+    content = _strip_fences(response.choices[0].message.content)
+    result = json.loads(content)
+
+    if key is not None:
+        await _astore_cache(cache_name, key, content)
+    return result
 
 # =============================================================================
 # [SECTION 1] 파싱된 단어 검증 및 빈칸 보정부
@@ -27,60 +141,181 @@ SYSTEM_PROMPT = """
 반드시 JSON으로 응답: {"zh": "한자", "pinyin": "병음", "ko": "뜻", "is_noise": false/true}
 """
 
-def process_vocab_with_llm(df, raw_text):
+# [배치 검수] 여러 단어를 한 번의 요청으로 검수할 때 쓰는 프롬프트
+BATCH_SYSTEM_PROMPT = """
+당신은 '단어장 무결성 검수자'입니다. 
+파서가 추출한 여러 항목이 각자의 원본 텍스트 조각 내에서 실제 '단어'로서 유효한지 검증하세요.
+
+[임무]
+1. 각 항목(id)의 한자가 해당 원본 조각 내에서 단어-병음-뜻의 구조를 가진 '진짜 단어'인지 확인하세요.
+2. 진짜라면 원본에 적힌 병음과 뜻을 정확히 추출하세요.
+3. 만약 한자가 단어가 아닌 단순 텍스트(페이지 번호, 섹션 제목, 예문 파편 등)라면 반드시 is_noise: true로 응답하세요.
+4. 입력받은 모든 id에 대해 빠짐없이 하나씩 응답하세요.
+
+반드시 JSON으로 응답: {"results": [{"id": 0, "zh": "한자", "pinyin": "병음", "ko": "뜻", "is_noise": false/true}, ...]}
+"""
+
+# 배치 크기(한 요청에 넣을 단어 수)와 동시에 보낼 요청 수
+REPAIR_BATCH_SIZE = 20
+REPAIR_MAX_WORKERS = 4
+
+
+async def _arepair_single(target_zh, snippet):
+    """
+    [단건 검수] 한 단어만 검수합니다. (배치 응답에서 빠진 행의 대체 경로)
+    """
+    return await _achat_json(
+        "vocab_repair",
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"검수 단어: {target_zh}\n원본 조각: {snippet}"}
+        ],
+        response_format={"type": "json_object"},
+        temperature=0
+    )
+
+
+async def _arepair_batch(items):
+    """
+    [배치 검수] items: [(id, 한자, 원본 조각), ...]
+    한 번의 요청으로 검수하고 {id: 판정 dict}를 돌려줍니다. (응답에 없는 id는 빠짐)
+    """
+    blocks = [f"[id={item_id}] 검수 단어: {target_zh}\n원본 조각: {snippet}" for item_id, target_zh, snippet in items]
+    res = await _achat_json(
+        "vocab_repair",
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": "\n\n".join(blocks)}
+        ],
+        response_format={"type": "json_object"},
+        temperature=0
+    )
+
+    valid_ids = {item_id for item_id, _, _ in items}
+    verdicts = {}
+    for verdict in res.get('results', []):
+        if isinstance(verdict, dict) and verdict.get('id') in valid_ids:
+            verdicts[verdict['id']] = verdict
+    return verdicts
+
+
+async def _arepair_batch_with_fallback(items, semaphore):
+    """
+    배치 요청이 실패하거나 일부 id가 응답에서 빠지면, 그 행만 단건 검수로 다시 시도합니다.
+    단건까지 실패한 행은 None (= 기존 값 유지)
+    semaphore: 동시에 나가는 요청 수 제한
+    """
+    async with semaphore:
+        try:
+            verdicts = await _arepair_batch(items)
+        except Exception as e:
+            print(f"배치 검수 실패, 단건 검수로 전환: {e}")
+            verdicts = {}
+
+    missing = [(item_id, target_zh, snippet) for item_id, target_zh, snippet in items if item_id not in verdicts]
+
+    async def _single(target_zh, snippet):
+        async with semaphore:
+            try:
+                return await _arepair_single(target_zh, snippet)
+            except Exception:
+                return None
+
+    results = await asyncio.gather(*(_single(target_zh, snippet) for _, target_zh, snippet in missing))
+    for (item_id, _, _), verdict in zip(missing, results):
+        verdicts[item_id] = verdict
+    return verdicts
+
+
+# 검수 조각 크기: 앵커 앞 문맥 글자 수 / 조각 최대 길이
+SNIPPET_CONTEXT_BEFORE = 30
+SNIPPET_MAX_CHARS = 200
+
+
+def _snippet_from_offsets(raw_text, row, target_zh):
+    """
+    파서가 기록한 원문 좌표로 '이 단어가 실제로 파싱된 자리'의 조각을 O(1)로 잘라냅니다.
+    (앵커 앞 약간의 문맥 + 앵커 + 청크, 최대 SNIPPET_MAX_CHARS자)
+    좌표가 없거나 원문과 맞지 않으면 None.
+    """
+    anchor_start, chunk_end = row.get('anchor_start'), row.get('chunk_end')
+    if pd.isna(anchor_start) or pd.isna(chunk_end):
+        return None
+    anchor_start, chunk_end = int(anchor_start), int(chunk_end)
+    if raw_text[anchor_start:anchor_start + len(target_zh)] != target_zh:
+        return None
+
+    start = max(0, anchor_start - SNIPPET_CONTEXT_BEFORE)
+    end = min(chunk_end, start + SNIPPET_MAX_CHARS)
+    return raw_text[start:end]
+
+
+def process_vocab_with_llm(df, raw_text, batch_size=REPAIR_BATCH_SIZE, max_workers=REPAIR_MAX_WORKERS):
     """
     df: 1차 파싱된 데이터 (개수 상관 없음)
     raw_text: PDF 전체 원본
+    batch_size: 한 번의 AI 요청에 묶어 보낼 단어 수
+    max_workers: 동시에 보낼 AI 요청 수
     """
     if df.empty: return df
     
     # 1. 보정이 필요한 '빈칸 행'들만 핀포인트로 추출
     repair_targets = df[df['flags'] != 'OK'].copy()
     if repair_targets.empty: return df
+    if get_async_client() is None: return df # API 키 없음 -> 보정 없이 그대로
 
     progress_bar = st.progress(0)
     indices_to_drop = [] # 노이즈(가짜 단어)로 판명된 행 보관함
 
-    # 2. 유기적 대조 시작
-    for i, (idx, row) in enumerate(repair_targets.iterrows()):
+    # 2. 원본 내 '좌표'로 검수 대상 조각(Context) 준비
+    has_offsets = all(col in df.columns for col in ('anchor_start', 'chunk_end'))
+    items = []
+    for idx, row in repair_targets.iterrows():
         target_zh = row['zh']
+        snippet = _snippet_from_offsets(raw_text, row, target_zh) if has_offsets else None
         
-        # [원리] find()로 원본 내 '좌표' 확보하여 잽싸게 이동
-        char_pos = raw_text.find(target_zh)
+        if snippet is None:
+            # [예전 방식] 좌표가 없는 행(직접 추가한 행 등)은 find()로 원본 내 위치를 찾음
+            char_pos = raw_text.find(target_zh)
+            if char_pos != -1:
+                # 해당 단어 앞뒤 500자 조각(Context) 슬라이싱
+                snippet = raw_text[max(0, char_pos-100) : min(len(raw_text), char_pos+400)]
         
-        if char_pos != -1:
-            # 해당 단어 앞뒤 500자 조각(Context) 슬라이싱
-            snippet = raw_text[max(0, char_pos-100) : min(len(raw_text), char_pos+400)]
-            
-            try:
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": f"검수 단어: {target_zh}\n원본 조각: {snippet}"}
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=0
-                )
-                res = json.loads(response.choices[0].message.content)
-                
-                # AI가 노이즈로 판별하면 삭제 리스트에 등록
-                if res.get('is_noise') is True:
-                    indices_to_drop.append(idx)
-                else:
-                    # 진짜 단어면 정보 업데이트 및 OK 부여
-                    df.at[idx, 'pinyin'] = res.get('pinyin', row['pinyin'])
-                    df.at[idx, 'ko'] = res.get('ko', row['ko'])
-                    df.at[idx, 'flags'] = 'OK'
-            except:
-                pass
+        if snippet is not None:
+            items.append((idx, target_zh, snippet))
         else:
             # 원본에 한자 자체가 없으면 유령 데이터이므로 삭제
             indices_to_drop.append(idx)
-        
-        progress_bar.progress((i + 1) / len(repair_targets))
 
-    # 3. [최종 정제] 가짜 단어들을 쳐내어 개수를 원본에 맞게 수렴시킴
+    total = len(repair_targets)
+    done = len(indices_to_drop)
+    progress_bar.progress(done / total)
+
+    # 3. 배치로 묶어서 공유 이벤트 루프에서 동시에 검수 (진행바 갱신은 Streamlit 메인 스레드에서만)
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    semaphore = asyncio.Semaphore(max_workers)
+    futures = {submit(_arepair_batch_with_fallback(batch, semaphore)): batch for batch in batches}
+    for future in as_completed(futures):
+        verdicts = future.result()
+        for idx, res in verdicts.items():
+            if res is None:
+                continue # 검수 실패 -> 기존 값 유지
+            
+            # AI가 노이즈로 판별하면 삭제 리스트에 등록
+            if res.get('is_noise') is True:
+                indices_to_drop.append(idx)
+            else:
+                # 진짜 단어면 정보 업데이트 및 OK 부여
+                df.at[idx, 'pinyin'] = res.get('pinyin', df.at[idx, 'pinyin'])
+                df.at[idx, 'ko'] = res.get('ko', df.at[idx, 'ko'])
+                df.at[idx, 'flags'] = 'OK'
+
+        done += len(futures[future])
+        progress_bar.progress(done / total)
+
+    # 4. [최종 정제] 가짜 단어들을 쳐내어 개수를 원본에 맞게 수렴시킴
     if indices_to_drop:
         df = df.drop(indices_to_drop)
         df = df.reset_index(drop=True)
@@ -94,12 +329,20 @@ def process_vocab_with_llm(df, raw_text):
 
 # [수정] level 변수를 추가하여 HSK 4급~6급 모두 대응 가능하도록 변경
 
-def generate_sentence_puzzle(selected_words, level="HSK5"):
+# 출제 전략 이름 (문제 풀 services/question_pool.py도 이 이름으로 전략별 풀을 나눔)
+PUZZLE_STRATEGY_TYPES = [
+    "Collocation Focus (호응 관계)",
+    "Complex Syntax (복잡한 수식어)",
+    "Logical Connection (접속사/논리)",
+]
+
+async def agenerate_sentence_puzzle(selected_words, level="HSK5", strategy=None):
     """
     선택된 단어를 사용하여 지정된 레벨(기본 HSK5)의 어순 배열 문제를 생성합니다.
     level 인자를 통해 "HSK4", "HSK6" 등으로 난이도 조절이 가능합니다.
+    strategy: PUZZLE_STRATEGY_TYPES 중 하나 (None이면 무작위)
     """
-    if not client:
+    if get_async_client() is None:
         return None
 
     joined_words = ", ".join(selected_words)
@@ -107,7 +350,7 @@ def generate_sentence_puzzle(selected_words, level="HSK5"):
     # 3가지 출제 전략 (레벨에 상관없이 통용되는 문법 구조)
     strategies = [
         {
-            "type": "Collocation Focus (호응 관계)",
+            "type": PUZZLE_STRATEGY_TYPES[0],
             "instruction": f"""
             1. 선택된 단어와 어울리는 **{level} 필수 호응구(Collocation)**를 포함하여 문장을 만드세요.
             2. 단어 조각을 나눌 때, 이 호응하는 단어들을 **반드시 떨어뜨려 놓으세요**.
@@ -115,7 +358,7 @@ def generate_sentence_puzzle(selected_words, level="HSK5"):
             """
         },
         {
-            "type": "Complex Syntax (복잡한 수식어)",
+            "type": PUZZLE_STRATEGY_TYPES[1],
             "instruction": """
             1. 주어(S)나 목적어(O)를 꾸며주는 **긴 관형어(Phrase + 的)**가 포함된 문장을 만드세요.
             2. 단순한 '형용사+명사'가 아니라, '동사구+的+명사' 형태를 사용하세요.
@@ -123,7 +366,7 @@ def generate_sentence_puzzle(selected_words, level="HSK5"):
             """
         },
         {
-            "type": "Logical Connection (접속사/논리)",
+            "type": PUZZLE_STRATEGY_TYPES[2],
             "instruction": """
             1. 문장의 논리를 결정하는 **접속사(因此, 但是, 甚至, 否则 등)**를 하나 이상 포함하세요.
             2. 앞뒤 절의 인과관계나 전환 관계가 명확한 복문을 만드세요.
@@ -132,7 +375,12 @@ def generate_sentence_puzzle(selected_words, level="HSK5"):
         }
     ]
     
-    selected_strategy = random.choice(strategies)
+    if strategy is None:
+        selected_strategy = random.choice(strategies)
+    else:
+        selected_strategy = next((s for s in strategies if s['type'] == strategy), None)
+        if selected_strategy is None:
+            raise ValueError(f"알 수 없는 출제 전략: {strategy}")
 
     # [수정 포인트] 프롬프트 내 'HSK 5급' -> '{level}' 변수로 교체
     prompt = f"""
@@ -158,21 +406,21 @@ def generate_sentence_puzzle(selected_words, level="HSK5"):
     """
     
     try:
-        response = client.chat.completions.create(
+        return await _achat_json(
+            "sentence_puzzle",
             model="gpt-4o",
             messages=[{"role": "system", "content": "당신은 JSON 데이터를 생성하는 전문가입니다."},
                       {"role": "user", "content": prompt}],
             temperature=0.7 
         )
-        content = response.choices[0].message.content.strip()
-        content = content.replace("```json", "").replace("```", "")
-        
-        import json
-        return json.loads(content)
     except Exception as e:
         print(f"Error generating puzzle: {e}")
         return None
 
+def generate_sentence_puzzle(selected_words, level="HSK5", strategy=None):
+    """[동기 래퍼] 어순 배열 문제 출제 (agenerate_sentence_puzzle를 공유 이벤트 루프에서 실행)"""
+    return run_sync(agenerate_sentence_puzzle(selected_words, level=level, strategy=strategy))
+
 
 # =============================================================================
 # [SECTION 3] 실전 작문부
@@ -186,13 +434,13 @@ def generate_sentence_puzzle(selected_words, level="HSK5"):
 # [3-1] 작문 문제 출제 (Question Generation)
 # -----------------------------------------------------------------------------
 
-def generate_hybrid_question_99(user_vocab_list):
+async def agenerate_hybrid_question_99(user_vocab_list):
     """
     [99번 출제: 하이브리드 믹스]
     - 사용자 단어(3개)와 2025 트렌드 단어(2개)를 결합하여 출제합니다.
     - 단순 예시 나열이 아닌, '4대 의미 클러스터' 정의를 바탕으로 AI가 맥락에 맞는 단어를 창조합니다.
     """
-    if not client:
+    if get_async_client() is None:
         return None
     
     # 1. 사용자 단어장에서 3개 무작위 추출 (기반 단어)
@@ -244,27 +492,29 @@ def generate_hybrid_question_99(user_vocab_list):
     """
 
     try:
-        response = client.chat.completions.create(
+        return await _achat_json(
+            "hybrid_question_99",
             model="gpt-4o",
             messages=[{"role": "system", "content": "JSON 생성 전문가입니다."},
                       {"role": "user", "content": prompt}],
             temperature=0.8 # 다양성을 위해 온도 높임
         )
-        content = response.choices[0].message.content.strip()
-        content = content.replace("```json", "").replace("```", "")
-        return json.loads(content)
     except Exception as e:
         print(f"Error generating hybrid question: {e}")
         return None
 
+def generate_hybrid_question_99(user_vocab_list):
+    """[동기 래퍼] 99번 하이브리드 출제 (agenerate_hybrid_question_99를 공유 이벤트 루프에서 실행)"""
+    return run_sync(agenerate_hybrid_question_99(user_vocab_list))
 
-def generate_scene_description(level="HSK5"):
+
+async def agenerate_scene_description(level="HSK5"):
     """
     [100번 출제: 테마별 전략 반영]
     - 딥리서치 기준 4대 빈출 테마(비즈니스/일상/스포츠/학습) 내에서 상황을 무작위 선정.
     - 각 테마별 '공략 가이드(Guide)'를 프롬프트에 반영하여, 작문하기 좋은 최적의 상황 묘사를 생성.
     """
-    if not client:
+    if get_async_client() is None:
         return None
 
     # [전략 데이터] 테마별 세부 상황 및 출제 가이드
@@ -336,28 +586,30 @@ def generate_scene_description(level="HSK5"):
     """
     
     try:
-        response = client.chat.completions.create(
+        return await _achat_json(
+            "scene_description",
             model="gpt-4o",
             messages=[{"role": "system", "content": "당신은 JSON 데이터를 생성하는 전문가입니다."},
                       {"role": "user", "content": prompt}],
             temperature=0.8 # 창의적인 상황 생성을 위해 온도를 약간 높임
         )
-        content = response.choices[0].message.content.strip()
-        content = content.replace("```json", "").replace("```", "")
-        return json.loads(content)
     except Exception as e:
         print(f"Error generating scene: {e}")
         return None
 
-def generate_image_from_text(description):
+def generate_scene_description(level="HSK5"):
+    """[동기 래퍼] 100번 상황 묘사 출제 (agenerate_scene_description를 공유 이벤트 루프에서 실행)"""
+    return run_sync(agenerate_scene_description(level=level))
+
+async def agenerate_image_from_text(description):
     """
     [이미지 생성] 텍스트 묘사를 바탕으로 DALL-E 3 이미지를 생성합니다.
     """
-    if not client:
+    if get_async_client() is None:
         return None
     
     try:
-        response = client.images.generate(
+        response = await get_async_client().images.generate(
             model="dall-e-3",
             prompt=f"A realistic illustration for a Chinese language proficiency test (HSK). Scene: {description}. Clean style, no text inside image.",
             size="1024x1024",
@@ -369,24 +621,25 @@ def generate_image_from_text(description):
         print(f"Error generating image: {e}")
         return None
 
+def generate_image_from_text(description):
+    """[동기 래퍼] 100번 이미지 생성 (agenerate_image_from_text를 공유 이벤트 루프에서 실행)"""
+    return run_sync(agenerate_image_from_text(description))
+
 # -----------------------------------------------------------------------------
 # [3-2] 작문 채점 및 평가 (Evaluation)
 # -----------------------------------------------------------------------------
 
 # [통합 채점] HSK 공식 기준(상/중/하) + 거품 뺀 가산점 로직 (Base 75)
 
-def evaluate_writing_v2(mode, user_input, ref_data):
+# 채점 요청 설정 (일반/스트리밍 채점이 같은 요청 -> 같은 캐시 키를 씀)
+EVALUATE_MODEL = "gpt-4o"
+EVALUATE_TEMPERATURE = 0.2 # 온도를 낮춰서 냉정한 평가 유도
+
+
+def _evaluate_writing_messages(mode, user_input, ref_data):
     """
-    [통합 채점 로직]
-    1. 공식 평가 기준(High/Mid/Low)은 원문 그대로 유지.
-    2. 점수 산정 방식 (거품 제거):
-        - 무결점이지만 평이한 답안 = 75점(중상) 시작. (기존 80점에서 하향)
-        - 80점 이상은 '제시어 외 고급 어휘'나 '복잡한 문형'이 있을 때만 부여.
-        - 비상식적 내용(논리 오류)은 가차 없이 강등.
+    [채점 프롬프트] 문제 유형(99/100)별 평가 기준과 채점 로직으로 채팅 메시지를 만듭니다.
     """
-    if not client:
-        return None
-
     # ---------------------------------------------------------
     # 1. 문제별 평가 기준 (공식 원문 유지)
     # ---------------------------------------------------------
@@ -476,33 +729,111 @@ def evaluate_writing_v2(mode, user_input, ref_data):
     }}
     """
 
+    return [{"role": "system", "content": "JSON 생성 전문가입니다."},
+            {"role": "user", "content": prompt}]
+
+
+async def aevaluate_writing_v2(mode, user_input, ref_data):
+    """
+    [통합 채점 로직]
+    1. 공식 평가 기준(High/Mid/Low)은 원문 그대로 유지.
+    2. 점수 산정 방식 (거품 제거):
+        - 무결점이지만 평이한 답안 = 75점(중상) 시작. (기존 80점에서 하향)
+        - 80점 이상은 '제시어 외 고급 어휘'나 '복잡한 문형'이 있을 때만 부여.
+        - 비상식적 내용(논리 오류)은 가차 없이 강등.
+    """
+    if get_async_client() is None:
+        return None
+
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "system", "content": "JSON 생성 전문가입니다."},
-                      {"role": "user", "content": prompt}],
-            temperature=0.2 # 온도를 낮춰서 냉정한 평가 유도
+        return await _achat_json(
+            "evaluate_writing",
+            model=EVALUATE_MODEL,
+            messages=_evaluate_writing_messages(mode, user_input, ref_data),
+            temperature=EVALUATE_TEMPERATURE
         )
-        content = response.choices[0].message.content.strip()
-        content = content.replace("```json", "").replace("```", "")
-        import json
-        return json.loads(content)
     except Exception as e:
         print(f"Error evaluating writing v2: {e}")
         return None
 
+def evaluate_writing_v2(mode, user_input, ref_data):
+    """[동기 래퍼] 작문 채점 (aevaluate_writing_v2를 공유 이벤트 루프에서 실행)"""
+    return run_sync(aevaluate_writing_v2(mode, user_input, ref_data))
+
+
+# [스트리밍 채점] 모범 답안/해설까지 다 생성될 때까지 기다리지 않고, 필드가 완성되는 대로 화면에 표시
+# 이벤트: (EVENT_PARTIAL, 키, 지금까지 받은 문자열) / (EVENT_FIELD, 키, 값)
+#         (EVENT_DONE, 전체 결과 dict) / (EVENT_ERROR, 오류 메시지) -> DONE/ERROR 중 하나로 끝남
+EVENT_DONE = "done"
+EVENT_ERROR = "error"
+
+
+async def aevaluate_writing_v2_stream(mode, user_input, ref_data):
+    """
+    [스트리밍 채점] aevaluate_writing_v2와 같은 채점을 토큰 단위로 받으며 필드별 이벤트를 보냅니다.
+    - 같은 채점이 캐시에 있으면 모든 필드를 바로 보냄 (일반 채점과 캐시 공유)
+    - 스트림이 끝나고 JSON 전체가 올바를 때만 캐시에 저장
+    """
+    if get_async_client() is None:
+        yield (EVENT_ERROR, "OpenAI API 키가 설정되지 않았습니다.")
+        return
+
+    messages = _evaluate_writing_messages(mode, user_input, ref_data)
+    key, cached = await _alookup_cache("evaluate_writing", EVALUATE_MODEL, messages, EVALUATE_TEMPERATURE)
+    if cached is not None:
+        result = json.loads(cached)
+        for field, value in result.items():
+            yield (EVENT_FIELD, field, value)
+        yield (EVENT_DONE, result)
+        return
+
+    try:
+        stream = await get_async_client().chat.completions.create(
+            model=EVALUATE_MODEL,
+            messages=messages,
+            temperature=EVALUATE_TEMPERATURE,
+            stream=True,
+        )
+        parser = JSONObjectStreamParser()
+        pieces = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            pieces.append(delta)
+            for event in parser.feed(delta):
+                yield event
+
+        content = _strip_fences("".join(pieces))
+        result = json.loads(content)
+    except Exception as e:
+        print(f"Error streaming writing evaluation: {e}")
+        yield (EVENT_ERROR, str(e))
+        return
+
+    if key is not None:
+        await _astore_cache("evaluate_writing", key, content)
+    yield (EVENT_DONE, result)
+
+
+def iter_evaluate_writing_v2(mode, user_input, ref_data):
+    """[동기 래퍼] 스트리밍 채점 이벤트를 Streamlit 스크립트 스레드에서 for 문으로 받습니다."""
+    return iter_async(aevaluate_writing_v2_stream(mode, user_input, ref_data))
+
 # =============================================================================
 # [SECTION 4] AI 단어사전부
 # [단어사전] 한국어 검색어(아끼다)가 들어오면 -> 적절한 중국어(爱惜/节约)로 변환해서 검색
 # =============================================================================
 
-def search_word_info(word):
+async def asearch_word_info(word):
     """
     [단어 사전 기능] 
     사용자가 입력한 단어(중국어 or 한국어)를 분석하여
     최적의 중국어 단어 정보를 JSON으로 반환합니다.
     """
-    if not client:
+    if get_async_client() is None:
         return None
 
     prompt = f"""
@@ -534,17 +865,45 @@ def search_word_info(word):
     """
     
     try:
-        response = client.chat.completions.create(
+        return await _achat_json(
+            "search_word_info",
             model="gpt-4o",
             messages=[{"role": "system", "content": "JSON 데이터 생성기입니다."},
                       {"role": "user", "content": prompt}],
             temperature=0.3
         )
-        content = response.choices[0].message.content.strip()
-        content = content.replace("```json", "").replace("```", "")
-        
-        import json
-        return json.loads(content)
     except Exception as e:
         print(f"Error searching word info: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def search_word_info(word):
+    """[동기 래퍼] AI 단어사전 (asearch_word_info를 공유 이벤트 루프에서 실행)"""
+    return run_sync(asearch_word_info(word))
+
+# =============================================================================
+# [SECTION 5] 동시 실행(fan-out) 도우미
+# 서로 기다릴 필요가 없는 AI 호출을 공유 이벤트 루프에서 한꺼번에 보내고 함께 기다림
+# =============================================================================
+
+def start_scene_with_image(level="HSK5"):
+    """
+    [100번 출제] 상황 묘사를 요청하고, 묘사가 도착하는 즉시 이미지 생성까지 이어서 실행합니다.
+    두 작업 모두 백그라운드에서 진행되므로, 화면은 묘사 결과부터 먼저 받아 쓸 수 있습니다.
+    Returns: (상황 묘사 Future, 이미지 URL Future)
+    """
+    scene_future = submit(agenerate_scene_description(level=level))
+
+    async def _image_after_scene():
+        scene = await asyncio.wrap_future(scene_future)
+        if not scene:
+            return None
+        return await agenerate_image_from_text(scene['scene_desc'])
+
+    return scene_future, submit(_image_after_scene())
+
+
+def search_words_info(words):
+    """
+    [AI 단어사전] 여러 검색어를 동시에 조회하고, 입력 순서대로 결과 리스트를 돌려줍니다. (실패한 항목은 None)
+    """
+    return run_concurrently(*(asearch_word_info(word) for word in words))
@@ -0,0 +1,174 @@
+# 경로: services/llm_cache.py
+# [설명] OpenAI 응답 영구 캐시 (SQLite)
+# - 키: sha256(model + messages + temperature + response_format)
+# - 캐시 이름(함수)별 TTL, 전체 용량 상한 + LRU 삭제, 적중/실패 카운터
+# - 환경변수 VOCA_LLM_CACHE=off 이면 캐시 전체를 끔
+# - VOCA_LLM_BACKEND=standin(로컬 대역)일 때는 별도 파일에 저장 -> 대역 응답이 실제 응답 캐시에 섞이거나 실제 항목을 밀어내지 않음
+# - 연결은 한 번 열어 두고 재사용, 전체 용량은 저장할 때마다 합계를 다시 세지 않고 누적값으로 관리
+#   (get/put은 디스크 I/O를 하므로 이벤트 루프에서는 asyncio.to_thread로 호출)
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from services.cache_paths import get_cache_dir
+
+# 캐시 전체 용량 상한 (기본 64MB, 환경변수 VOCA_LLM_CACHE_MB로 조정)
+MAX_CACHE_BYTES = int(os.getenv("VOCA_LLM_CACHE_MB", "64")) * 1024 * 1024
+
+# 다른 프로세스도 같은 파일에 쓰므로, 이만큼 저장할 때마다 누적 용량을 실제 합계로 다시 맞춤
+RESYNC_EVERY_PUTS = 256
+
+_DB_FILE = "llm_responses.sqlite3"
+_STANDIN_DB_FILE = "llm_responses.standin.sqlite3"
+_lock = threading.Lock()
+_stats = Counter() # 예: {"search_word_info:hit": 3, "search_word_info:miss": 1, ...}
+
+# 열어 둔 연결 (캐시 폴더가 바뀌면 다시 엶), 누적 용량, 마지막으로 합계를 맞춘 뒤 저장 횟수
+_conn = None
+_conn_path = None
+_total_bytes = 0
+_puts_since_resync = 0
+
+
+def is_enabled():
+    return os.getenv("VOCA_LLM_CACHE", "on").lower() not in ("off", "0", "false")
+
+
+def _db_file():
+    """응답을 받은 백엔드별 캐시 파일 이름 (실제 OpenAI / 로컬 대역)"""
+    if os.getenv("VOCA_LLM_BACKEND", "openai") == "standin":
+        return _STANDIN_DB_FILE
+    return _DB_FILE
+
+
+def make_key(model, messages, temperature, response_format=None):
+    """
+    [기능] 요청 내용이 완전히 같을 때만 같은 키가 나오도록 정규화된 JSON으로 해시합니다.
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature, "response_format": response_format},
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _sum_sizes(conn):
+    return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+
+def _connection():
+    """열어 둔 연결을 돌려줌 (_lock을 잡은 상태에서만 호출)"""
+    global _conn, _conn_path, _total_bytes, _puts_since_resync
+    path = get_cache_dir() / _db_file()
+    if _conn is not None and _conn_path == path:
+        return _conn
+    if _conn is not None:
+        _conn.close()
+    # 이벤트 루프의 작업 스레드 여러 개가 번갈아 쓰므로 스레드 검사를 끄고 _lock으로 보호
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            content TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+    conn.commit()
+    _conn, _conn_path = conn, path
+    _total_bytes = _sum_sizes(conn)
+    _puts_since_resync = 0
+    return conn
+
+
+def get(name, key):
+    """
+    [기능] 유효기간이 남은 캐시 응답(문자열)이 있으면 돌려주고, 없으면 None.
+    """
+    global _total_bytes
+    now = time.time()
+    with _lock:
+        conn = _connection()
+        row = conn.execute("SELECT content, expires_at, size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] < now:
+            if row is not None:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                _total_bytes -= row[2]
+            _stats[f"{name}:miss"] += 1
+            return None
+        conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        conn.commit()
+    _stats[f"{name}:hit"] += 1
+    return row[0]
+
+
+def _evict(conn, now):
+    """만료된 것 먼저, 그 다음 LRU 순서로 상한 아래가 될 때까지 삭제"""
+    global _total_bytes
+    conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+    _total_bytes = _sum_sizes(conn)
+    for old_key, old_size in conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+        if _total_bytes <= MAX_CACHE_BYTES:
+            break
+        conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+        _total_bytes -= old_size
+
+
+def put(name, key, content, ttl):
+    """
+    [기능] 응답을 저장하고, 전체 용량이 상한을 넘으면 가장 오래 안 쓴 것부터 지웁니다.
+    """
+    global _total_bytes, _puts_since_resync
+    now = time.time()
+    size = len(content.encode("utf-8"))
+    with _lock:
+        conn = _connection()
+        old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, name, content, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+            (key, name, content, size, now + ttl, now),
+        )
+        _total_bytes += size - (old[0] if old else 0)
+        _puts_since_resync += 1
+        if _puts_since_resync >= RESYNC_EVERY_PUTS:
+            _total_bytes = _sum_sizes(conn)
+            _puts_since_resync = 0
+        if _total_bytes > MAX_CACHE_BYTES:
+            _evict(conn, now)
+        conn.commit()
+
+
+def record_bypass(name):
+    _stats[f"{name}:bypass"] += 1
+
+
+def get_cache_stats():
+    """
+    [기능] 캐시 이름별 적중(hit)/실패(miss)/우회(bypass) 횟수를 돌려줍니다.
+    예: {"search_word_info": {"hit": 3, "miss": 1, "bypass": 0}}
+    """
+    stats = {}
+    for label, count in list(_stats.items()):
+        name, kind = label.rsplit(":", 1)
+        stats.setdefault(name, {"hit": 0, "miss": 0, "bypass": 0})[kind] = count
+    return stats
+
+
+def clear():
+    """[기능] 저장된 응답을 모두 지웁니다. (카운터는 유지)"""
+    global _total_bytes
+    with _lock:
+        conn = _connection()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+        _total_bytes = 0
@@ -0,0 +1,300 @@
+# 경로: services/llm_standin.py
+# [설명] OpenAI API 없이 services/llm.py를 돌려볼 수 있는 로컬 대역 (httpx 트랜스포트, 프로세스 안에서 동작)
+# - VOCA_LLM_BACKEND=standin 으로 실행하면 services/llm.get_async_client()가 이 트랜스포트를 쓰는 클라이언트를 만듦
+# - 이 앱이 쓰는 엔드포인트만 흉내냄: POST /chat/completions (일반 + stream=True SSE), POST /images/generations
+# - 프롬프트 종류(단어 검수/어순 문제/99번/100번/작문 채점/단어사전)를 알아보고, 각 함수가 기대하는 JSON 형식으로 응답
+#   (병음/뜻은 내장 오프라인 사전(services/offline_dict.py)에서 찾아 채움)
+# - 부하 테스트용 장애 주입: 응답 지연 분포, 429(요청 한도 초과), 깨진 JSON
+#   요청 내용 + seed로 결정하므로 동시에 보내는 순서가 달라도 같은 요청에는 같은 결과 (재시도 횟수별로는 다름)
+# 환경변수:
+#   VOCA_STANDIN_LATENCY    지연 분포 (ms): "fixed:100" / "uniform:50:300" / "lognormal:200:0.5"(중앙값, 시그마), 기본 "fixed:0"
+#   VOCA_STANDIN_STREAM_MS  스트리밍 조각 사이 지연 (ms, 기본 0)
+#   VOCA_STANDIN_429        429 응답 비율 (0~1, 기본 0)
+#   VOCA_STANDIN_MALFORMED  깨진 JSON 응답 비율 (0~1, 기본 0)
+#   VOCA_STANDIN_SEED       난수 seed (기본 0)
+
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import NamedTuple
+
+import httpx
+
+BASE_URL = "http://standin.local/v1"
+
+FAMILY_REPAIR_BATCH = "vocab_repair_batch"
+FAMILY_REPAIR_SINGLE = "vocab_repair"
+FAMILY_PUZZLE = "sentence_puzzle"
+FAMILY_HYBRID_99 = "hybrid_question_99"
+FAMILY_SCENE = "scene_description"
+FAMILY_EVALUATE = "evaluate_writing"
+FAMILY_WORD_INFO = "search_word_info"
+FAMILY_UNKNOWN = "unknown"
+FAMILY_IMAGE = "image"
+
+# 요청 한도 초과 응답에 붙이는 재시도 대기 시간 (openai SDK가 이 헤더를 보고 다시 보냄)
+RETRY_AFTER_MS = 20
+
+# 스트리밍 응답 한 조각의 글자 수
+STREAM_CHUNK_CHARS = 8
+
+
+class StandInConfig(NamedTuple):
+    latency: tuple = ("fixed", 0.0)  # (분포 이름, 인자...)
+    stream_chunk_ms: float = 0.0
+    rate_limit_ratio: float = 0.0
+    malformed_ratio: float = 0.0
+    seed: int = 0
+
+
+def parse_latency(spec):
+    """
+    [기능] "fixed:100" / "uniform:50:300" / "lognormal:200:0.5" 형식의 지연 분포를 튜플로 바꿉니다.
+    """
+    name, *args = spec.strip().split(":")
+    values = tuple(float(a) for a in args)
+    expected = {"fixed": 1, "uniform": 2, "lognormal": 2}.get(name)
+    if expected is None or len(values) != expected:
+        raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec!r} (예: fixed:100, uniform:50:300, lognormal:200:0.5)")
+    return (name,) + values
+
+
+def config_from_env():
+    """[기능] 환경변수로 StandInConfig를 만듭니다."""
+    return StandInConfig(
+        latency=parse_latency(os.getenv("VOCA_STANDIN_LATENCY", "fixed:0")),
+        stream_chunk_ms=float(os.getenv("VOCA_STANDIN_STREAM_MS", "0")),
+        rate_limit_ratio=float(os.getenv("VOCA_STANDIN_429", "0")),
+        malformed_ratio=float(os.getenv("VOCA_STANDIN_MALFORMED", "0")),
+        seed=int(os.getenv("VOCA_STANDIN_SEED", "0")),
+    )
+
+
+def sample_latency_ms(latency, rng):
+    name = latency[0]
+    if name == "fixed":
+        return latency[1]
+    if name == "uniform":
+        return rng.uniform(latency[1], latency[2])
+    median, sigma = latency[1], latency[2]
+    return median * math.exp(sigma * rng.gauss(0.0, 1.0))
+
+
+# =============================================================================
+# [프롬프트 종류별 응답] services/llm.py 각 함수가 기대하는 JSON
+# =============================================================================
+
+_REPAIR_ITEM_RE = re.compile(r"\[id=(\d+)\] 검수 단어: (\S+)")
+_REPAIR_SINGLE_RE = re.compile(r"검수 단어: (\S+)")
+_HANZI_RE = re.compile(r"[一-鿿]+")
+_PLACEHOLDER_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360f8cfc0f01f0005000201a0d6c6"
+    "5f0000000049454e44ae426082"
+)).decode("ascii")
+
+
+def classify_prompt(messages):
+    """[기능] 채팅 메시지로 프롬프트 종류(services/llm.py의 어느 함수인지)를 알아냅니다."""
+    text = "\n".join(str(m.get("content", "")) for m in messages)
+    if "단어장 무결성 검수자" in text:
+        return FAMILY_REPAIR_BATCH if "[id=" in text else FAMILY_REPAIR_SINGLE
+    if "출제 전략" in text and "pieces" in text:
+        return FAMILY_PUZZLE
+    if "의미 클러스터" in text:
+        return FAMILY_HYBRID_99
+    if "scene_desc" in text:
+        return FAMILY_SCENE
+    if "채점관" in text:
+        return FAMILY_EVALUATE
+    if "AI 사전" in text:
+        return FAMILY_WORD_INFO
+    return FAMILY_UNKNOWN
+
+
+def _lookup(zh):
+    """내장 오프라인 사전에서 한자 하나 (없으면 빈 값)"""
+    from services import offline_dict
+
+    entry = offline_dict.get_dictionary().lookup_hanzi(zh)
+    return entry or {"zh": zh, "pinyin": "", "pos": "", "ko": ""}
+
+
+def _verdict(zh):
+    entry = _lookup(zh)
+    return {"zh": zh, "pinyin": entry["pinyin"], "ko": entry["ko"], "is_noise": not entry["ko"]}
+
+
+def _user_text(messages):
+    return str(messages[-1].get("content", "")) if messages else ""
+
+
+def _after(text, label):
+    """'label: 값' / 'label\\n 값' 형식에서 값 한 줄"""
+    i = text.find(label)
+    if i < 0:
+        return ""
+    rest = text[i + len(label):].lstrip(" :：'\n")
+    return rest.split("\n", 1)[0].strip().strip("'")
+
+
+def build_payload(family, messages, rng):
+    """[기능] 프롬프트 종류에 맞는 응답 JSON(dict)을 만듭니다."""
+    text = _user_text(messages)
+    if family == FAMILY_REPAIR_BATCH:
+        return {"results": [{"id": int(i), **_verdict(zh)} for i, zh in _REPAIR_ITEM_RE.findall(text)]}
+    if family == FAMILY_REPAIR_SINGLE:
+        match = _REPAIR_SINGLE_RE.search(text)
+        return _verdict(match.group(1) if match else "")
+    if family == FAMILY_PUZZLE:
+        words = [w.strip() for w in _after(text, "사용자 선택 단어").split(",") if w.strip()] or ["我们"]
+        pieces = ["我们", "一定要", *words[:3], "才行"]
+        return {
+            "chinese": "".join(pieces) + "。",
+            "pinyin": " ".join(_lookup(w)["pinyin"] or w for w in pieces),
+            "korean": "우리는 반드시 " + ", ".join(_lookup(w)["ko"] or w for w in words[:3]) + " 해야 한다.",
+            "pieces": pieces,
+            "grammar_point": "一定要 + 동사: 반드시 ~해야 한다",
+        }
+    if family == FAMILY_HYBRID_99:
+        mine = [w.strip() for w in _after(text, "[학습자 단어 (필수 포함)]").split(",") if w.strip()]
+        trend = ["发票", "预算"]
+        words = [{**_lookup(zh), "zh": zh, "source": "내단어장"} for zh in mine]
+        words += [{**_lookup(zh), "zh": zh, "source": "AI트렌드"} for zh in trend]
+        return {"theme": "디지털/라이프", "words": words}
+    if family == FAMILY_SCENE:
+        return {
+            "scene_desc": f"{_after(text, '[구체적 상황]') or '도서관에서 책을 읽는 상황'}. 인물이 집중한 표정으로 앉아 있다.",
+            "keywords": ["集中", "努力"],
+        }
+    if family == FAMILY_EVALUATE:
+        score = 60 + rng.randrange(0, 31)
+        return {
+            "score": score,
+            "correction": "我们应该珍惜时间，努力学习。",
+            "translation": "우리는 시간을 아끼고 열심히 공부해야 한다.",
+            "explanation": f"문법 오류가 없어 기본점 75점에서 조정하여 {score}점입니다.",
+            "better_expression": "不仅...而且...",
+        }
+    if family == FAMILY_WORD_INFO:
+        query = _after(text, "사용자가 입력한 검색어")
+        zh = (_HANZI_RE.findall(query) or [""])[0]
+        if not zh:
+            from services import offline_dict
+            hits = offline_dict.lookup(query, limit=1)
+            zh = hits[0]["zh"] if hits else "学习"
+        entry = _lookup(zh)
+        return {
+            "word": zh, "pinyin": entry["pinyin"], "pos": entry["pos"], "meaning": entry["ko"],
+            "example_cn": f"我很{zh}。", "example_kr": f"나는 매우 {entry['ko'] or zh}.",
+        }
+    return {}
+
+
+# =============================================================================
+# [트랜스포트] httpx 요청 -> OpenAI 형식 응답
+# =============================================================================
+
+def _completion(model, content):
+    return {
+        "id": "chatcmpl-standin", "object": "chat.completion", "created": int(time.time()), "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def _chunk(model, delta, finish_reason=None):
+    return {
+        "id": "chatcmpl-standin", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+class _SSEStream(httpx.AsyncByteStream):
+    """응답 글자를 STREAM_CHUNK_CHARS씩 나눠 Server-Sent Events로 보냄"""
+    def __init__(self, model, content, chunk_delay):
+        self._model, self._content, self._delay = model, content, chunk_delay
+
+    async def __aiter__(self):
+        yield f"data: {json.dumps(_chunk(self._model, {'role': 'assistant', 'content': ''}))}\n\n".encode("utf-8")
+        for i in range(0, len(self._content), STREAM_CHUNK_CHARS):
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            piece = self._content[i:i + STREAM_CHUNK_CHARS]
+            yield f"data: {json.dumps(_chunk(self._model, {'content': piece}), ensure_ascii=False)}\n\n".encode("utf-8")
+        yield f"data: {json.dumps(_chunk(self._model, {}, 'stop'))}\n\n".encode("utf-8")
+        yield b"data: [DONE]\n\n"
+
+
+_stats = Counter() # 프롬프트 종류별 요청 수 + 429/깨진 JSON 주입 횟수 (모든 트랜스포트 합계)
+
+
+def get_stats():
+    """[기능] 지금까지 받은 요청 통계 (예: {"vocab_repair_batch": 12, "rate_limited": 3, ...})"""
+    return dict(_stats)
+
+
+def reset_stats():
+    _stats.clear()
+
+
+class StandInTransport(httpx.AsyncBaseTransport):
+    """
+    [기능] OpenAI API 대역 httpx 트랜스포트 (config가 없으면 환경변수로 설정)
+    """
+    def __init__(self, config=None):
+        self.config = config or config_from_env()
+        self._attempts = Counter() # 요청 내용별 시도 횟수 (재시도는 다른 난수를 받도록)
+        self._lock = threading.Lock()
+
+    def _rng(self, body):
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            attempt = self._attempts[digest]
+            self._attempts[digest] += 1
+        return random.Random(f"{self.config.seed}:{digest}:{attempt}")
+
+    async def handle_async_request(self, request):
+        body = await request.aread()
+        rng = self._rng(body)
+        payload = json.loads(body or b"{}")
+        path = request.url.path
+
+        delay_ms = sample_latency_ms(self.config.latency, rng)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if rng.random() < self.config.rate_limit_ratio:
+            _stats["rate_limited"] += 1
+            error = {"error": {"message": "Rate limit reached (stand-in)", "type": "requests", "code": "rate_limit_exceeded"}}
+            return httpx.Response(429, json=error, headers={"retry-after-ms": str(RETRY_AFTER_MS)})
+
+        if path.endswith("/images/generations"):
+            _stats[FAMILY_IMAGE] += 1
+            data = [{"url": f"data:image/png;base64,{_PLACEHOLDER_PNG}", "revised_prompt": payload.get("prompt", "")}]
+            return httpx.Response(200, json={"created": int(time.time()), "data": data * int(payload.get("n", 1))})
+
+        if not path.endswith("/chat/completions"):
+            return httpx.Response(404, json={"error": {"message": f"stand-in: 지원하지 않는 경로 {path}"}})
+
+        messages = payload.get("messages", [])
+        family = classify_prompt(messages)
+        _stats[family] += 1
+        content = json.dumps(build_payload(family, messages, rng), ensure_ascii=False)
+        if rng.random() < self.config.malformed_ratio:
+            _stats["malformed"] += 1
+            content = content[:max(1, len(content) // 2)] # 중간에서 잘린 JSON
+
+        model = payload.get("model", "")
+        if payload.get("stream"):
+            stream = _SSEStream(model, content, self.config.stream_chunk_ms / 1000)
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, stream=stream)
+        return httpx.Response(200, json=_completion(model, content))
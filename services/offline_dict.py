@@ -0,0 +1,71 @@
+# 경로: services/offline_dict.py
+# [설명] 앱에 포함된 오프라인 중-한 사전 (data/dict/*.tsv)
+# - 처음 조회할 때 TSV로 바이너리 인덱스(core/dict_index.py)를 .cache/dict/ 에 만들고 mmap으로 엶
+# - TSV 내용이 바뀌면 파일 이름(지문)이 바뀌므로 자동으로 다시 만듦
+# - 사전에 단어를 추가하려면 data/dict/ 에 같은 형식(한자\t병음\t품사\t뜻)의 TSV를 넣으면 됨
+
+import hashlib
+import os
+import threading
+import uuid
+from pathlib import Path
+
+from core.dict_index import DictIndex, build_index, load_tsv
+from services.cache_paths import get_cache_dir
+
+SEED_DIR = Path(__file__).resolve().parent.parent / "data" / "dict"
+INDEX_VERSION = "1"
+
+_index = None
+_lock = threading.Lock()
+
+
+def seed_files():
+    """[기능] 기본 사전(data/dict)의 TSV 파일 목록 (이름 순)"""
+    return sorted(SEED_DIR.glob("*.tsv"))
+
+
+def _fingerprint(paths):
+    h = hashlib.sha1(f"dict-v{INDEX_VERSION}".encode())
+    for path in paths:
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def get_dictionary():
+    """
+    [기능] 오프라인 사전 인덱스를 돌려줍니다. (처음 한 번만 만들고/열고, 사전 파일이 없으면 None)
+    """
+    global _index
+    with _lock:
+        if _index is not None:
+            return _index
+
+        seeds = seed_files()
+        if not seeds:
+            return None
+
+        cache_dir = get_cache_dir("dict")
+        path = cache_dir / f"dict-{_fingerprint(seeds)}.bin"
+        if not path.exists():
+            tmp = cache_dir / f".{uuid.uuid4().hex}.tmp"
+            build_index(load_tsv(seeds), tmp)
+            os.replace(tmp, path) # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 한 번에 교체
+            for old in cache_dir.glob("dict-*.bin"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+
+        _index = DictIndex(path)
+        return _index
+
+
+def lookup(query, limit=10):
+    """
+    [기능] 오프라인 사전에서 찾습니다. (한자 -> 정확히 일치/접두어, 한국어 -> 뜻 역색인)
+    Returns: [dict(zh, pinyin, pos, ko), ...] (없으면 빈 리스트)
+    """
+    index = get_dictionary()
+    if index is None:
+        return []
+    return index.search(query, limit=limit)
@@ -0,0 +1,251 @@
+# 경로: services/question_pool.py
+# [설명] 미리 만들어 두는 문제 풀 (어순 배열 / 작문 99번)
+# - 풀 키: (문제 종류, 레벨, 출제 전략, 단어장 키) -> 키마다 POOL_SIZE개를 미리 생성해 둠
+# - 버튼을 누르면 준비된 문제를 바로 꺼내고(수 ms), 빈 자리는 공유 이벤트 루프에서 비동기로 다시 채움
+#   (생성은 유료 API 호출이므로 화면을 보기만 해서는 만들지 않고, 문제를 꺼낼 때만 풀을 만들고 채움)
+# - 풀은 프로세스 전체에서 공유 -> 단어장 키마다 그 키를 쓰는 화면(세션 × 페이지) 수를 세어,
+#   아무도 안 쓰게 된 단어장의 풀만 버림 (use_vocab)
+# - 만든 지 ITEM_TTL이 지난 문제, POOL_IDLE_TTL 동안 안 쓴 풀은 버림 (버린 자리는 다음에 꺼낼 때 다시 채움)
+# - 환경변수 VOCA_QUESTION_POOL=off 이면 미리 만들지 않음 (버튼을 누를 때마다 바로 생성)
+
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import deque
+
+from services.async_runtime import submit
+from services.llm import (
+    PUZZLE_STRATEGY_TYPES,
+    agenerate_hybrid_question_99,
+    agenerate_sentence_puzzle,
+)
+
+KIND_PUZZLE = "puzzle"
+KIND_HYBRID_99 = "hybrid_99"
+
+# 풀 키 하나당 미리 만들어 둘 문제 수 (어순 배열은 전략이 3개라 전략당 1개씩)
+POOL_SIZES = {KIND_PUZZLE: 1, KIND_HYBRID_99: 2}
+ITEM_TTL = 30 * 60         # 만든 지 30분 지난 문제는 버림
+POOL_IDLE_TTL = 2 * 3600   # 2시간 동안 안 쓴 풀은 통째로 버림
+
+# 어순 배열 문제 하나에 넣을 단어 수
+PUZZLE_WORDS_MIN = 1
+PUZZLE_WORDS_MAX = 3
+
+
+def is_enabled():
+    return os.getenv("VOCA_QUESTION_POOL", "on").lower() not in ("off", "0", "false")
+
+
+class _Pool:
+    def __init__(self, producer, size):
+        self.producer = producer  # 문제 하나를 만드는 코루틴 함수 (실패하면 None)
+        self.size = size
+        self.items = deque()      # (만든 시각, 문제)
+        self.pending = 0          # 만드는 중인 문제 수
+        self.last_used = time.time()
+
+
+_pools = {}
+_lock = threading.Lock()
+
+# 화면(owner)마다 지금 쓰는 단어장 키와 마지막 사용 시각, 단어장 키별 참조 수
+_owners = {}        # owner -> (단어장 키, 마지막 사용 시각)
+_vocab_refs = {}    # 단어장 키 -> 참조 수
+
+
+def make_vocab_key(words):
+    """
+    [기능] 단어 목록(한자 리스트)으로 단어장 키를 만듭니다. (순서 무관, 단어가 바뀌면 키도 바뀜)
+    """
+    payload = "\n".join(sorted(set(words)))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# =============================================================================
+# [공통] 풀 관리
+# =============================================================================
+
+def _release_locked(vocab_key):
+    """단어장 키 참조를 하나 줄이고, 0이 되면 그 단어장의 풀을 버립니다. (_lock을 잡은 상태에서 호출)"""
+    _vocab_refs[vocab_key] -= 1
+    if _vocab_refs[vocab_key] <= 0:
+        del _vocab_refs[vocab_key]
+        for key in [k for k in _pools if k[3] == vocab_key]:
+            del _pools[key]
+
+
+def _evict_locked(now):
+    """만료된 문제와 오래 안 쓴 풀, 오래 소식 없는 화면(끝난 세션)의 참조를 정리합니다. (_lock을 잡은 상태에서 호출)"""
+    for owner, (vocab_key, seen_at) in list(_owners.items()):
+        if now - seen_at > POOL_IDLE_TTL:
+            del _owners[owner]
+            _release_locked(vocab_key)
+    for key in list(_pools):
+        pool = _pools[key]
+        while pool.items and now - pool.items[0][0] > ITEM_TTL:
+            pool.items.popleft()
+        if now - pool.last_used > POOL_IDLE_TTL and pool.pending == 0:
+            del _pools[key]
+
+
+async def _produce_one(key, pool):
+    try:
+        item = await pool.producer()
+    except Exception as e:
+        print(f"문제 풀 생성 실패 {key}: {e}")
+        item = None
+    with _lock:
+        pool.pending -= 1
+        # 만드는 동안 풀이 무효화(단어장 변경 등)됐으면 버림
+        if item and _pools.get(key) is pool:
+            pool.items.append((time.time(), item))
+
+
+def _refill_locked(key, pool):
+    """모자란 만큼 백그라운드 생성을 예약합니다. (_lock을 잡은 상태에서 호출)"""
+    missing = pool.size - len(pool.items) - pool.pending
+    for _ in range(max(0, missing)):
+        pool.pending += 1
+        submit(_produce_one(key, pool))
+
+
+def ensure_pool(key, producer, size):
+    """
+    [기능] 풀 키에 해당하는 풀을 만들고(없으면), 모자란 문제를 백그라운드에서 채우기 시작합니다.
+    key: (문제 종류, 레벨, 출제 전략, 단어장 키)
+    """
+    if not is_enabled():
+        return
+    now = time.time()
+    with _lock:
+        _evict_locked(now)
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = _Pool(producer, size)
+        pool.last_used = now
+        _refill_locked(key, pool)
+
+
+def take(key):
+    """
+    [기능] 준비된 문제 하나를 꺼냅니다. (없으면 None) 꺼낸 자리는 백그라운드에서 다시 채웁니다.
+    """
+    now = time.time()
+    with _lock:
+        _evict_locked(now)
+        pool = _pools.get(key)
+        if pool is None:
+            return None
+        pool.last_used = now
+        item = pool.items.popleft()[1] if pool.items else None
+        _refill_locked(key, pool)
+    return item
+
+
+def invalidate_vocab(vocab_key):
+    """[기능] 해당 단어장으로 만든 풀을 모두 버립니다. (다른 화면이 쓰고 있어도 버림)"""
+    with _lock:
+        for key in [k for k in _pools if k[3] == vocab_key]:
+            del _pools[key]
+
+
+def use_vocab(owner, vocab_key):
+    """
+    [기능] 화면(owner, 예: (세션 토큰, "word_order"))이 지금 쓰는 단어장 키를 알립니다.
+    - 같은 화면이 다른 단어장으로 바꾸면 예전 키의 참조를 줄이고, 아무도 안 쓰게 되면 그 풀을 버림
+    - 리런마다 불러도 되는 가벼운 함수 (API 호출 없음)
+    """
+    now = time.time()
+    with _lock:
+        previous = _owners.get(owner)
+        _owners[owner] = (vocab_key, now)
+        if previous is not None and previous[0] == vocab_key:
+            return
+        _vocab_refs[vocab_key] = _vocab_refs.get(vocab_key, 0) + 1
+        if previous is not None:
+            _release_locked(previous[0])
+
+
+def release_owner(owner):
+    """[기능] 화면이 더 이상 단어장을 쓰지 않음 (단어장 삭제 등)"""
+    with _lock:
+        previous = _owners.pop(owner, None)
+        if previous is not None:
+            _release_locked(previous[0])
+
+
+def get_pool_stats():
+    """
+    [기능] 풀별 준비된 문제 수 / 생성 중인 수 (디버깅용)
+    예: {("puzzle", "HSK5", "Complex Syntax (복잡한 수식어)", "ab12..."): {"ready": 1, "pending": 0}}
+    """
+    with _lock:
+        return {key: {"ready": len(pool.items), "pending": pool.pending} for key, pool in _pools.items()}
+
+
+# =============================================================================
+# [어순 배열] 선택된 단어장에서 무작위 단어로 만든 문제
+# =============================================================================
+
+def _puzzle_producer(words, level, strategy):
+    async def produce():
+        picked = random.sample(words, min(len(words), random.randint(PUZZLE_WORDS_MIN, PUZZLE_WORDS_MAX)))
+        puzzle = await agenerate_sentence_puzzle(picked, level=level, strategy=strategy)
+        if puzzle:
+            puzzle['words'] = picked # 어떤 단어로 만든 문제인지 화면에 표시용
+        return puzzle
+    return produce
+
+
+def warm_puzzle_pool(words, vocab_key, level="HSK5"):
+    """
+    [기능] 단어장(한자 리스트)으로 전략별 어순 배열 문제를 미리 만들어 둡니다.
+    vocab_key: make_vocab_key(words) 값 (화면에서 단어장 버전별로 한 번만 계산해 넘김)
+    """
+    if not words:
+        return
+    for strategy in PUZZLE_STRATEGY_TYPES:
+        ensure_pool((KIND_PUZZLE, level, strategy, vocab_key), _puzzle_producer(list(words), level, strategy), POOL_SIZES[KIND_PUZZLE])
+
+
+def take_puzzle(words, vocab_key, level="HSK5"):
+    """
+    [기능] 준비된 어순 배열 문제를 하나 꺼냅니다. 전략은 준비된 것 중에서 무작위로 고릅니다.
+    - 꺼낼 때 풀이 없으면 만들고 채우기 시작함 (다음 번부터 바로 꺼낼 수 있음)
+    준비된 문제가 없으면 None (호출한 쪽에서 바로 생성)
+    """
+    warm_puzzle_pool(words, vocab_key, level)
+    strategies = list(PUZZLE_STRATEGY_TYPES)
+    random.shuffle(strategies)
+    for strategy in strategies:
+        item = take((KIND_PUZZLE, level, strategy, vocab_key))
+        if item is not None:
+            return item
+    return None
+
+
+# =============================================================================
+# [작문 99번] 내 단어장 + 트렌드 단어 믹스 제시어 세트
+# =============================================================================
+
+def warm_hybrid_99_pool(vocab_records, vocab_key, level="HSK5"):
+    """
+    [기능] 단어장(dict 리스트)으로 99번 제시어 세트를 미리 만들어 둡니다.
+    vocab_key: make_vocab_key(한자 리스트) 값 (화면에서 단어장 버전별로 한 번만 계산해 넘김)
+    """
+    if len(vocab_records) < 3:
+        return
+    records = list(vocab_records)
+    ensure_pool((KIND_HYBRID_99, level, None, vocab_key), lambda: agenerate_hybrid_question_99(records), POOL_SIZES[KIND_HYBRID_99])
+
+
+def take_hybrid_99(vocab_records, vocab_key, level="HSK5"):
+    """
+    [기능] 준비된 99번 제시어 세트를 하나 꺼냅니다. (없으면 None)
+    꺼낼 때 풀이 없으면 만들고 채우기 시작함
+    """
+    warm_hybrid_99_pool(vocab_records, vocab_key, level)
+    return take((KIND_HYBRID_99, level, None, vocab_key))
@@ -0,0 +1,136 @@
+# 경로: services/score_mirror.py
+# [설명] 점수 시트의 로컬 사본(SQLite)
+# - 시트 전체(get_all_records)를 매번 내려받지 않고, '마지막으로 받은 행 다음부터'만 가져옴
+# - 별명(nickname) 인덱스로 내 기록만 로컬에서 바로 조회
+# - E열(숨김)의 전송 ID가 이미 받은 행과 같으면 중복 전송으로 보고 기록에서 뺌 (score_queue 참고)
+# ※ 시트는 뒤에 행이 추가되기만 한다고 가정합니다. (행을 지우거나 고쳤다면 rebuild_mirror() 실행)
+
+import sqlite3
+import threading
+
+import pandas as pd
+
+from services.cache_paths import get_cache_dir
+
+SCORE_COLUMNS = ["날짜", "별명", "시험유형", "점수"]
+
+_MIRROR_FILE = "score_mirror.sqlite3"
+_lock = threading.Lock()
+
+
+def _connect():
+    conn = sqlite3.connect(get_cache_dir() / _MIRROR_FILE, timeout=10)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS scores (
+            row_no INTEGER PRIMARY KEY,
+            created_at TEXT,
+            nickname TEXT,
+            exam_type TEXT,
+            score TEXT,
+            row_uid TEXT NOT NULL DEFAULT '',
+            is_duplicate INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    # 전송 ID가 생기기 전에 만든 사본: 열 추가 (예전 행은 ID 없음 -> 중복 검사 대상 아님)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(scores)")}
+    if "row_uid" not in columns:
+        conn.execute("ALTER TABLE scores ADD COLUMN row_uid TEXT NOT NULL DEFAULT ''")
+        conn.execute("ALTER TABLE scores ADD COLUMN is_duplicate INTEGER NOT NULL DEFAULT 0")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scores_nickname ON scores(nickname, row_no)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scores_row_uid ON scores(row_uid) WHERE row_uid != ''")
+    conn.commit()
+    return conn
+
+
+def get_synced_row_count(conn=None):
+    """[기능] 로컬 사본에 들어있는 데이터 행 수 (헤더 제외)"""
+    own = conn is None
+    conn = conn or _connect()
+    try:
+        return conn.execute("SELECT COALESCE(MAX(row_no), 1) - 1 FROM scores").fetchone()[0]
+    finally:
+        if own:
+            conn.close()
+
+
+def sync_mirror(sheet):
+    """
+    [기능] 시트에서 새로 추가된 행만 받아 로컬 사본에 붙입니다.
+    - 시트 1행은 헤더, 데이터는 2행부터 -> 이미 n행을 받았다면 (n+2)행부터 요청
+    - 이미 받은 전송 ID와 같은 행은 중복으로 표시만 하고 돌려주지 않음 (행 번호는 시트와 맞춰야 하므로 저장은 함)
+    Returns: 새로 받은 행 리스트 [[날짜, 별명, 시험유형, 점수], ...]
+    """
+    with _lock:
+        conn = _connect()
+        try:
+            synced = get_synced_row_count(conn)
+            first_row_no = synced + 2
+            values = sheet.get_values(f"A{first_row_no}:E")
+
+            new_rows = []
+            for offset, values_row in enumerate(values):
+                row = (list(values_row) + [""] * 5)[:5] # 끝의 빈 칸이 잘려서 올 수 있음
+                if not any(row):
+                    continue
+                row_uid = row[4]
+                is_duplicate = bool(row_uid) and conn.execute(
+                    "SELECT 1 FROM scores WHERE row_uid = ? AND is_duplicate = 0 LIMIT 1", (row_uid,)
+                ).fetchone() is not None
+                if not is_duplicate:
+                    new_rows.append(row[:4])
+                conn.execute(
+                    "INSERT OR REPLACE INTO scores (row_no, created_at, nickname, exam_type, score, row_uid, is_duplicate) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (first_row_no + offset, *row, int(is_duplicate)),
+                )
+            conn.commit()
+            return new_rows
+        finally:
+            conn.close()
+
+
+def rebuild_mirror(sheet):
+    """[기능] 로컬 사본을 비우고 시트 전체를 다시 받습니다."""
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute("DELETE FROM scores")
+            conn.commit()
+        finally:
+            conn.close()
+    return sync_mirror(sheet)
+
+
+def query_by_nickname(nickname):
+    """
+    [기능] 로컬 사본에서 특정 별명의 기록만 (시트 순서대로) DataFrame으로 돌려줍니다.
+    """
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            "SELECT created_at, nickname, exam_type, score FROM scores WHERE nickname = ? AND is_duplicate = 0 ORDER BY row_no",
+            (nickname,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return pd.DataFrame(rows, columns=SCORE_COLUMNS)
+
+
+def count_rows():
+    """[기능] 로컬 사본에 들어있는 실제 기록 수 (중복 전송 제외)"""
+    conn = _connect()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM scores WHERE is_duplicate = 0").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def all_rows():
+    """[기능] 로컬 사본의 모든 기록 [[날짜, 별명, 시험유형, 점수], ...] (시트 순서)"""
+    conn = _connect()
+    try:
+        return [list(r) for r in conn.execute(
+            "SELECT created_at, nickname, exam_type, score FROM scores WHERE is_duplicate = 0 ORDER BY row_no"
+        ).fetchall()]
+    finally:
+        conn.close()
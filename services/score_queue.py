@@ -0,0 +1,324 @@
+# 경로: services/score_queue.py
+# [설명] 점수 저장 write-behind 큐
+# - save_score()는 점수를 로컬 스풀(SQLite)에 기록하고 바로 '접수 완료'를 돌려줌 (UI가 시트 응답을 기다리지 않음)
+# - 백그라운드 스레드가 모인 행을 append_rows()로 한 번에 구글 시트에 전송 (실패 시 지수 백오프 재시도)
+# - 전송 전에 앱이 꺼져도 스풀에 남아 있다가, 다음 실행 때 워커가 이어서 전송
+# - 행마다 전송 ID(row_uid)를 시트의 숨김 열(E열)에 함께 기록
+#   -> 전송 직후 스풀에서 지우기 전에 꺼져서 같은 행이 두 번 올라가도, 로컬 사본(score_mirror)이 중복을 걸러냄
+# - 일시적 오류(연결 끊김/시간 초과/429/5xx)는 묶음 전체를 백오프 재시도
+#   그 밖의 오류는 맨 앞 행만 따로 보내 보며 원인 행을 찾고, MAX_ATTEMPTS번 실패한 행은 dead_letter 테이블로 옮김
+#   (뒤에 쌓인 행은 계속 전송 / 옮긴 행은 requeue_dead_letters() 또는 --requeue로 다시 보냄)
+# ※ 한 스풀 파일은 한 프로세스(Streamlit 서버 1개)가 전송한다고 가정합니다.
+# 실행 예: python -m services.score_queue --status
+#          python -m services.score_queue --requeue
+
+import argparse
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from services.cache_paths import get_cache_dir
+
+FLUSH_INTERVAL = 2.0   # 새 점수가 없어도 이 간격(초)마다 스풀 확인
+BATCH_SIZE = 200       # 한 번의 append_rows에 보낼 최대 행 수
+MAX_BACKOFF = 60.0     # 재시도 대기 시간 상한(초)
+MAX_ATTEMPTS = 5       # 한 행만 따로 보냈는데 이만큼 실패하면 dead_letter로 옮김
+
+_SPOOL_FILE = "score_spool.sqlite3"
+_db_lock = threading.Lock()
+_wakeup = threading.Event()
+_worker = None
+_worker_lock = threading.Lock()
+
+# 마지막 전송 시도 결과 (None이면 마지막 시도가 성공했거나 아직 시도 전)
+_last_error = None
+
+
+def _connect():
+    conn = sqlite3.connect(get_cache_dir() / _SPOOL_FILE, timeout=10)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS spool (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            nickname TEXT NOT NULL,
+            exam_type TEXT NOT NULL,
+            score NUMERIC NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            row_uid TEXT
+        )
+    """)
+    # 전송 ID가 생기기 전에 만든 스풀 파일: 열을 추가하고 남은 행에 ID를 채움
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(spool)")}
+    if "row_uid" not in columns:
+        conn.execute("ALTER TABLE spool ADD COLUMN row_uid TEXT")
+        conn.execute("UPDATE spool SET row_uid = lower(hex(randomblob(16))) WHERE row_uid IS NULL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS dead_letter (
+            id INTEGER PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            nickname TEXT NOT NULL,
+            exam_type TEXT NOT NULL,
+            score NUMERIC NOT NULL,
+            attempts INTEGER NOT NULL,
+            row_uid TEXT,
+            last_error TEXT,
+            failed_at TEXT NOT NULL
+        )
+    """)
+    conn.commit()
+    return conn
+
+
+def enqueue_score(nickname, exam_type, score, created_at=None):
+    """
+    [기능] 점수 한 건을 스풀에 기록하고 접수 번호(int)를 돌려줍니다.
+    디스크에 기록된 뒤에 돌려주므로, 이후 앱이 재시작돼도 이 점수는 전송됩니다.
+    """
+    if created_at is None:
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    with _db_lock:
+        conn = _connect()
+        try:
+            cur = conn.execute(
+                "INSERT INTO spool (created_at, nickname, exam_type, score, row_uid) VALUES (?, ?, ?, ?, ?)",
+                (created_at, nickname, exam_type, score, uuid.uuid4().hex),
+            )
+            conn.commit()
+            ticket = cur.lastrowid
+        finally:
+            conn.close()
+
+    start_worker()
+    _wakeup.set()
+    return ticket
+
+
+def get_pending_count():
+    """[기능] 아직 시트로 전송되지 않은 행 수"""
+    with _db_lock:
+        conn = _connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+        finally:
+            conn.close()
+
+
+def get_status():
+    """
+    [기능] 전송 상태: 대기 중인 행 수, dead_letter로 옮긴 행 수, 마지막 전송 오류(없으면 None)
+    예: {"pending": 3, "dead": 0, "last_error": "ConnectionError: ..."}
+    """
+    with _db_lock:
+        conn = _connect()
+        try:
+            pending = conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+            dead = conn.execute("SELECT COUNT(*) FROM dead_letter").fetchone()[0]
+        finally:
+            conn.close()
+    return {"pending": pending, "dead": dead, "last_error": _last_error}
+
+
+def _read_batch(limit):
+    """
+    맨 앞 행이 이미 실패한 적이 있으면 그 행만 따로 꺼냄 (원인 행을 찾는 중)
+    Returns: [(id, created_at, nickname, exam_type, score, attempts, row_uid), ...]
+    """
+    with _db_lock:
+        conn = _connect()
+        try:
+            head = conn.execute("SELECT attempts FROM spool ORDER BY id LIMIT 1").fetchone()
+            if head is not None and head[0] > 0:
+                limit = 1
+            return conn.execute(
+                "SELECT id, created_at, nickname, exam_type, score, attempts, row_uid FROM spool ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+
+def _mark_sent(ids):
+    with _db_lock:
+        conn = _connect()
+        try:
+            conn.executemany("DELETE FROM spool WHERE id = ?", [(i,) for i in ids])
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def _mark_failed(row_id, error):
+    """맨 앞 행의 실패 횟수를 늘리고, MAX_ATTEMPTS에 닿으면 dead_letter로 옮깁니다."""
+    with _db_lock:
+        conn = _connect()
+        try:
+            conn.execute("UPDATE spool SET attempts = attempts + 1 WHERE id = ?", (row_id,))
+            conn.execute("""
+                INSERT INTO dead_letter (id, created_at, nickname, exam_type, score, attempts, row_uid, last_error, failed_at)
+                SELECT id, created_at, nickname, exam_type, score, attempts, row_uid, ?, ?
+                FROM spool WHERE id = ? AND attempts >= ?
+            """, (error, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), row_id, MAX_ATTEMPTS))
+            conn.execute("DELETE FROM spool WHERE id = ? AND attempts >= ?", (row_id, MAX_ATTEMPTS))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def requeue_dead_letters():
+    """
+    [기능] dead_letter로 옮긴 행을 (같은 전송 ID로) 스풀에 다시 넣습니다.
+    Returns: 다시 넣은 행 수
+    """
+    with _db_lock:
+        conn = _connect()
+        try:
+            n = conn.execute("""
+                INSERT INTO spool (created_at, nickname, exam_type, score, attempts, row_uid)
+                SELECT created_at, nickname, exam_type, score, 0, row_uid FROM dead_letter ORDER BY id
+            """).rowcount
+            conn.execute("DELETE FROM dead_letter")
+            conn.commit()
+        finally:
+            conn.close()
+    if n:
+        start_worker()
+        _wakeup.set()
+    return n
+
+
+def _send_rows(rows):
+    """시트에 여러 행을 한 번에 추가 (순환 import를 피하려고 여기서 불러옴)"""
+    from services.google_sheets import append_score_rows
+    return append_score_rows(rows)
+
+
+def _is_transient(e):
+    from services.google_sheets import is_transient_error
+    return is_transient_error(e)
+
+
+def flush_once(limit=BATCH_SIZE):
+    """
+    [기능] 스풀에서 최대 limit행을 꺼내 한 번에 전송합니다.
+    - 일시적 오류: 그대로 예외 (워커가 백오프 후 같은 묶음을 다시 보냄)
+    - 그 밖의 오류: 맨 앞 행의 실패 횟수를 늘린 뒤 예외 (다음에는 그 행만 따로 보냄)
+    Returns: 전송한 행 수 (전송 실패 시 예외)
+    """
+    batch = _read_batch(limit)
+    if not batch:
+        return 0
+
+    ids = [row[0] for row in batch]
+    rows = [
+        [created_at, nickname, exam_type, _as_sheet_number(score), row_uid]
+        for _, created_at, nickname, exam_type, score, _, row_uid in batch
+    ]
+    try:
+        _send_rows(rows)
+    except Exception as e:
+        if not _is_transient(e):
+            _mark_failed(ids[0], f"{type(e).__name__}: {e}")
+        raise
+    _mark_sent(ids)
+    return len(ids)
+
+
+def _as_sheet_number(score):
+    # 정수 점수는 예전처럼 정수로 기록 (시트에 78.0 대신 78)
+    try:
+        return int(score) if float(score).is_integer() else score
+    except (TypeError, ValueError):
+        return score
+
+
+def _worker_loop():
+    global _last_error
+    backoff = 1.0
+    while True:
+        _wakeup.wait(FLUSH_INTERVAL)
+        _wakeup.clear()
+        try:
+            # 밀린 행이 많거나 원인 행을 하나씩 보내는 중이면 쉬지 않고 연속 전송
+            while flush_once() > 0 and get_pending_count() > 0:
+                pass
+            backoff = 1.0
+            _last_error = None
+        except Exception as e:
+            _last_error = f"{type(e).__name__}: {e}"
+            print(f"점수 전송 실패 ({backoff:.0f}초 후 재시도): {e}")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF)
+            _wakeup.set() # 대기 없이 바로 다시 시도
+
+
+def start_worker():
+    """
+    [기능] 백그라운드 전송 스레드를 (한 번만) 시작합니다.
+    시작하자마자 지난 실행에서 남은 행부터 전송합니다.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is not None and _worker.is_alive():
+            return
+        _worker = threading.Thread(target=_worker_loop, name="score-queue-flusher", daemon=True)
+        _worker.start()
+        _wakeup.set()
+
+
+def is_sent(ticket):
+    """[기능] 접수 번호(enqueue_score의 반환값)의 행이 시트로 전송되었는지 (스풀/dead_letter에 없으면 전송됨)"""
+    with _db_lock:
+        conn = _connect()
+        try:
+            return not any(
+                conn.execute(f"SELECT 1 FROM {table} WHERE id = ?", (ticket,)).fetchone()
+                for table in ("spool", "dead_letter")
+            )
+        finally:
+            conn.close()
+
+
+def wait_until_sent(ticket, timeout=3.0):
+    """[기능] 접수 번호의 행이 전송될 때까지(또는 timeout초) 기다립니다. Returns: 전송됐으면 True"""
+    deadline = time.time() + timeout
+    _wakeup.set()
+    while True:
+        if is_sent(ticket):
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def wait_until_flushed(timeout=10.0):
+    """[기능] 스풀이 빌 때까지(또는 timeout초) 기다립니다. 종료 직전/테스트용"""
+    deadline = time.time() + timeout
+    _wakeup.set()
+    while time.time() < deadline:
+        if get_pending_count() == 0:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="점수 전송 스풀 관리")
+    parser.add_argument("--status", action="store_true", help="대기/dead_letter 행 수 출력")
+    parser.add_argument("--requeue", action="store_true", help="dead_letter 행을 스풀에 다시 넣고 전송")
+    args = parser.parse_args()
+
+    if args.requeue:
+        n = requeue_dead_letters()
+        print(f"다시 넣은 행: {n}건")
+        if n and not wait_until_flushed():
+            print("아직 전송되지 않은 행이 있습니다. (--status로 확인)")
+    if args.status or not args.requeue:
+        status = get_status()
+        print(f"대기 {status['pending']}건 / dead_letter {status['dead']}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# 경로: services/score_rollups.py
+# [설명] 점수 요약(롤업) 테이블: 별명 × 날짜(일) × 시험유형 별 횟수/합계/최소/최대
+# - 로컬 사본(score_mirror)이 시트에서 새로 받은 행만 더함 (services/google_sheets._sync_local_copies)
+#   -> 다른 기기/프로세스가 쓴 행, 이전 기록도 모두 포함 / 아직 전송 대기 중인 점수는 시트에 올라간 뒤 반영
+#   -> 대시보드 요약 카드/유형별 막대그래프는 몇 행만 읽으면 됨
+# - 몇 번째 사본 행까지 반영했는지 기록해 두고, 사본과 어긋나면 사본 전체에서 다시 계산
+# 실행 예: python -m services.score_rollups --rebuild
+
+import argparse
+import sqlite3
+import threading
+
+import pandas as pd
+
+from services.cache_paths import get_cache_dir
+
+_ROLLUP_FILE = "score_rollups.sqlite3"
+_lock = threading.Lock()
+
+
+def _connect():
+    conn = sqlite3.connect(get_cache_dir() / _ROLLUP_FILE, timeout=10)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_rollups (
+            nickname TEXT NOT NULL,
+            day TEXT NOT NULL,
+            exam_type TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            sum REAL NOT NULL,
+            min REAL NOT NULL,
+            max REAL NOT NULL,
+            PRIMARY KEY (nickname, day, exam_type)
+        )
+    """)
+    conn.execute("CREATE TABLE IF NOT EXISTS rollup_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    return conn
+
+
+_UPSERT_SQL = """
+    INSERT INTO daily_rollups (nickname, day, exam_type, count, sum, min, max)
+    VALUES (?, ?, ?, 1, ?, ?, ?)
+    ON CONFLICT (nickname, day, exam_type) DO UPDATE SET
+        count = count + 1,
+        sum = sum + excluded.sum,
+        min = MIN(min, excluded.min),
+        max = MAX(max, excluded.max)
+"""
+
+
+def _to_params(nickname, exam_type, score, created_at):
+    score = float(score)
+    day = str(created_at)[:10] # "YYYY-MM-DD HH:MM:SS" -> "YYYY-MM-DD"
+    return (nickname, day, exam_type, score, score, score)
+
+
+def _rows_to_params(rows):
+    """점수를 숫자로 읽을 수 없는 행은 건너뜀"""
+    params = []
+    for created_at, nickname, exam_type, score in rows:
+        try:
+            params.append(_to_params(nickname, exam_type, score, created_at))
+        except (TypeError, ValueError):
+            continue
+    return params
+
+
+def _set_applied(conn, mirror_rows):
+    conn.execute(
+        "INSERT OR REPLACE INTO rollup_meta (key, value) VALUES ('mirror_rows', ?)", (mirror_rows,)
+    )
+
+
+def get_applied_mirror_rows():
+    """[기능] 롤업에 반영된 로컬 사본 행 수 (사본과 다르면 rebuild_rollups 필요)"""
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT value FROM rollup_meta WHERE key = 'mirror_rows'").fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else 0
+
+
+def append_rows(rows, mirror_rows):
+    """
+    [기능] 로컬 사본에 새로 들어온 행([날짜, 별명, 시험유형, 점수], ...)을 롤업에 더합니다.
+    mirror_rows: 추가 후 로컬 사본의 전체 행 수 (롤업이 어디까지 반영했는지 기록)
+    """
+    params = _rows_to_params(rows)
+    with _lock:
+        conn = _connect()
+        try:
+            conn.executemany(_UPSERT_SQL, params)
+            _set_applied(conn, mirror_rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def rebuild_rollups(rows):
+    """
+    [기능] 원본 기록 전체([날짜, 별명, 시험유형, 점수], ...)로 롤업을 처음부터 다시 계산합니다.
+    점수를 숫자로 읽을 수 없는 행은 건너뜁니다.
+    Returns: 반영한 행 수
+    """
+    params = _rows_to_params(rows)
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute("DELETE FROM daily_rollups")
+            conn.executemany(_UPSERT_SQL, params)
+            _set_applied(conn, len(rows))
+            conn.commit()
+        finally:
+            conn.close()
+    return len(params)
+
+
+def load_rollups(nickname, start_day=None, end_day=None):
+    """
+    [기능] 특정 별명의 일별 롤업 행을 DataFrame으로 돌려줍니다.
+    (컬럼: day, exam_type, count, sum, min, max)
+    """
+    query = "SELECT day, exam_type, count, sum, min, max FROM daily_rollups WHERE nickname = ?"
+    params = [nickname]
+    if start_day is not None:
+        query += " AND day >= ?"
+        params.append(start_day)
+    if end_day is not None:
+        query += " AND day <= ?"
+        params.append(end_day)
+
+    conn = _connect()
+    try:
+        rows = conn.execute(query + " ORDER BY day", params).fetchall()
+    finally:
+        conn.close()
+    return pd.DataFrame(rows, columns=["day", "exam_type", "count", "sum", "min", "max"])
+
+
+def summarize_rollups(rollups):
+    """
+    [기능] 롤업 행으로 대시보드 요약(총 횟수, 전체 평균, 유형별 평균)을 계산합니다.
+    Returns: dict(total, avg_score, by_type=DataFrame[시험유형, 점수])
+    """
+    total = int(rollups["count"].sum())
+    if total == 0:
+        return {"total": 0, "avg_score": 0.0, "by_type": pd.DataFrame(columns=["시험유형", "점수"])}
+
+    by_type = rollups.groupby("exam_type", sort=False)[["count", "sum"]].sum()
+    by_type_df = pd.DataFrame({"시험유형": by_type.index, "점수": by_type["sum"] / by_type["count"]}).reset_index(drop=True)
+    return {"total": total, "avg_score": rollups["sum"].sum() / total, "by_type": by_type_df}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="점수 롤업 테이블 관리")
+    parser.add_argument("--rebuild", action="store_true", help="로컬 사본(score_mirror) 전체로 롤업을 다시 계산")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        from services import score_mirror
+        n = rebuild_rollups(score_mirror.all_rows())
+        print(f"롤업 재계산 완료: 기록 {n}건 반영")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# 경로: services/score_store.py
+# [설명] 대시보드용 점수 기록 컬럼형 저장소 (Parquet, 월별 파티션)
+# - 로컬 사본(score_mirror)에 새로 들어온 행을 타입이 정해진 컬럼(시간/문자열/실수)으로 변환해 추가
+# - 조회는 별명/기간 조건을 Parquet 스캔에 바로 넘겨서(predicate pushdown) 필요한 파일/행만 읽음
+# - 요약 지표(횟수/평균/유형별 평균)는 Arrow 벡터 연산으로 계산
+# 폴더 구조: .cache/scores/month=2025-01/part-....parquet
+
+import json
+import shutil
+import threading
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from services.cache_paths import get_cache_dir
+
+SCHEMA = pa.schema([
+    ("created_at", pa.timestamp("s")),
+    ("nickname", pa.string()),
+    ("exam_type", pa.string()),
+    ("score", pa.float64()),
+    ("month", pa.string()),
+])
+
+HISTORY_COLUMNS = ["created_at", "nickname", "exam_type", "score"]
+
+# 한 달 파티션에 작은 파일이 이보다 많이 쌓이면 하나로 합침 (별명순 정렬 -> 행 그룹 통계로 건너뛰기 쉬움)
+COMPACT_FILE_COUNT = 32
+
+# 행 그룹 크기: 별명순으로 정렬된 파일에서 min/max 통계로 다른 별명의 행 그룹을 건너뛸 수 있을 만큼 작게
+ROW_GROUP_SIZE = 8 * 1024
+
+_META_FILE = "_meta.json"
+_lock = threading.Lock()
+
+
+def _store_dir():
+    return get_cache_dir("scores")
+
+
+def _read_meta(root):
+    try:
+        with open(root / _META_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"mirror_rows": 0}
+
+
+def _write_meta(root, meta):
+    with open(root / _META_FILE, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def rows_to_table(rows):
+    """
+    [기능] 시트 행([날짜, 별명, 시험유형, 점수] 문자열)을 타입이 정해진 Arrow 테이블로 바꿉니다.
+    날짜/점수를 해석할 수 없는 행은 버립니다.
+    """
+    df = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+    df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
+    df["score"] = pd.to_numeric(df["score"], errors="coerce")
+    df = df.dropna(subset=["created_at", "score"])
+    df["created_at"] = df["created_at"].astype("datetime64[s]")
+    df["nickname"] = df["nickname"].astype(str)
+    df["exam_type"] = df["exam_type"].astype(str)
+    df["month"] = df["created_at"].dt.strftime("%Y-%m")
+    return pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+
+
+def _write_table(root, table):
+    if table.num_rows == 0:
+        return
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive"),
+        basename_template=f"part-{int(time.time())}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=ROW_GROUP_SIZE,
+        min_rows_per_group=min(ROW_GROUP_SIZE, table.num_rows),
+    )
+
+
+def _compact_partitions(root, months):
+    for month in months:
+        part_dir = root / f"month={month}"
+        files = list(part_dir.glob("*.parquet"))
+        if len(files) <= COMPACT_FILE_COUNT:
+            continue
+        table = pq.read_table(files, schema=SCHEMA.remove(SCHEMA.get_field_index("month")))
+        table = table.sort_by([("nickname", "ascending"), ("created_at", "ascending")])
+        tmp_file = part_dir / f"compact-{uuid.uuid4().hex[:8]}.tmp"
+        pq.write_table(table, tmp_file, row_group_size=ROW_GROUP_SIZE)
+        for f in files:
+            f.unlink()
+        tmp_file.rename(part_dir / f"part-compact-{uuid.uuid4().hex[:8]}.parquet")
+
+
+def append_rows(rows, mirror_rows):
+    """
+    [기능] 로컬 사본에 새로 들어온 행을 저장소에 추가합니다.
+    mirror_rows: 추가 후 로컬 사본의 전체 행 수 (저장소가 어디까지 반영했는지 기록)
+    """
+    root = _store_dir()
+    with _lock:
+        table = rows_to_table(rows)
+        _write_table(root, table)
+        _compact_partitions(root, set(table.column("month").to_pylist()))
+        _write_meta(root, {"mirror_rows": mirror_rows})
+
+
+def get_applied_mirror_rows():
+    """[기능] 저장소에 반영된 로컬 사본 행 수 (사본과 다르면 rebuild_store 필요)"""
+    return _read_meta(_store_dir()).get("mirror_rows", 0)
+
+
+def rebuild_store(rows):
+    """[기능] 저장소를 비우고 주어진 전체 행으로 다시 만듭니다."""
+    root = _store_dir()
+    with _lock:
+        shutil.rmtree(root, ignore_errors=True)
+        root.mkdir(parents=True, exist_ok=True)
+        table = rows_to_table(rows).sort_by([("nickname", "ascending"), ("created_at", "ascending")])
+        _write_table(root, table)
+        _write_meta(root, {"mirror_rows": len(rows)})
+
+
+def empty_history():
+    """[기능] load_history와 같은 컬럼의 빈 테이블"""
+    return SCHEMA.empty_table().select(HISTORY_COLUMNS)
+
+
+def load_history(nickname, start=None, end=None):
+    """
+    [기능] 특정 별명의 기록을 시간순 Arrow 테이블로 돌려줍니다.
+    start/end(datetime)를 주면 해당 기간의 월 파티션만 읽습니다.
+    """
+    root = _store_dir()
+    if not any(root.glob("month=*")):
+        return empty_history()
+
+    dataset = ds.dataset(root, format="parquet", partitioning="hive", schema=SCHEMA)
+    condition = ds.field("nickname") == nickname
+    if start is not None:
+        condition &= ds.field("month") >= start.strftime("%Y-%m")
+        condition &= ds.field("created_at") >= pa.scalar(pd.Timestamp(start).to_pydatetime(), pa.timestamp("s"))
+    if end is not None:
+        condition &= ds.field("month") <= end.strftime("%Y-%m")
+        condition &= ds.field("created_at") <= pa.scalar(pd.Timestamp(end).to_pydatetime(), pa.timestamp("s"))
+
+    table = dataset.to_table(filter=condition, columns=HISTORY_COLUMNS)
+    return table.sort_by("created_at")
+
+
+def summarize(table):
+    """
+    [기능] 대시보드 요약 지표를 계산합니다. (table은 load_history 결과, 시간순)
+    Returns: dict(total, avg_score, last_exam, by_type=DataFrame[시험유형, 점수])
+    """
+    if table.num_rows == 0:
+        return {"total": 0, "avg_score": 0.0, "last_exam": "-", "by_type": pd.DataFrame(columns=["시험유형", "점수"])}
+
+    by_type = table.group_by("exam_type").aggregate([("score", "mean")])
+    by_type_df = by_type.to_pandas().rename(columns={"exam_type": "시험유형", "score_mean": "점수"})
+    return {
+        "total": table.num_rows,
+        "avg_score": pc.mean(table.column("score")).as_py(),
+        "last_exam": table.column("exam_type")[-1].as_py(),
+        "by_type": by_type_df,
+    }
+
+
+def to_display_df(table):
+    """[기능] Arrow 테이블을 기존 대시보드 컬럼명(날짜/별명/시험유형/점수)의 DataFrame으로 바꿉니다."""
+    df = table.to_pandas()
+    return df.rename(columns={"created_at": "날짜", "nickname": "별명", "exam_type": "시험유형", "score": "점수"})
@@ -0,0 +1,121 @@
+# 경로: services/shared_vocab.py
+# [설명] 프로세스 전체(모든 세션)가 함께 쓰는 파싱 완료 단어장 메모리 캐시
+# - 반 전체가 같은 학습지를 올리면 첫 학생만 분석하고, 나머지 세션은 같은 Arrow 테이블/원본 DataFrame을 참조만 함
+#   (세션마다 따로 갖는 것은 자기 편집본뿐: core/vocab_store.py VocabStore가 원본을 건드리지 않음)
+# - 키: services/vocab_cache.make_cache_key (파일 내용 해시 + 파서 버전)
+# - 메모리 상한을 넘으면 가장 오래 안 쓴 단어장부터 캐시에서 뺌 (LRU) -> 학생 수가 늘어도 서버 메모리는 일정
+# - 같은 단어장을 여러 세션이 동시에 올려도 분석은 한 번만 (키별 잠금, 나머지는 기다렸다가 결과를 받음)
+# - 적중/실패/제외 횟수를 모아 get_stats()로 확인
+
+import os
+import threading
+from collections import Counter, OrderedDict
+
+from core.vocab_store import to_arrow_table
+
+# 메모리 상한 (기본 256MB, 환경변수 VOCA_SHARED_VOCAB_MB로 조정)
+MAX_SHARED_BYTES = int(os.getenv("VOCA_SHARED_VOCAB_MB", "256")) * 1024 * 1024
+
+SOURCE_MEMORY = "memory"  # 다른 세션이 이미 올린 단어장
+SOURCE_LOADED = "loaded"  # 이번에 불러옴 (디스크 캐시 또는 새로 분석)
+
+
+class SharedVocab:
+    """
+    [기능] 캐시에 들어 있는 단어장 하나 (읽기 전용: 세션은 참조만 하고 고치지 않음)
+    - table: Arrow 테이블 (범주형 열은 dictionary 인코딩)
+    - df   : 표 편집기/시험에 넘길 원본 DataFrame
+    """
+    __slots__ = ("key", "table", "df", "nbytes")
+
+    def __init__(self, key, df):
+        self.key = key
+        self.table = to_arrow_table(df)
+        self.df = df
+        self.nbytes = self.table.nbytes + int(df.memory_usage(deep=True).sum())
+
+
+_lock = threading.Lock()
+_entries = OrderedDict()  # key -> SharedVocab (뒤쪽일수록 최근에 씀)
+_key_locks = {}           # key -> 분석 중 잠금 (같은 단어장을 동시에 분석하지 않도록)
+_total_bytes = 0
+_stats = Counter()        # hit / miss / evict
+
+
+def _get(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+        return entry
+
+
+def _put(entry):
+    """캐시에 넣고 상한을 넘으면 오래된 것부터 뺌 (방금 넣은 것은 상한보다 커도 유지)"""
+    global _total_bytes
+    with _lock:
+        old = _entries.pop(entry.key, None)
+        if old is not None:
+            _total_bytes -= old.nbytes
+        _entries[entry.key] = entry
+        _total_bytes += entry.nbytes
+        while _total_bytes > MAX_SHARED_BYTES and len(_entries) > 1:
+            _, evicted = _entries.popitem(last=False)
+            _total_bytes -= evicted.nbytes
+            _stats["evict"] += 1
+
+
+def get_or_load(key, loader):
+    """
+    [기능] 캐시에 있으면 그대로, 없으면 loader()로 단어장 DataFrame을 만들어 캐시에 넣고 돌려줍니다.
+    - loader는 같은 키에 대해 동시에 한 번만 실행됩니다. (다른 세션은 끝날 때까지 기다림)
+    - 돌려받은 DataFrame/테이블은 여러 세션이 같이 쓰므로 고치지 말 것 (편집은 VocabStore가 따로 보관)
+    Returns: (SharedVocab, SOURCE_MEMORY 또는 SOURCE_LOADED)
+    """
+    entry = _get(key)
+    if entry is not None:
+        _stats["hit"] += 1
+        return entry, SOURCE_MEMORY
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        entry = _get(key) # 기다리는 동안 다른 세션이 분석을 끝냈을 수 있음
+        if entry is not None:
+            _stats["hit"] += 1
+            return entry, SOURCE_MEMORY
+        _stats["miss"] += 1
+        try:
+            entry = SharedVocab(key, loader())
+            _put(entry)
+        finally:
+            with _lock:
+                _key_locks.pop(key, None)
+    return entry, SOURCE_LOADED
+
+
+def get_stats():
+    """
+    [기능] 캐시 상태 (관리/모니터링용)
+    Returns: {"entries", "bytes", "max_bytes", "hits", "misses", "evictions", "hit_rate"}
+    """
+    with _lock:
+        n_entries, total = len(_entries), _total_bytes
+    hits, misses = _stats["hit"], _stats["miss"]
+    return {
+        "entries": n_entries,
+        "bytes": total,
+        "max_bytes": MAX_SHARED_BYTES,
+        "hits": hits,
+        "misses": misses,
+        "evictions": _stats["evict"],
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+    }
+
+
+def clear():
+    """[기능] 캐시를 비웁니다. (세션이 이미 참조 중인 단어장은 그대로 유지됨)"""
+    global _total_bytes
+    with _lock:
+        _entries.clear()
+        _total_bytes = 0
@@ -0,0 +1,165 @@
+# 경로: services/srs_store.py
+# [설명] 단어 복습(간격 반복) 상태 저장소 + 사용자별 복습 대기열
+# - 카드 상태(별명 × 단어)는 로컬 SQLite 한 테이블에 저장 (WITHOUT ROWID -> 기본 키 순으로 촘촘하게 저장)
+# - 대기열(core/srs.py SrsQueue)은 (별명, 단어장)마다 처음 한 번만 만들고 프로세스에 보관
+#   -> 시험을 시작할 때마다 단어장 전체를 다시 읽거나 훑지 않고 O(k log n)에 k개를 꺼냄
+# - 단어장의 카드 목록/키(SrsDeck)는 화면에서 단어장 버전마다 한 번만 만들어 넘김 (make_deck, store.view)
+# - 채점 결과는 저장소와 대기열에 같이 반영
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from core.srs import CardState, SrsQueue, review
+from services.cache_paths import get_cache_dir
+
+_SRS_FILE = "srs_cards.sqlite3"
+
+# 프로세스에 보관할 대기열 수 (오래 안 쓴 것부터 정리)
+MAX_CACHED_QUEUES = 16
+
+_lock = threading.Lock()
+_queues = {}
+
+
+def _connect():
+    conn = sqlite3.connect(get_cache_dir() / _SRS_FILE, timeout=10)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS srs_cards (
+            nickname TEXT NOT NULL,
+            card_id TEXT NOT NULL,
+            reps INTEGER NOT NULL,
+            interval REAL NOT NULL,
+            ease REAL NOT NULL,
+            due REAL NOT NULL,
+            lapses INTEGER NOT NULL,
+            PRIMARY KEY (nickname, card_id)
+        ) WITHOUT ROWID
+    """)
+    return conn
+
+
+_UPSERT_SQL = """
+    INSERT INTO srs_cards (nickname, card_id, reps, interval, ease, due, lapses)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (nickname, card_id) DO UPDATE SET
+        reps = excluded.reps,
+        interval = excluded.interval,
+        ease = excluded.ease,
+        due = excluded.due,
+        lapses = excluded.lapses
+"""
+
+
+def load_due_times(nickname):
+    """[기능] 한 사용자의 {카드: 다음 복습 시각} (복습 기록이 있는 카드만)"""
+    conn = _connect()
+    try:
+        return dict(conn.execute("SELECT card_id, due FROM srs_cards WHERE nickname = ?", (nickname,)))
+    finally:
+        conn.close()
+
+
+def load_states(nickname, card_ids):
+    """[기능] 카드들의 현재 상태 {카드: CardState} (기록이 없는 카드는 빠짐)"""
+    card_ids = list(dict.fromkeys(card_ids))
+    if not card_ids:
+        return {}
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            f"SELECT card_id, reps, interval, ease, due, lapses FROM srs_cards "
+            f"WHERE nickname = ? AND card_id IN ({','.join('?' * len(card_ids))})",
+            [nickname, *card_ids],
+        ).fetchall()
+    finally:
+        conn.close()
+    return {row[0]: CardState(*row[1:]) for row in rows}
+
+
+# =============================================================================
+# [대기열] (별명, 단어장)별 복습 대기열
+# =============================================================================
+
+class SrsDeck(NamedTuple):
+    card_ids: list  # 단어장 순서의 카드 키(한자)
+    key: str        # 카드 집합의 해시 (순서 무관)
+
+
+def make_deck(vocab_df):
+    """
+    [기능] 단어장 DataFrame으로 복습 카드 목록과 키를 만듭니다. (카드 키 = 앞뒤 공백을 뺀 한자)
+    단어 수만큼 걸리므로 단어장 버전마다 한 번만 만들어 재사용 (예: store.view("srs_deck", ...))
+    """
+    card_ids = vocab_df['zh'].astype(str).str.strip().tolist()
+    payload = "\n".join(sorted(set(card_ids)))
+    return SrsDeck(card_ids, hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16])
+
+
+def get_queue(nickname, deck):
+    """
+    [기능] 사용자의 이 단어장(SrsDeck) 복습 대기열을 돌려줍니다. (처음 한 번만 저장소에서 읽어 만듦)
+    """
+    key = (nickname, deck.key)
+    with _lock:
+        queue = _queues.pop(key, None)
+        if queue is not None:
+            _queues[key] = queue # 최근에 쓴 것으로 순서 갱신
+            return queue
+
+    queue = SrsQueue(deck.card_ids, load_due_times(nickname))
+    with _lock:
+        queue = _queues.setdefault(key, queue)
+        while len(_queues) > MAX_CACHED_QUEUES:
+            _queues.pop(next(iter(_queues)))
+    return queue
+
+
+def count_due(nickname, deck, now=None):
+    """[기능] 지금 복습할 카드 수 (대기열의 카운터를 읽음)"""
+    now = time.time() if now is None else now
+    queue = get_queue(nickname, deck)
+    with _lock:
+        return queue.count_due(now)
+
+
+def draw_cards(nickname, deck, k, now=None):
+    """
+    [기능] 다음 시험에 낼 카드 k개를 고릅니다. (복습할 카드 -> 처음 보는 카드 -> 곧 복습할 카드 순)
+    Returns: (카드 리스트, 복습할 카드 수, 처음 보는 카드 수)
+    """
+    now = time.time() if now is None else now
+    queue = get_queue(nickname, deck)
+    with _lock:
+        return queue.next_cards(k, now)
+
+
+def record_reviews(nickname, grades, now=None):
+    """
+    [기능] 채점 결과 {카드: 품질 점수(0~5)}를 카드 상태에 반영하고 저장합니다.
+    같은 사용자의 보관 중인 대기열에도 바로 반영됩니다.
+    Returns: {카드: 새 CardState}
+    """
+    if not grades:
+        return {}
+    now = time.time() if now is None else now
+    old_states = load_states(nickname, grades)
+    new_states = {card_id: review(old_states.get(card_id), grade, now) for card_id, grade in grades.items()}
+
+    conn = _connect()
+    try:
+        conn.executemany(_UPSERT_SQL, [(nickname, card_id, *state) for card_id, state in new_states.items()])
+        conn.commit()
+    finally:
+        conn.close()
+
+    with _lock:
+        for (queue_nickname, _), queue in _queues.items():
+            if queue_nickname != nickname:
+                continue
+            for card_id, state in new_states.items():
+                if queue.contains(card_id):
+                    queue.update(card_id, state.due)
+    return new_states
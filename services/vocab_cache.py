@@ -0,0 +1,114 @@
+# 경로: services/vocab_cache.py
+# [설명] 업로드 파일 내용(해시) 기반 영구 캐시
+# - 같은 교재 PDF라면 파일명이 달라도, 다른 학생이 올려도 추출/파싱/LLM 보정을 다시 하지 않음
+# - 키: sha256(파일 바이트) + 파서 버전
+# - 저장: 키별 폴더에 text.parquet(추출 원문) / vocab.parquet(최종 보정된 단어표)
+#   (보정하지 못한 행(flags != 'OK')도 그대로 저장 -> 불러온 쪽(features/vocab_upload.py)이 그 행만 다시 보정)
+# - 용량 상한을 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+
+from core.vocab_parser import PARSER_VERSION
+from services.cache_paths import get_cache_dir
+
+# 캐시 전체 용량 상한 (기본 512MB, 환경변수 VOCA_VOCAB_CACHE_MB로 조정)
+MAX_CACHE_BYTES = int(os.getenv("VOCA_VOCAB_CACHE_MB", "512")) * 1024 * 1024
+
+_INDEX_FILE = "index.json"
+_lock = threading.Lock() # Streamlit은 세션마다 스레드가 다르므로 인덱스 갱신은 잠금 후 처리
+
+
+def make_cache_key(file_bytes):
+    """
+    [기능] 파일 바이트 + 파서 버전으로 캐시 키(16진수 문자열)를 만듭니다.
+    """
+    h = hashlib.sha256()
+    h.update(f"parser-v{PARSER_VERSION}:".encode("utf-8"))
+    h.update(file_bytes)
+    return h.hexdigest()
+
+
+def _cache_root():
+    return get_cache_dir("vocab")
+
+
+def _read_index(root):
+    try:
+        with open(root / _INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_index(root, index):
+    # 쓰는 도중 죽어도 인덱스가 깨지지 않도록 임시 파일에 쓰고 교체
+    tmp_path = root / (_INDEX_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, root / _INDEX_FILE)
+
+
+def _evict_if_needed(root, index):
+    """
+    총 용량이 상한을 넘으면 last_access가 가장 오래된 항목부터 지웁니다.
+    """
+    total = sum(entry["size"] for entry in index.values())
+    for key in sorted(index, key=lambda k: index[k]["last_access"]):
+        if total <= MAX_CACHE_BYTES:
+            break
+        total -= index[key]["size"]
+        shutil.rmtree(root / key, ignore_errors=True)
+        del index[key]
+
+
+def load_cached(key):
+    """
+    [기능] 캐시에 있으면 (추출 텍스트, 단어표 DataFrame)을, 없으면 None을 돌려줍니다.
+    """
+    root = _cache_root()
+    entry_dir = root / key
+    try:
+        text_df = pd.read_parquet(entry_dir / "text.parquet")
+        vocab_df = pd.read_parquet(entry_dir / "vocab.parquet")
+    except Exception:
+        return None
+
+    with _lock:
+        index = _read_index(root)
+        if key in index:
+            index[key]["last_access"] = time.time()
+            _write_index(root, index)
+
+    text = text_df["text"].iloc[0] if not text_df.empty else ""
+    return text, vocab_df
+
+
+def save_to_cache(key, text, vocab_df):
+    """
+    [기능] 추출 텍스트와 최종 단어표를 캐시에 저장하고, 필요하면 오래된 항목을 정리합니다.
+    """
+    root = _cache_root()
+    entry_dir = root / key
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({"text": [text]}).to_parquet(entry_dir / "text.parquet", index=False)
+        vocab_df.reset_index(drop=True).to_parquet(entry_dir / "vocab.parquet", index=False)
+    except Exception as e:
+        print(f"단어장 캐시 저장 실패: {e}")
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        return False
+
+    size = sum(p.stat().st_size for p in entry_dir.iterdir())
+    with _lock:
+        index = _read_index(root)
+        index[key] = {"size": size, "last_access": time.time()}
+        _evict_if_needed(root, index)
+        _write_index(root, index)
+    return True
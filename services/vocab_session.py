@@ -0,0 +1,47 @@
+# 경로: services/vocab_session.py
+# [설명] 세션마다 단어장 저장소(core/vocab_store.py VocabStore) 하나를 st.session_state에 보관
+# - 모든 페이지(단어시험/어순/작문/사전)가 같은 저장소를 보고, 파생 데이터는 저장소 버전별로 재사용
+# - 예전 session_state['final_vocab_df'] 자리를 대신함
+
+import uuid
+
+import streamlit as st
+
+from core.vocab_store import VocabStore
+
+STORE_KEY = "vocab_store"
+TOKEN_KEY = "session_token"
+
+
+def get_session_token():
+    """[기능] 이 세션을 구분하는 토큰 (프로세스 공유 자원에서 세션별 참조를 셀 때 사용)"""
+    if TOKEN_KEY not in st.session_state:
+        st.session_state[TOKEN_KEY] = uuid.uuid4().hex
+    return st.session_state[TOKEN_KEY]
+
+
+def get_vocab_store():
+    """[기능] 현재 세션의 단어장 저장소 (업로드 전이면 None)"""
+    return st.session_state.get(STORE_KEY)
+
+
+def set_vocab(df):
+    """[기능] 새 단어장으로 저장소를 만들어 세션에 보관합니다."""
+    store = VocabStore(df)
+    st.session_state[STORE_KEY] = store
+    return store
+
+
+def use_shared_vocab(shared):
+    """
+    [기능] 공유 캐시의 단어장(services/shared_vocab.py SharedVocab)을 참조하는 저장소를 세션에 보관합니다.
+    (원본은 복사하지 않고, 이 세션의 편집본만 따로 생김)
+    """
+    store = VocabStore(base_table=shared.table, base_df=shared.df)
+    st.session_state[STORE_KEY] = store
+    return store
+
+
+def clear_vocab():
+    """[기능] 세션의 단어장을 지웁니다."""
+    st.session_state.pop(STORE_KEY, None)